@@ -1,7 +1,8 @@
+import time
+_STARTUP_T0 = time.perf_counter()  # --profile-startup measures every phase from here
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
-from ttkbootstrap import Style, Button as TBButton
 import os
 import csv
 from pathlib import Path
@@ -12,25 +13,16 @@ import json  # To load profile JSON data
 import re  # To sanitize profile names
 import shutil  # To move files
 from datetime import datetime  # To generate timestamp folders
-import time
-import webbrowser  # Open support link in default browser
-from send2trash import send2trash
-
-# HEIC support
-try:
-    from pillow_heif import register_heif_opener
-    register_heif_opener()
-    HEIC_SUPPORTED = True
-except ImportError:
-    HEIC_SUPPORTED = False
+import threading  # Background imports
+import queue  # Worker -> Tk thread hand-off
+import logging  # Diagnostics and --trace spans (see LOGGING & TRACING)
+import atexit
+import contextlib
+import functools
 
-# Drag-and-drop support
-try:
-    from tkinterdnd2 import DND_FILES, TkinterDnD
-except ImportError:
-    # Fallback if tkinterdnd2 isn't installed
-    TkinterDnD = tk.Tk
-    DND_FILES = None
+# ttkbootstrap (theme), tkinterdnd2 (drag-and-drop), send2trash and webbrowser are
+# imported on first use rather than here, see STARTUP PROFILE & LAZY IMPORTS below.
+# pillow_heif (HEIC support) is likewise registered on first use by profile_editor.py.
 
 
 #Image Splitter Pro
@@ -63,14 +55,417 @@ CONFIG_FOLDER = os.path.join(_base_dir, 'config')
 CONFIG_FILE = os.path.join(CONFIG_FOLDER, 'config.csv')
 
 
+# ====================== LOGGING & TRACING (outside the class) ======================
+
+# Diagnostics go through `logging`: the 'image_wizard' logger here and its child
+# 'image_wizard.cropping_gui2' in the profile editor. By default only warnings and
+# errors reach the console. Command-line options (see _configure_logging):
+#   --log-level debug|info|warning|error   console verbosity (default: warning)
+#   --trace FILE                           record spans (startup phases, preview loads,
+#                                          crop/move runs) and save them to FILE on exit as
+#                                          Chrome trace JSON (chrome://tracing, ui.perfetto.dev)
+# Times are monotonic (perf_counter) seconds since main.py started.
+log = logging.getLogger('image_wizard')
+DEFAULT_LOG_LEVEL = 'warning'
+LOG_FORMAT = '%(mono)9.3f %(levelname)-7s [%(name)s] %(message)s'
+
+# Result keys copied into a _traced run's span
+_SPAN_RESULT_KEYS = ('status', 'processed', 'moved', 'deleted', 'sets', 'source', 'output')
+
+
+def _log_span(logger, name: str, start: float, end: float, args: dict | None = None):
+    """Log a finished span (perf_counter start/end) at DEBUG; the --trace handler
+    turns it into a trace event."""
+    logger.debug('%s took %.1f ms', name, (end - start) * 1000, extra={'span': (name, start, end, args or {})})
+
+
+class _Span:
+    """Context manager timing a block as a span (see _span)."""
+    __slots__ = ('logger', 'name', 'args', 'start')
+
+    def __init__(self, logger, name: str, args: dict):
+        self.logger = logger
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None:
+            self.args['error'] = repr(exc)
+        _log_span(self.logger, self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+
+_NO_SPAN = contextlib.nullcontext()
+
+
+def _span(name: str, **args):
+    """`with _span('name', key=value):` times the block. With DEBUG logging and --trace
+    both off this is a single isEnabledFor check returning a shared no-op context."""
+    if not log.isEnabledFor(logging.DEBUG):
+        return _NO_SPAN
+    return _Span(log, name, args)
+
+
+def _traced(name: str):
+    """Decorator: run the function as a span named `name`. When it returns a result
+    dict, its status and counts (_SPAN_RESULT_KEYS) are added to the span."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not log.isEnabledFor(logging.DEBUG):
+                return fn(*args, **kwargs)
+            with _Span(log, name, {}) as span:
+                result = fn(*args, **kwargs)
+                if isinstance(result, dict):
+                    span.args.update((k, result[k]) for k in _SPAN_RESULT_KEYS if k in result)
+                return result
+        return wrapper
+    return decorate
+
+
+class _MonotonicFilter(logging.Filter):
+    """Stamps records with `mono`, the monotonic seconds since main.py started."""
+
+    def filter(self, record):
+        record.mono = time.perf_counter() - _STARTUP_T0
+        return True
+
+
+class _TraceHandler(logging.Handler):
+    """Collects log records for --trace as Chrome trace events: spans become complete
+    ('X') events, any other record an instant ('i') event. write() saves the file."""
+
+    def __init__(self, path: str):
+        super().__init__(logging.DEBUG)
+        self.path = path
+        self.pid = os.getpid()
+        self.events: list[dict] = []
+        self.threads: dict[int, str] = {}
+
+    def emit(self, record):
+        self.threads[record.thread] = record.threadName
+        span = getattr(record, 'span', None)
+        if span is not None:
+            name, start, end, args = span
+            self.events.append({'name': name, 'cat': record.name, 'ph': 'X', 'pid': self.pid, 'tid': record.thread,
+                                'ts': round((start - _STARTUP_T0) * 1e6, 1), 'dur': round((end - start) * 1e6, 1),
+                                'args': args})
+        else:
+            self.events.append({'name': record.getMessage(), 'cat': record.name, 'ph': 'i', 's': 't',
+                                'pid': self.pid, 'tid': record.thread,
+                                'ts': round((time.perf_counter() - _STARTUP_T0) * 1e6, 1),
+                                'args': {'level': record.levelname}})
+
+    def write(self):
+        """Write the collected events to `path` (atomically, like every other output)."""
+        self.acquire()
+        try:
+            events = list(self.events)
+            threads = dict(self.threads)
+        finally:
+            self.release()
+        events.extend({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': tname}}
+                      for tid, tname in threads.items())
+        tmp_path = _temp_output_path(self.path)
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, default=str)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            log.error("could not write trace %s: %s", self.path, e)
+
+
+_trace_handler: _TraceHandler | None = None
+
+
+def _configure_logging(argv: list[str]) -> list[str]:
+    """Set up the console and --trace handlers from --log-level/--trace in `argv`, note
+    --profile-startup, and return the remaining arguments, so the positional checks in
+    __main__ still work."""
+    global _trace_handler, PROFILE_STARTUP
+    rest = []
+    level_name = DEFAULT_LOG_LEVEL
+    trace_path = None
+    args = iter(argv)
+    for arg in args:
+        if arg == '--log-level':
+            level_name = next(args, level_name)
+        elif arg.startswith('--log-level='):
+            level_name = arg.split('=', 1)[1]
+        elif arg == '--trace':
+            trace_path = next(args, None)
+        elif arg.startswith('--trace='):
+            trace_path = arg.split('=', 1)[1]
+        elif arg == '--profile-startup':
+            PROFILE_STARTUP = True
+        else:
+            rest.append(arg)
+    level = logging.getLevelName(str(level_name).upper())
+    if not isinstance(level, int):
+        level = logging.WARNING
+
+    log.propagate = False
+    if sys.stderr is not None:
+        console = logging.StreamHandler()
+        console.setLevel(level)
+        console.addFilter(_MonotonicFilter())
+        console.setFormatter(logging.Formatter(LOG_FORMAT))
+        log.addHandler(console)
+    else:
+        # windowed builds have no console
+        log.addHandler(logging.NullHandler())
+    if trace_path:
+        _trace_handler = _TraceHandler(os.path.abspath(trace_path))
+        log.addHandler(_trace_handler)
+        atexit.register(_trace_handler.write)
+    log.setLevel(logging.DEBUG if trace_path else level)
+    return rest
+
+
+# ====================== STARTUP PROFILE & LAZY IMPORTS (outside the class) ======================
+
+# `--profile-startup` prints how long the imports and each phase of building the main window took
+# (set by _configure_logging, which also removes the flag from the arguments)
+PROFILE_STARTUP = False
+
+
+class _StartupProfile:
+    """Named startup phases, timed from _STARTUP_T0. Recording a mark is one perf_counter
+    call, so marks are always taken. They are printed with --profile-startup and logged
+    as 'startup: <phase>' spans (for --trace) once the first paint has happened, since
+    most of them are recorded before logging is configured."""
+
+    def __init__(self):
+        self.marks = [('imports', time.perf_counter())]
+        self.lazy_imports: list[tuple[str, float, float]] = []
+        self.reported = False
+        self.last = _STARTUP_T0
+
+    def mark(self, label: str):
+        now = time.perf_counter()
+        if not self.reported:
+            self.marks.append((label, now))
+            return
+        # work deferred past the first paint is reported as it finishes
+        _log_span(log, f'startup: {label}', self.last, now)
+        self.last = now
+        if PROFILE_STARTUP:
+            print(f"[image_wizard] startup: {label} done at {(now - _STARTUP_T0) * 1000:.1f} ms")
+
+    def lazy_import(self, name: str, started: float, ended: float):
+        if not self.reported:
+            self.lazy_imports.append((name, started, ended))
+            return
+        _log_span(log, f'import {name}', started, ended)
+        if PROFILE_STARTUP:
+            print(f"[image_wizard] startup: imported {name} on first use ({(ended - started) * 1000:.1f} ms)")
+
+    def report(self):
+        """Log the phases recorded so far as spans and, with --profile-startup, print them (once)."""
+        if self.reported:
+            return
+        self.reported = True
+        previous = _STARTUP_T0
+        for label, t in self.marks:
+            _log_span(log, f'startup: {label}', previous, t)
+            previous = t
+        self.last = previous
+        for name, started, ended in self.lazy_imports:
+            _log_span(log, f'import {name}', started, ended)
+        if not PROFILE_STARTUP:
+            return
+        print("[image_wizard] startup profile (ms since main.py started):")
+        previous = _STARTUP_T0
+        for label, t in self.marks:
+            print(f"  {label:<28}{(t - _STARTUP_T0) * 1000:9.1f}   (+{(t - previous) * 1000:.1f})")
+            previous = t
+        for name, started, ended in self.lazy_imports:
+            print(f"  of which import {name:<16}{(ended - started) * 1000:9.1f}")
+
+
+_startup_profile = _StartupProfile()
+
+_lazy_modules: dict = {}
+
+
+def _import_optional(name: str):
+    # Plain import statements rather than importlib so PyInstaller still finds and bundles them
+    if name == 'ttkbootstrap':
+        import ttkbootstrap as mod
+    elif name == 'tkinterdnd2':
+        import tkinterdnd2 as mod
+    elif name == 'send2trash':
+        import send2trash as mod
+    elif name == 'webbrowser':
+        import webbrowser as mod
+    else:
+        raise ImportError(f"no lazy import for {name}")
+    return mod
+
+
+def _lazy_import(name: str):
+    """Import the optional module `name` the first time it's needed and return it, or
+    None when it isn't installed. The import time is recorded for --profile-startup."""
+    try:
+        return _lazy_modules[name]
+    except KeyError:
+        pass
+    started = time.perf_counter()
+    try:
+        mod = _import_optional(name)
+    except Exception as e:
+        log.warning("optional module %s unavailable: %s", name, e)
+        mod = None
+    _lazy_modules[name] = mod
+    _startup_profile.lazy_import(name, started, time.perf_counter())
+    return mod
+
+
+# ====================== PROFILE EDITOR MODULE (outside the class) ======================
+
+def _profile_editor_path() -> str:
+    """Location of profile_editor.py: bundled in sys._MEIPASS when frozen, else next to this file."""
+    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, 'profile_editor.py')
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'profile_editor.py')
+
+
+def _profile_editor_module():
+    """Import profile_editor.py once (it ships as a file next to this one, not as a
+    package module) and return it. Besides the editor window it owns the image helpers
+    both modules use (EXIF orientation, HEIF registration, the shared thumbnail cache),
+    so this app can't run without it; raises ImportError if it can't be loaded."""
+    mod = sys.modules.get('profile_editor')
+    if mod is None:
+        try:
+            import importlib.util
+            spec = importlib.util.spec_from_file_location('profile_editor', _profile_editor_path())
+            mod = importlib.util.module_from_spec(spec)
+            sys.modules['profile_editor'] = mod
+            spec.loader.exec_module(mod)
+        except Exception as e:
+            sys.modules.pop('profile_editor', None)
+            raise ImportError(f"could not load the profile editor module: {e}") from e
+    return mod
+
+
+# Defined once in profile_editor.py (which must also run on its own) and shared here.
+# pillow_heif is only imported by _ensure_heif_opener there, so PyInstaller builds
+# list it as a hidden import.
+_editor = _profile_editor_module()
+_ORIENTATION_TRANSPOSE = _editor._ORIENTATION_TRANSPOSE
+_image_orientation = _editor._image_orientation
+_ensure_heif_opener = _editor._ensure_heif_opener
+
+
+def _open_url(url: str):
+    """Open `url` in the default browser (webbrowser is imported on first use)."""
+    browser = _lazy_import('webbrowser')
+    if browser is not None:
+        try:
+            browser.open(url)
+        except Exception:
+            pass
+
+
+def _bootstyle_button(parent, bootstyle: str, **kwargs):
+    """ttkbootstrap Button with `bootstyle`, or a plain ttk.Button without ttkbootstrap."""
+    tb = _lazy_import('ttkbootstrap')
+    if tb is not None:
+        return tb.Button(parent, bootstyle=bootstyle, **kwargs)
+    return ttk.Button(parent, **kwargs)
+
+
 # Lightweight fallback label object with a no-op config method to avoid AttributeError
 class _NullLabel:
     def config(self, *args, **kwargs):
         return None
 
 
+# Metadata policies a profile can choose for its outputs (profile key 'metadata_policy').
+# - strip: re-encode without any metadata (historical behavior, the default)
+# - icc: keep the source ICC color profile so wide-gamut (e.g. Display-P3) sources keep their colors
+# - icc_orientation_copyright: keep the ICC profile plus the EXIF Orientation and Copyright tags
+METADATA_POLICIES = ('strip', 'icc', 'icc_orientation_copyright')
+DEFAULT_METADATA_POLICY = 'strip'
+_EXIF_ORIENTATION_TAG = 0x0112
+_EXIF_COPYRIGHT_TAG = 0x8298
+
+
+def _extract_source_metadata(img: Image.Image, policy: str) -> dict:
+    """Collect the metadata `policy` wants carried over to the outputs of `img`.
+    Only header data is read (the ICC bytes and the EXIF IFD), so no pixels are decoded.
+    Returns a dict with optional 'icc_profile' and 'exif' (bytes) entries; empty for 'strip'.
+    """
+    metadata = {}
+    if policy not in ('icc', 'icc_orientation_copyright'):
+        return metadata
+    try:
+        icc = img.info.get('icc_profile')
+        if icc:
+            metadata['icc_profile'] = icc
+    except Exception:
+        pass
+    if policy == 'icc_orientation_copyright':
+        try:
+            src_exif = img.getexif()
+            kept = Image.Exif()
+            for tag in (_EXIF_ORIENTATION_TAG, _EXIF_COPYRIGHT_TAG):
+                value = src_exif.get(tag)
+                if value is not None:
+                    kept[tag] = value
+            # Outputs are written upright (see _crop_oriented), so the kept
+            # orientation must say so or viewers would rotate them again.
+            if _EXIF_ORIENTATION_TAG in kept:
+                kept[_EXIF_ORIENTATION_TAG] = 1
+            if len(kept):
+                metadata['exif'] = kept.tobytes()
+        except Exception:
+            pass
+    return metadata
+
+
+def _oriented_size(raw_size: tuple[int, int], orientation: int) -> tuple[int, int]:
+    """Size of the image as displayed upright (width/height swap for orientations 5-8)."""
+    w, h = raw_size
+    return (h, w) if orientation in (5, 6, 7, 8) else (w, h)
+
+
+def _map_box_to_raw(box: tuple[int, int, int, int], raw_size: tuple[int, int], orientation: int) -> tuple[int, int, int, int]:
+    """Map a crop box given in upright (displayed) pixel space to the stored pixel space.
+    Cropping the mapped box and transposing only the crop gives the same pixels as
+    transposing the whole source first, without the full-image transpose.
+    """
+    W, H = raw_size
+    to_raw = {
+        1: lambda u, v: (u, v),
+        2: lambda u, v: (W - u, v),
+        3: lambda u, v: (W - u, H - v),
+        4: lambda u, v: (u, H - v),
+        5: lambda u, v: (v, u),
+        6: lambda u, v: (v, H - u),
+        7: lambda u, v: (W - v, H - u),
+        8: lambda u, v: (W - v, u),
+    }.get(orientation, lambda u, v: (u, v))
+    ax, ay = to_raw(box[0], box[1])
+    bx, by = to_raw(box[2], box[3])
+    return (min(ax, bx), min(ay, by), max(ax, bx), max(ay, by))
+
+
+def _crop_oriented(img: Image.Image, box: tuple[int, int, int, int], orientation: int) -> Image.Image:
+    """Crop `box` (upright space) from `img` (stored pixels) and return the crop upright."""
+    cropped = img.crop(_map_box_to_raw(box, img.size, orientation))
+    transpose = _ORIENTATION_TRANSPOSE.get(orientation)
+    return cropped.transpose(transpose) if transpose is not None else cropped
+
+
 # Helper: centralized saving with desired defaults
-def _save_image_preset(img: Image.Image, out_path: str, quality: int = 95):
+def _save_image_preset(img: Image.Image, out_path: str, quality: int = 95, metadata: dict | None = None):
     """Save an Image with sane defaults per format.
     - JPEG/JPG: save as JPEG, convert to RGB if needed, quality and no subsampling.
     - WEBP: save with quality.
@@ -78,6 +473,11 @@ def _save_image_preset(img: Image.Image, out_path: str, quality: int = 95):
     - HEIC/HEIF: convert to JPEG.
     - Otherwise: fallback to Image.save.
     This ensures we use quality=95 by default instead of Pillow's implicit defaults.
+    `metadata` (see _extract_source_metadata) is reattached to JPEG/WEBP/PNG outputs;
+    without it outputs carry no metadata.
+    The image is written to a hidden temp file next to `out_path` and os.replace'd into
+    place, so an interrupted save never leaves a truncated file under the output name.
+    Returns the final path written (HEIC/HEIF become .jpg), or None if saving failed.
     """
     ext = os.path.splitext(out_path)[1].lower()
     fmt = None
@@ -92,6 +492,17 @@ def _save_image_preset(img: Image.Image, out_path: str, quality: int = 95):
         fmt = 'JPEG'
         out_path = os.path.splitext(out_path)[0] + '.jpg'
 
+    # Always pass icc_profile explicitly: PNG/WEBP would otherwise copy img.info's profile
+    # even when the policy strips it. EXIF is only passed when there is something to keep.
+    meta_kwargs = {'icc_profile': (metadata or {}).get('icc_profile') or None}
+    if (metadata or {}).get('exif'):
+        meta_kwargs['exif'] = metadata['exif']
+
+    # The temp name has no image extension, so Pillow needs the format spelled out
+    if fmt is None:
+        fmt = Image.registered_extensions().get(ext)
+    tmp_path = _temp_output_path(out_path)
+
     try:
         img_to_save = img
         if fmt == 'JPEG':
@@ -101,24 +512,2157 @@ def _save_image_preset(img: Image.Image, out_path: str, quality: int = 95):
                     img_to_save = img.convert('RGB')
                 except Exception:
                     img_to_save = img
-            img_to_save.save(out_path, format='JPEG', quality=quality, subsampling=0, optimize=True)
+            img_to_save.save(tmp_path, format='JPEG', quality=quality, subsampling=0, optimize=True, **meta_kwargs)
         elif fmt == 'WEBP':
-            img_to_save.save(out_path, format='WEBP', quality=quality)
+            img_to_save.save(tmp_path, format='WEBP', quality=quality, **meta_kwargs)
         elif fmt == 'PNG':
-            img_to_save.save(out_path, format='PNG', optimize=True)
+            img_to_save.save(tmp_path, format='PNG', optimize=True, **meta_kwargs)
         else:
-            img_to_save.save(out_path)
+            img_to_save.save(tmp_path, format=fmt)
+        os.replace(tmp_path, out_path)
+        return out_path
     except Exception:
         # best-effort fallback
         try:
-            img.save(out_path)
+            img.save(tmp_path, format=fmt)
+            os.replace(tmp_path, out_path)
+            return out_path
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except Exception:
+                pass
+    return None
+
+
+def _temp_output_path(final_path: str) -> str:
+    """Hidden temp name in the same folder as `final_path` (so os.replace stays a rename).
+    The '.tmp' extension keeps half-written files out of every image/output-prefix filter.
+    """
+    folder, name = os.path.split(final_path)
+    return os.path.join(folder, f".{name}.{os.getpid()}.tmp")
+
+
+def _atomic_copy(src: str, dst: str):
+    """shutil.copy2 via a temp file + os.replace so `dst` is either complete or absent."""
+    tmp_path = _temp_output_path(dst)
+    try:
+        shutil.copy2(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except Exception:
+            pass
+        raise
+
+
+# ====================== TRASH SUBSYSTEM (outside the class) ======================
+
+# Outcomes reported per path by _trash_files
+TRASH_TRASHED = 'trashed'   # moved to the OS trash
+TRASH_DELETED = 'deleted'   # trash unavailable; removed permanently
+TRASH_MISSING = 'missing'   # file was already gone
+TRASH_FAILED = 'failed'     # could be neither trashed nor removed
+
+# Upper bound on concurrent per-file trash calls (Linux/freedesktop backend)
+TRASH_WORKERS = 4
+
+
+def _trash_one(path: str) -> str:
+    """Trash a single file, falling back to a permanent delete. Returns a TRASH_* outcome."""
+    try:
+        trash = _lazy_import('send2trash')
+        if trash is None:
+            raise OSError('send2trash is not installed')
+        trash.send2trash(path)
+        return TRASH_TRASHED
+    except Exception:
+        try:
+            os.remove(path)
+            return TRASH_DELETED
+        except FileNotFoundError:
+            return TRASH_MISSING
+        except Exception:
+            return TRASH_FAILED
+
+
+def _trash_files(paths, journal=None) -> dict[str, str]:
+    """Send a batch of files to the OS trash and return {abspath: outcome} in input order.
+
+    On macOS and Windows send2trash accepts the whole list and performs it as one
+    native operation (NSFileManager / IFileOperation), so the batch is handed over in
+    a single call. The freedesktop backend used on Linux writes a .trashinfo and
+    renames per file, so there the files are spread over a small thread pool.
+    Anything the batch call could not handle is retried per file.
+    With a _RunJournal the planned batch is synced before anything is trashed and
+    the outcomes are recorded afterwards.
+    """
+    outcomes = _trash_batch(paths, journal)
+    if journal is not None:
+        for ap, outcome in outcomes.items():
+            if outcome != TRASH_MISSING:
+                journal.done('trash', src=ap, outcome=outcome)
+        journal.checkpoint()
+    return outcomes
+
+
+def _trash_batch(paths, journal=None) -> dict[str, str]:
+    """Worker for _trash_files (without the outcome journaling)."""
+    outcomes: dict[str, str] = {}
+    pending = []
+    for p in paths:
+        ap = os.path.abspath(p)
+        if ap in outcomes:
+            continue
+        if os.path.isfile(ap):
+            outcomes[ap] = TRASH_FAILED
+            pending.append(ap)
+        else:
+            outcomes[ap] = TRASH_MISSING
+    if not pending:
+        return outcomes
+    if journal is not None:
+        for ap in pending:
+            journal.plan('trash', src=ap)
+        journal.checkpoint()
+
+    trash = _lazy_import('send2trash')
+    if trash is not None and sys.platform in ('darwin', 'win32') and len(pending) > 1:
+        try:
+            trash.send2trash(pending)
+            for ap in pending:
+                outcomes[ap] = TRASH_TRASHED
+            return outcomes
+        except Exception:
+            # The batch may have stopped partway: files already gone were trashed by it.
+            # Fall through to per-file handling for the rest so one bad file doesn't fail them all.
+            remaining = []
+            for ap in pending:
+                if os.path.isfile(ap):
+                    remaining.append(ap)
+                else:
+                    outcomes[ap] = TRASH_TRASHED
+            pending = remaining
+            if not pending:
+                return outcomes
+
+    if len(pending) == 1:
+        outcomes[pending[0]] = _trash_one(pending[0])
+        return outcomes
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(TRASH_WORKERS, len(pending))) as pool:
+        for ap, outcome in zip(pending, pool.map(_trash_one, pending)):
+            outcomes[ap] = outcome
+    return outcomes
+
+
+def _count_removed(outcomes: dict[str, str]) -> int:
+    """Number of files a _trash_files batch actually got rid of (trashed or deleted)."""
+    return sum(1 for o in outcomes.values() if o in (TRASH_TRASHED, TRASH_DELETED))
+
+
+def _archive_originals(original_paths: list[str], archive_folder: str, journal=None) -> list[str]:
+    """Move each original into `archive_folder` (see _move_files). Returns the new paths of moved files."""
+    if not original_paths:
+        return []
+    pairs = [(src, os.path.join(archive_folder, os.path.basename(src))) for src in original_paths]
+    moved, _failed = _move_files(pairs, same_fs=_same_filesystem(os.path.dirname(original_paths[0]), archive_folder), journal=journal)
+    return moved
+
+
+# ====================== MOVE SUBSYSTEM (outside the class) ======================
+
+# Upper bound on concurrent cross-device copies; more only thrashes the disks.
+MOVE_COPY_WORKERS = 4
+
+
+def _same_filesystem(path_a: str, path_b: str) -> bool:
+    """True when both paths live on the same device (st_dev), i.e. a rename can move between them."""
+    try:
+        return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+    except Exception:
+        return False
+
+
+def _kernel_copy(src: str, dst: str):
+    """Copy the bytes of `src` to `dst` letting the kernel do the work.
+    Uses os.copy_file_range where available (Linux; server-side/reflink copies on
+    supporting filesystems), otherwise shutil.copyfile, which itself uses sendfile on
+    Linux, fcopyfile on macOS and CopyFile on Windows.
+    """
+    copy_range = getattr(os, 'copy_file_range', None)
+    if copy_range is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                return
+        except OSError:
+            # e.g. unsupported filesystem pair; fall through to the portable path
+            pass
+    shutil.copyfile(src, dst)
+
+
+def _copy_then_remove(src: str, dst: str) -> str:
+    """Cross-device move of one file: kernel copy into a temp file, copy timestamps,
+    os.replace into place, then remove the source."""
+    tmp_path = _temp_output_path(dst)
+    try:
+        _kernel_copy(src, tmp_path)
+        shutil.copystat(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except Exception:
+            pass
+        raise
+    os.remove(src)
+    return dst
+
+
+def _move_files(pairs: list[tuple[str, str]], same_fs: bool, journal=None) -> tuple[list[str], list[str]]:
+    """Move each (src, dst) pair. `same_fs` is decided once per run by the caller:
+    on one volume every file is a single os.replace (O(1), no data copied); across
+    devices files are copied in parallel on a bounded pool and the sources removed.
+    When a _RunJournal is given the whole plan is recorded (and synced) first and
+    each completed move afterwards.
+    Returns (moved destination paths, failed source paths).
+    """
+    moved: list[str] = []
+    failed: list[str] = []
+    cross_device: list[tuple[str, str]] = []
+    if journal is not None:
+        for src, dst in pairs:
+            journal.plan('move', src=src, dst=dst)
+        journal.checkpoint()
+    for src, dst in pairs:
+        if same_fs:
+            try:
+                os.replace(src, dst)
+                moved.append(dst)
+                if journal is not None:
+                    journal.done('move', src=src, dst=dst)
+                continue
+            except OSError:
+                # fall back to copying this file (e.g. a nested mount point)
+                pass
+        cross_device.append((src, dst))
+
+    if cross_device:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(MOVE_COPY_WORKERS, len(cross_device))) as pool:
+            futures = [(src, pool.submit(_copy_then_remove, src, dst)) for src, dst in cross_device]
+            for src, future in futures:
+                try:
+                    dst = future.result()
+                    moved.append(dst)
+                    if journal is not None:
+                        journal.done('move', src=src, dst=dst)
+                except Exception:
+                    failed.append(src)
+    if journal is not None:
+        journal.checkpoint()
+    return moved, failed
+
+
+# ====================== IMPORT SUBSYSTEM (outside the class) ======================
+
+# Concurrent file imports per drop; a USB card reader saturates well before this
+IMPORT_WORKERS = 4
+
+# Import outcomes reported per file by _import_one
+IMPORT_LINKED = 'linked'    # reflink or hardlink, no bytes copied
+IMPORT_COPIED = 'copied'
+IMPORT_EXISTS = 'exists'    # a file with that name is already in the Source folder
+IMPORT_DUPLICATE = 'duplicate'  # same content as a file already in the Source folder (or the drop)
+
+_FICLONE = 0x40049409  # Linux ioctl: share the extents of a file (btrfs, XFS, ...)
+
+
+def _reflink(src: str, dst: str):
+    """Create `dst` as a copy-on-write clone of `src`. Raises OSError where unsupported."""
+    if not sys.platform.startswith('linux'):
+        raise OSError("reflink not supported on this platform")
+    import fcntl
+    with open(src, 'rb') as fsrc:
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            fcntl.ioctl(fd, _FICLONE, fsrc.fileno())
+        except Exception:
+            os.close(fd)
+            os.remove(dst)
+            raise
+        os.close(fd)
+    shutil.copystat(src, dst)
+
+
+def _import_one(src: str, dst: str, same_fs: bool, allow_hardlink: bool = True) -> str:
+    """Bring one dropped file into the Source folder. On the same volume the file is
+    reflinked (or hardlinked) so no data is copied; otherwise it's a kernel copy into
+    a temp file renamed into place. Never overwrites. Returns an IMPORT_* outcome.
+    """
+    if os.path.exists(dst):
+        return IMPORT_EXISTS
+    if same_fs:
+        try:
+            _reflink(src, dst)
+            return IMPORT_LINKED
+        except FileExistsError:
+            return IMPORT_EXISTS
+        except Exception:
+            pass
+        if allow_hardlink:
+            try:
+                os.link(src, dst)
+                return IMPORT_LINKED
+            except FileExistsError:
+                return IMPORT_EXISTS
+            except Exception:
+                pass
+    tmp_path = _temp_output_path(dst)
+    try:
+        _kernel_copy(src, tmp_path)
+        shutil.copystat(src, tmp_path)
+        if os.path.exists(dst):
+            os.remove(tmp_path)
+            return IMPORT_EXISTS
+        os.replace(tmp_path, dst)
+    except Exception:
+        try:
+            os.remove(tmp_path)
         except Exception:
             pass
+        raise
+    return IMPORT_COPIED
+
+
+# Import ordering modes: positions come from mtime order, so every mode except 'keep'
+# re-stamps the imported files' mtimes after the existing images, in the chosen order.
+IMPORT_ORDER_MODES = {
+    'keep': 'Keep File Timestamps',
+    'drop': 'Drop Order',
+    'exif': 'Date Taken (EXIF)',
+    'name': 'File Name (Natural Sort)',
+}
+DEFAULT_IMPORT_ORDER = 'keep'
+
+_EXIF_IFD_POINTER = 0x8769
+_EXIF_DATETIME_ORIGINAL = 0x9003
+_EXIF_SUBSEC_ORIGINAL = 0x9291
+_EXIF_DATETIME = 0x0132
+
+
+def _natural_key(name: str):
+    """Sort key so 'IMG_2' < 'IMG_10'."""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name.lower())]
+
+
+def _exif_taken_time(path: str) -> float | None:
+    """DateTimeOriginal (+ sub-seconds) as a timestamp, read from the headers only
+    (Image.open doesn't decode pixels). Falls back to the IFD0 DateTime; None if absent."""
+    try:
+        _ensure_heif_opener(path)
+        with Image.open(path) as img:
+            exif = img.getexif()
+            sub_ifd = exif.get_ifd(_EXIF_IFD_POINTER)
+            raw = sub_ifd.get(_EXIF_DATETIME_ORIGINAL) or exif.get(_EXIF_DATETIME)
+            if not raw:
+                return None
+            taken = datetime.strptime(str(raw).strip('\x00 ')[:19], "%Y:%m:%d %H:%M:%S").timestamp()
+            subsec = str(sub_ifd.get(_EXIF_SUBSEC_ORIGINAL, '') or '').strip('\x00 ')
+            if subsec.isdigit():
+                taken += int(subsec) / (10 ** len(subsec))
+            return taken
+    except Exception:
+        return None
+
+
+def _order_imported(imported: list[tuple[str, str]], mode: str) -> list[str]:
+    """Destination paths of (src, dst) pairs (given in drop order) in `mode` order."""
+    if mode == 'name':
+        return sorted((dst for _src, dst in imported), key=lambda d: _natural_key(os.path.basename(d)))
+    if mode == 'exif':
+        def _key(pair):
+            src, dst = pair
+            taken = _exif_taken_time(dst)
+            if taken is None:
+                try:
+                    taken = os.stat(src).st_mtime
+                except Exception:
+                    taken = 0.0
+            return (taken, _natural_key(os.path.basename(dst)))
+        return [dst for _src, dst in sorted(imported, key=_key)]
+    return [dst for _src, dst in imported]
+
+
+def _stamp_import_order(folder: str, ordered: list[str]):
+    """Give `ordered` strictly increasing mtimes (1 ms apart) after every other image
+    already in `folder`, in one pass, so their positions follow the list order."""
+    if not ordered:
+        return
+    stamped = set(ordered)
+    latest_ns = 0
+    try:
+        with os.scandir(folder) as it:
+            for de in it:
+                if de.path not in stamped and de.is_file():
+                    latest_ns = max(latest_ns, de.stat().st_mtime_ns)
+    except Exception:
+        pass
+    base_ns = max(time.time_ns(), latest_ns + 1_000_000)
+    for i, path in enumerate(ordered):
+        try:
+            t = base_ns + i * 1_000_000
+            os.utime(path, ns=(t, t))
+        except Exception:
+            continue
+
+
+def _run_import(files: list[str], source_folder: str, results: queue.Queue, order_mode: str = DEFAULT_IMPORT_ORDER):
+    """Background import of `files` into `source_folder` on a bounded pool. Exact
+    duplicates (see _filter_duplicates) are rejected before any bytes are copied.
+    Unless `order_mode` is 'keep', the imported files are then re-stamped in that
+    order (see _stamp_import_order); hardlinks are avoided in that case because a
+    link shares its mtime with the file that was dropped.
+    Posts ('file', src, dst, outcome) per file (outcome None on failure) and a final
+    ('done',) to `results`; the Tk thread drains the queue.
+    """
+    try:
+        index = _load_hash_index(source_folder)
+        drop_entries: dict[str, dict] = {}
+        try:
+            files, duplicates = _filter_duplicates(files, source_folder, index, drop_entries)
+        except Exception as e:
+            log.warning("duplicate check skipped: %s", e)
+            duplicates = {}
+        for src, existing in duplicates.items():
+            results.put(('file', src, existing, IMPORT_DUPLICATE))
+
+        same_fs = bool(files) and _same_filesystem(os.path.dirname(files[0]), source_folder)
+        allow_hardlink = order_mode not in IMPORT_ORDER_MODES or order_mode == 'keep'
+        imported: dict[str, str] = {}
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        with ThreadPoolExecutor(max_workers=max(1, min(IMPORT_WORKERS, len(files)))) as pool:
+            futures = {}
+            for src in files:
+                dst = os.path.join(source_folder, os.path.basename(src))
+                futures[pool.submit(_import_one, src, dst, same_fs, allow_hardlink)] = (src, dst)
+            for future in as_completed(futures):
+                src, dst = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception:
+                    outcome = None
+                if outcome in (IMPORT_LINKED, IMPORT_COPIED):
+                    imported[src] = dst
+                results.put(('file', src, dst, outcome))
+
+        if not allow_hardlink and imported:
+            # one batched pass over the finished batch, in the chosen order
+            _stamp_import_order(source_folder, _order_imported(
+                [(src, imported[src]) for src in files if src in imported], order_mode))
+        for src, dst in imported.items():
+            _index_imported(index, dst, drop_entries.get(src))
+        _save_hash_index(source_folder, index)
+    finally:
+        results.put(('done',))
+
+
+# ====================== DUPLICATE DETECTION (outside the class) ======================
+
+# Persistent per-Source-folder hash index: config/hash_index/<folder digest>.json,
+# {file name: {'size', 'mtime_ns', 'quick', 'full'}}. Entries are trusted only while
+# size and mtime_ns still match; hashes are computed lazily, only on size collisions.
+HASH_INDEX_FOLDER = os.path.join(CONFIG_FOLDER, 'hash_index')
+# Bytes read from each end of a file for the quick hash
+HASH_SAMPLE_BYTES = 64 * 1024
+
+
+def _hash_index_path(folder: str) -> str:
+    import hashlib
+    digest = hashlib.sha1(os.path.abspath(folder).encode('utf-8')).hexdigest()
+    return os.path.join(HASH_INDEX_FOLDER, f"{digest}.json")
+
+
+def _load_hash_index(folder: str) -> dict:
+    try:
+        with open(_hash_index_path(folder), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_hash_index(folder: str, index: dict):
+    """Persist the index, dropping entries for files no longer in the folder."""
+    try:
+        present = set(os.listdir(folder))
+        index = {name: entry for name, entry in index.items() if name in present}
+        _ensure_config()
+        os.makedirs(HASH_INDEX_FOLDER, exist_ok=True)
+        path = _hash_index_path(folder)
+        tmp_path = _temp_output_path(path)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        log.warning("could not save hash index: %s", e)
+
+
+def _quick_hash(path: str, size: int) -> str:
+    """Hash of the size plus the first and last HASH_SAMPLE_BYTES of the file."""
+    import hashlib
+    h = hashlib.blake2b(str(size).encode('ascii'), digest_size=16)
+    with open(path, 'rb') as f:
+        h.update(f.read(HASH_SAMPLE_BYTES))
+        if size > 2 * HASH_SAMPLE_BYTES:
+            f.seek(-HASH_SAMPLE_BYTES, os.SEEK_END)
+            h.update(f.read(HASH_SAMPLE_BYTES))
+        elif size > HASH_SAMPLE_BYTES:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def _full_hash(path: str) -> str:
+    import hashlib
+    h = hashlib.blake2b(digest_size=32)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _fingerprint(path: str, entry: dict, level: str) -> str:
+    """The 'quick' or 'full' hash of `path`, computed once and memoized in `entry`."""
+    if not entry.get(level):
+        entry[level] = _quick_hash(path, entry['size']) if level == 'quick' else _full_hash(path)
+    return entry[level]
+
+
+def _index_entry(index: dict, name: str, st) -> dict:
+    """Index entry for `name`, reset if the file changed since it was hashed."""
+    entry = index.get(name)
+    if not entry or entry.get('size') != st.st_size or entry.get('mtime_ns') != st.st_mtime_ns:
+        entry = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+        index[name] = entry
+    return entry
+
+
+def _filter_duplicates(files: list[str], folder: str, index: dict,
+                       drop_entries: dict | None = None) -> tuple[list[str], dict[str, str]]:
+    """Split dropped `files` into (unique files, {duplicate src: path it duplicates}).
+    Hashes computed for the unique files are left in `drop_entries` ({src: entry}).
+
+    A file is a duplicate when its bytes equal a file already in `folder` or an
+    earlier file of the same drop. Candidates are narrowed by size (a stat), then by
+    the quick head/tail hash, and only confirmed with a full hash on a quick-hash
+    collision, so a typical drop reads just a sample of the few same-sized files.
+    """
+    # Known files, grouped by size: (path, entry) with entry from the persistent index
+    by_size: dict[int, list[tuple[str, dict]]] = {}
+    with os.scandir(folder) as it:
+        for de in it:
+            try:
+                if de.is_file() and not de.name.startswith('.'):
+                    by_size.setdefault(de.stat().st_size, []).append((de.path, _index_entry(index, de.name, de.stat())))
+            except Exception:
+                continue
+
+    unique: list[str] = []
+    duplicates: dict[str, str] = {}
+    for src in files:
+        try:
+            st = os.stat(src)
+        except Exception:
+            unique.append(src)
+            continue
+        entry = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+        match = None
+        for known_path, known in by_size.get(st.st_size, []):
+            if os.path.abspath(known_path) == os.path.abspath(src):
+                continue
+            if _fingerprint(src, entry, 'quick') != _fingerprint(known_path, known, 'quick'):
+                continue
+            if _fingerprint(src, entry, 'full') == _fingerprint(known_path, known, 'full'):
+                match = known_path
+                break
+        if match:
+            duplicates[src] = match
+        else:
+            unique.append(src)
+            # later files of the same drop are checked against this one too
+            by_size.setdefault(st.st_size, []).append((src, entry))
+            if drop_entries is not None:
+                drop_entries[src] = entry
+    return unique, duplicates
+
+
+def _index_imported(index: dict, dst: str, known: dict | None):
+    """Record an imported file in the index, carrying over any hash computed for its source."""
+    try:
+        st = os.stat(dst)
+        entry = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+        known = known or {}
+        for level in ('quick', 'full'):
+            if known.get(level):
+                entry[level] = known[level]
+        index[os.path.basename(dst)] = entry
+    except Exception:
+        pass
+
+
+def _new_archive_folder(destination_folder: str) -> str:
+    """Path of a new timestamped archive folder inside `destination_folder` (not created)."""
+    timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+    return os.path.join(destination_folder, timestamp)
+
+
+# ====================== RUN JOURNAL (outside the class) ======================
+
+# Append-only JSON-lines journals of in-progress runs. A journal is removed when its
+# run finishes, so any file left here at startup belongs to an interrupted run.
+JOURNAL_FOLDER = os.path.join(CONFIG_FOLDER, 'journal')
+
+
+class _RunJournal:
+    """Journal of one crop/move run: a 'begin' record, then 'plan' records before
+    each filesystem operation and 'done' records after it. Records are flushed as
+    they are written and fsynced at checkpoints (after a plan batch, after each
+    phase) so a crash leaves at most the last few 'done' records unsynced.
+    Journal I/O errors never abort the run itself.
+    """
+
+    def __init__(self, kind: str, **info):
+        self.path = None
+        self._fh = None
+        # sets are cropped on several threads sharing one journal
+        self._lock = threading.Lock()
+        try:
+            _ensure_config()
+            os.makedirs(JOURNAL_FOLDER, exist_ok=True)
+            run_id = f"{datetime.now().strftime('%Y-%m-%d-%H-%M-%S')}-{os.getpid()}"
+            self.path = os.path.join(JOURNAL_FOLDER, f"{kind}-{run_id}.jsonl")
+            self._fh = open(self.path, 'a', encoding='utf-8')
+        except Exception as e:
+            log.warning("journal unavailable: %s", e)
+            self._fh = None
+        self._write({'event': 'begin', 'kind': kind, **info})
+        self.checkpoint()
+
+    def _write(self, record: dict):
+        if self._fh is None:
+            return
+        try:
+            record['t'] = time.time()
+            line = json.dumps(record) + '\n'
+            with self._lock:
+                self._fh.write(line)
+                self._fh.flush()
+        except Exception:
+            pass
+
+    def plan(self, op: str, **fields):
+        self._write({'event': 'plan', 'op': op, **fields})
+
+    def done(self, op: str, **fields):
+        self._write({'event': 'done', 'op': op, **fields})
+
+    def checkpoint(self):
+        """Force everything written so far to disk."""
+        if self._fh is None:
+            return
+        try:
+            with self._lock:
+                self._fh.flush()
+                os.fsync(self._fh.fileno())
+        except Exception:
+            pass
+
+    def finish(self):
+        """The run completed: close and drop the journal."""
+        if self._fh is None:
+            return
+        try:
+            self._fh.close()
+            os.remove(self.path)
+        except Exception:
+            pass
+        self._fh = None
+
+
+class _NullJournal:
+    """Stand-in when a run isn't journaled (same interface as _RunJournal)."""
+
+    def plan(self, op: str, **fields):
+        pass
+
+    def done(self, op: str, **fields):
+        pass
+
+    def checkpoint(self):
+        pass
+
+    def finish(self):
+        pass
+
+
+def _read_journal(path: str) -> list[dict]:
+    """Records of a journal file; a torn last line (crash mid-write) is ignored."""
+    records = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except Exception:
+                    continue
+    except Exception:
+        pass
+    return records
+
+
+def find_interrupted_journals() -> list[str]:
+    """Journal files left behind by runs that never finished (oldest first)."""
+    try:
+        names = sorted(f for f in os.listdir(JOURNAL_FOLDER) if f.endswith('.jsonl'))
+    except Exception:
+        return []
+    return [os.path.join(JOURNAL_FOLDER, f) for f in names]
+
+
+def _journal_ops(records: list[dict]) -> list[dict]:
+    """Planned operations in plan order, each with a 'done' flag (and the trash outcome)."""
+    ops: list[dict] = []
+    index: dict[tuple, dict] = {}
+    for rec in records:
+        key = (rec.get('op'), rec.get('src'), rec.get('dst'))
+        if rec.get('event') == 'plan':
+            op = {'op': rec.get('op'), 'src': rec.get('src'), 'dst': rec.get('dst'), 'done': False}
+            ops.append(op)
+            index[key] = op
+        elif rec.get('event') == 'done':
+            op = index.get(key)
+            if op is None:
+                op = {'op': rec.get('op'), 'src': rec.get('src'), 'dst': rec.get('dst')}
+                ops.append(op)
+                index[key] = op
+            op['done'] = True
+            op['outcome'] = rec.get('outcome')
+    return ops
+
+
+def _remove_stale_temp_outputs(dst: str):
+    """Remove temp files (see _temp_output_path) an interrupted write or copy left next to `dst`."""
+    folder, name = os.path.split(dst)
+    try:
+        for f in os.listdir(folder):
+            if f.startswith(f".{name}.") and f.endswith('.tmp'):
+                try:
+                    os.remove(os.path.join(folder, f))
+                except Exception:
+                    pass
+    except Exception:
+        pass
+
+
+def resume_journal(path: str) -> dict:
+    """Finish an interrupted run: perform the planned moves and trash operations
+    that never completed. Crops that were never written can't be replayed (the
+    originals are untouched until the crops finish), so those are only counted.
+    Returns a summary {'moved', 'trashed', 'unwritten'} and removes the journal.
+    """
+    summary = {'moved': 0, 'trashed': 0, 'unwritten': 0}
+    pending_trash = []
+    for op in _journal_ops(_read_journal(path)):
+        if op.get('done'):
+            continue
+        kind, src, dst = op.get('op'), op.get('src'), op.get('dst')
+        if kind == 'write' and dst:
+            _remove_stale_temp_outputs(dst)
+            if not os.path.exists(dst):
+                summary['unwritten'] += 1
+        elif kind == 'move' and src and dst:
+            _remove_stale_temp_outputs(dst)
+            if os.path.isfile(src) and not os.path.exists(dst):
+                moved, _failed = _move_files([(src, dst)], same_fs=_same_filesystem(src, os.path.dirname(dst)))
+                summary['moved'] += len(moved)
+        elif kind == 'trash' and src and os.path.isfile(src):
+            pending_trash.append(src)
+    summary['trashed'] = _count_removed(_trash_files(pending_trash))
+    try:
+        os.remove(path)
+    except Exception:
+        pass
+    return summary
+
+
+def rollback_journal(path: str) -> dict:
+    """Undo an interrupted run, newest operation first: move files back to the
+    Source, remove the outputs it wrote and the archive folder it created (if left
+    empty). Files already sent to the trash can't be restored from here; they are
+    counted so the user can restore them from the OS trash.
+    Returns a summary {'restored', 'removed', 'in_trash'} and removes the journal.
+    """
+    summary = {'restored': 0, 'removed': 0, 'in_trash': 0}
+    for op in reversed(_journal_ops(_read_journal(path))):
+        kind, src, dst = op.get('op'), op.get('src'), op.get('dst')
+        try:
+            if kind == 'write' and dst:
+                _remove_stale_temp_outputs(dst)
+                if op.get('done') and os.path.isfile(dst):
+                    os.remove(dst)
+                    summary['removed'] += 1
+            elif kind == 'move' and src and dst:
+                _remove_stale_temp_outputs(dst)
+                # an unsynced 'done' record is detected by the file state itself
+                if os.path.isfile(dst) and not os.path.exists(src):
+                    moved, _failed = _move_files([(dst, src)], same_fs=_same_filesystem(os.path.dirname(dst), os.path.dirname(src)))
+                    summary['restored'] += len(moved)
+            elif kind == 'trash' and op.get('done') and op.get('outcome') == TRASH_TRASHED:
+                summary['in_trash'] += 1
+            elif kind == 'mkdir' and dst:
+                if os.path.isdir(dst) and not os.listdir(dst):
+                    os.rmdir(dst)
+        except Exception:
+            continue
+    try:
+        os.remove(path)
+    except Exception:
+        pass
+    return summary
+
+
+# ====================== CROP ENGINE (outside the class) ======================
+
+
+def _plan_applications(rules_map: dict[int, list[dict]], image_count: int) -> list[tuple[int, int, dict]]:
+    """(rule_index, position, rule) crops for a set of `image_count` images, in rule file order."""
+    # Build the complete list of (rule_index, position, rule) applications
+    # by iterating rules in file order. Rules that target an explicit position
+    # are applied to that position. Rules with apply_to_all_remaining=True
+    # are applied to any positions that don't already have an explicit rule
+    # (and that haven't been filled yet by an earlier apply_all).
+    applications: list[tuple[int, int, dict]] = []  # (rule_index, position, rule)
+
+    # Flatten all rules in file order based on their stored _rule_index
+    all_rules: list[dict] = []
+    for p in sorted(rules_map.keys()):
+        for r in rules_map.get(p, []):
+            all_rules.append(r)
+    all_rules.sort(key=lambda rr: int(rr.get('_rule_index', 999999)))
+
+    # positions that have explicit rules in the profile (do not override these)
+    explicit_positions = set(rules_map.keys())
+    # positions already assigned by an earlier apply_all
+    filled_by_apply_all: set[int] = set()
+
+    for rule in all_rules:
+        rule_index = int(rule.get('_rule_index', 999999))
+
+        # If this rule targets an explicit position, apply it there
+        try:
+            rule_pos = int(rule.get('position', rule.get('position_number', 0)))
+        except Exception:
+            rule_pos = 0
+
+        if 1 <= rule_pos <= image_count:
+            applications.append((rule_index, rule_pos, rule))
+
+        # If this rule requests apply-to-all, apply it to any positions that
+        # don't already have an explicit rule and haven't already been filled
+        # (and that haven't been filled yet by an earlier apply_all).
+        if rule.get('apply_to_all_remaining'):
+            for p in range(1, image_count + 1):
+                if p in explicit_positions:
+                    # explicit rule exists for this position; skip
+                    continue
+                if p in filled_by_apply_all:
+                    # already filled by an earlier apply_all
+                    continue
+                # Assign this apply_all rule to position p
+                applications.append((rule_index, p, rule))
+                filled_by_apply_all.add(p)
+
+    # Sort applications by rule file-order so outputs follow the rule listing order.
+    applications.sort(key=lambda t: t[0])
+    return applications
+
+
+def _output_suffix(i: int) -> str:
+    """Suffix of the i-th output of a set: 1 -> a, 2 -> b, ... 26 -> z, 27 -> 27, 28 -> 28, etc."""
+    if 1 <= i <= 26:
+        return chr(96 + i)
+    return str(i)
+
+
+def _read_source_info(image_paths: list[Path], positions, metadata_policy: str,
+                      source_metadata: dict, source_orientation: dict) -> None:
+    """Fill the per-source memos _crop_application reads, once per source, before its
+    crops are submitted to the pool (the pool's tasks only read the memos, so they need
+    no lock). Unreadable sources are left out; their crops fail on their own."""
+    for position in sorted(set(positions)):
+        if position <= 0 or position > len(image_paths):
+            continue
+        img_path = image_paths[position - 1]
+        if str(img_path) in source_orientation:
+            continue
+        try:
+            _ensure_heif_opener(img_path)
+            with Image.open(img_path) as source_img:
+                source_metadata[str(img_path)] = _extract_source_metadata(source_img, metadata_policy)
+                source_orientation[str(img_path)] = _image_orientation(source_img)
+        except Exception as e:
+            log.debug("Could not read %s up front: %s", img_path, e)
+
+
+@_traced('crop image')
+def _crop_application(app_idx: int, position: int, rule: dict, image_paths: list[Path], base_name: str,
+                      output_folder: str, metadata_policy: str, journal,
+                      source_metadata: dict, source_orientation: dict, rule_index: int = 0) -> dict | None:
+    """Write the output of one (position, rule) application, named by its index in the
+    set. Independent of the other applications, so sets can be cropped in any order
+    or in parallel. `source_metadata` / `source_orientation` memoize per-source reads;
+    parallel callers fill them first with _read_source_info.
+    Returns the output's manifest record ('source', 'output', 'rule_index', 'position',
+    'crop_box', 'width', 'height', 'bytes', 'quality', 'seconds'), or None if the
+    application was skipped.
+    """
+    started = time.perf_counter()
+    # Map position to image path (guard bounds)
+    if position <= 0 or position > len(image_paths):
+        # invalid position — skip
+        return None
+    img_path = image_paths[position - 1]
+
+    try:
+        _ensure_heif_opener(img_path)
+        with Image.open(img_path) as source_img:
+            # orientation is stored last, so once it's present the metadata is too
+            if str(img_path) not in source_orientation:
+                source_metadata[str(img_path)] = _extract_source_metadata(source_img, metadata_policy)
+                source_orientation[str(img_path)] = _image_orientation(source_img)
+            src_metadata = source_metadata[str(img_path)]
+            # Crop coordinates are in the upright space the editor shows
+            orientation = source_orientation[str(img_path)]
+            src_w, src_h = _oriented_size(source_img.size, orientation)
+            # Determine whether this application came from an apply_all rule
+            # that originates from another position. If so, and if that
+            # originating rule's crop equals the originating image's full
+            # dimensions and the aspect_ratio is 'none', then the user's
+            # intent is likely to keep the target image at its original
+            # size — so do not force the originating image dimensions.
+            use_original_size_for_target = False
+            try:
+                rule_origin_pos = int(rule.get('position', rule.get('position_number', 0)))
+            except Exception:
+                rule_origin_pos = 0
+
+            if 1 <= rule_origin_pos <= len(image_paths) and rule_origin_pos != position and rule.get('aspect_ratio', 'none') == 'none':
+                try:
+                    # get the originating image path and inspect its crop
+                    origin_path = image_paths[rule_origin_pos - 1]
+                    _ensure_heif_opener(origin_path)
+                    with Image.open(origin_path) as origin_img:
+                        origin_w, origin_h = _oriented_size(origin_img.size, _image_orientation(origin_img))
+                        c_rule = rule.get('crop', {})
+                        try:
+                            rx1 = int(c_rule.get('x1', 0))
+                            ry1 = int(c_rule.get('y1', 0))
+                            rx2 = int(c_rule.get('x2', origin_w))
+                            ry2 = int(c_rule.get('y2', origin_h))
+                        except Exception:
+                            rx1, ry1, rx2, ry2 = 0, 0, origin_w, origin_h
+
+                        # if the rule's crop exactly matches the origin's full size
+                        if rx1 == 0 and ry1 == 0 and rx2 == origin_w and ry2 == origin_h:
+                            use_original_size_for_target = True
+                except Exception:
+                    # if anything fails, fall back to normal cropping
+                    use_original_size_for_target = False
+
+            if use_original_size_for_target:
+                # create an un-cropped (upright) copy of the target image
+                cropped_img = _crop_oriented(source_img, (0, 0, src_w, src_h), orientation)
+                # mark coordinates as full-target so later logic treats it as full image
+                x1, y1, x2, y2 = 0, 0, src_w, src_h
+            else:
+                c = rule.get('crop', {})
+                try:
+                    x1 = int(c.get('x1', 0))
+                    y1 = int(c.get('y1', 0))
+                    x2 = int(c.get('x2', src_w))
+                    y2 = int(c.get('y2', src_h))
+                except Exception:
+                    return None
+
+                x1 = max(0, min(x1, src_w - 1))
+                y1 = max(0, min(y1, src_h - 1))
+                x2 = max(0, min(x2, src_w))
+                y2 = max(0, min(y2, src_h))
+                if x2 <= x1 or y2 <= y1:
+                    return None
+
+                cropped_img = _crop_oriented(source_img, (x1, y1, x2, y2), orientation)
+
+            suf = _output_suffix(app_idx)
+            # Convert HEIC/HEIF images to JPEG
+            original_ext = img_path.suffix.lower()
+            if original_ext in ('.heic', '.heif'):
+                output_ext = '.jpg'
+            else:
+                output_ext = img_path.suffix
+            output_file_name = f"{base_name}_{suf}{output_ext}"
+            out_path = os.path.join(output_folder, output_file_name)
+
+            compression_percent = int(rule.get('compression', rule.get('compression_percent', 0)))
+            journal.plan('write', src=str(img_path), dst=out_path)
+
+            # If no compression requested and the crop is the full image, prefer
+            # to re-save via Pillow at high quality so only the metadata allowed by the
+            # profile's policy is kept, otherwise fall back to copying bytes.
+            # For cropped images we must save the cropped image.
+            is_full_image = (x1 == 0 and y1 == 0 and x2 == src_w and y2 == src_h)
+
+            # Encoder quality actually used (None when the source bytes were copied);
+            # a compression percent maps onto Pillow's quality scale.
+            if compression_percent <= 0:
+                quality = 95
+            else:
+                quality = max(1, min(95, int(round(95 * (100 - compression_percent) / 100))))
+            full_copy = compression_percent <= 0 and is_full_image
+
+            # Rotated sources must be written upright, so only an unrotated full image
+            # can be re-saved straight from the source.
+            save_img = source_img if (full_copy and orientation == 1) else cropped_img
+            written = _save_image_preset(save_img, out_path, quality=quality, metadata=src_metadata)
+            if written is None and full_copy:
+                # Pillow couldn't re-encode it: copy the original bytes instead.
+                try:
+                    src_path = os.path.abspath(img_path)
+                    dst_path = os.path.abspath(out_path)
+                    if src_path != dst_path:
+                        _atomic_copy(src_path, dst_path)
+                        written, quality = out_path, None
+                except Exception:
+                    pass
+            if written is not None and full_copy:
+                try:
+                    now = time.time()
+                    os.utime(written, (now, now))
+                except Exception:
+                    pass
+
+            # Nothing written by this run: leave the plan entry open (a rollback removes
+            # nothing it didn't write) and return no record; run_crop_job only moves or
+            # deletes originals that have a record.
+            if written is None:
+                return None
+            out_path = written
+            try:
+                out_bytes = os.path.getsize(out_path)
+            except OSError:
+                return None
+            journal.done('write', src=str(img_path), dst=out_path)
+            # this original was processed; report the new output path
+            return {
+                'source': str(img_path),
+                'output': out_path,
+                'rule_index': rule_index,
+                'position': position,
+                'crop_box': [x1, y1, x2, y2],
+                'width': cropped_img.width,
+                'height': cropped_img.height,
+                'bytes': out_bytes,
+                'quality': quality,
+                'seconds': round(time.perf_counter() - started, 4),
+            }
+    except Exception:
+        return None
+
+
+def _crop_images(image_paths: list[Path], applications: list[tuple[int, int, dict]], base_name: str,
+                 output_folder: str, metadata_policy: str, journal=None, progress=None) -> tuple[int, set[str], set[str]]:
+    """Crop one set of images (positions are indexes into `image_paths`) into
+    `output_folder`, in application order. `progress(done, total)` is called after each.
+    Returns (processed count, originals processed, outputs created).
+    """
+    if journal is None:
+        journal = _NullJournal()
+    processed_count = 0
+    processed_originals: set[str] = set()
+    created_out_paths: set[str] = set()
+    # Metadata to reattach and EXIF orientation, read once per source and shared by all of its crops
+    source_metadata: dict[str, dict] = {}
+    source_orientation: dict[str, int] = {}
+
+    # Name files sequentially a,b,c... in the order of applications
+    for app_idx, (rule_index, position, rule) in enumerate(applications, start=1):
+        record = _crop_application(app_idx, position, rule, image_paths, base_name, output_folder,
+                                   metadata_policy, journal, source_metadata, source_orientation, rule_index)
+        if record:
+            processed_originals.add(record['source'])
+            created_out_paths.add(os.path.abspath(record['output']))
+            processed_count += 1
+        if progress is not None:
+            progress(app_idx, len(applications))
+
+    return processed_count, processed_originals, created_out_paths
+
+
+
+# ====================== MULTI-SET BATCHING (outside the class) ======================
+
+# How the Source folder is split into sets; each set is cropped like a whole folder
+# would be (positions 1..K) into its own folder under the run's Destination folder.
+SETS_MODES = {
+    'off': 'Off (Whole Folder Is One Set)',
+    'count': 'Groups of K Images (K = Profile Positions)',
+    'gap': 'Time Gap Between Shots',
+    'separator': 'Separator Shot (Blank Frame)',
+    'subfolders': 'Subfolders',
+}
+DEFAULT_SETS_MODE = 'off'
+# A new set starts when two consecutive shots are further apart than this ('gap' mode)
+DEFAULT_SETS_GAP_SECONDS = 60.0
+# A separator shot is a near-uniform frame (lens cap, grey card): max luminance std-dev
+SEPARATOR_MAX_STDDEV = 6.0
+# Sets cropped concurrently; Pillow releases the GIL while decoding and encoding
+SET_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+
+def _profile_set_size(rules_map: dict[int, list[dict]]) -> int:
+    """Images per set in 'count' mode: the highest position the profile has a rule for."""
+    try:
+        return max(1, max(int(p) for p in rules_map.keys()))
+    except Exception:
+        return 1
+
+
+def _is_separator_shot(path) -> bool:
+    """True for a near-uniform frame. Decodes at reduced size (draft) for speed."""
+    try:
+        from PIL import ImageStat
+        _ensure_heif_opener(path)
+        with Image.open(path) as img:
+            img.draft('L', (64, 64))
+            small = img.convert('L')
+            small.thumbnail((64, 64))
+            return ImageStat.Stat(small).stddev[0] <= SEPARATOR_MAX_STDDEV
+    except Exception:
+        return False
+
+
+def _split_into_sets(source_folder: str, image_paths: list[Path], mode: str, set_size: int,
+                     gap_seconds: float = DEFAULT_SETS_GAP_SECONDS) -> tuple[list[tuple[str, list[Path]]], list[Path]]:
+    """Split the mtime-ordered `image_paths` into named sets for `mode`.
+    Returns ([(set name, image paths)], separator shots). In 'subfolders' mode the
+    sets are the Source folder's immediate subfolders instead of `image_paths`.
+    """
+    groups: list[list[Path]] = []
+    separators: list[Path] = []
+    if mode == 'subfolders':
+        extensions = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tif", ".tiff", ".webp", ".heic", ".heif"}
+        subfolders = sorted((d for d in Path(source_folder).iterdir() if d.is_dir() and not d.name.startswith('.')),
+                            key=lambda d: _natural_key(d.name))
+        named = []
+        for sub in subfolders:
+            paths = sorted([p for p in sub.iterdir() if p.suffix.lower() in extensions and p.is_file()],
+                           key=lambda p: p.stat().st_mtime)
+            if paths:
+                named.append((sub.name, paths))
+        return named, separators
+
+    if mode == 'count':
+        k = max(1, int(set_size))
+        groups = [image_paths[i:i + k] for i in range(0, len(image_paths), k)]
+    elif mode == 'gap':
+        last_mtime = None
+        for p in image_paths:
+            mtime = p.stat().st_mtime
+            if not groups or (last_mtime is not None and mtime - last_mtime > gap_seconds):
+                groups.append([])
+            groups[-1].append(p)
+            last_mtime = mtime
+    elif mode == 'separator':
+        current: list[Path] = []
+        for p in image_paths:
+            if _is_separator_shot(p):
+                separators.append(p)
+                if current:
+                    groups.append(current)
+                current = []
+            else:
+                current.append(p)
+        if current:
+            groups.append(current)
+    else:
+        groups = [list(image_paths)] if image_paths else []
+
+    width = max(3, len(str(len(groups))))
+    return [(f"Set {i:0{width}d}", g) for i, g in enumerate(groups, start=1)], separators
+
+
+# ====================== RUN MANIFESTS (outside the class) ======================
+
+# Columns of the CSV manifest (one row per output); the JSON manifest has the same
+# records plus the run header and what happened to each original.
+MANIFEST_FIELDS = ('source', 'output', 'set', 'rule_index', 'position', 'x1', 'y1', 'x2', 'y2',
+                   'width', 'height', 'bytes', 'quality', 'seconds')
+
+
+def _write_manifest(folder: str, stem: str, run: dict, outputs: list[dict], originals: list[dict]) -> str | None:
+    """Write `<stem>.json` and `<stem>.csv` into `folder` describing a run, so downstream
+    scripts needn't rescan or reopen images. Output paths are stored relative to `folder`
+    (the manifest stays valid when the folder is moved along with it); source paths are
+    absolute. Returns the JSON path, or None if it couldn't be written."""
+    def _rel(path):
+        try:
+            return os.path.relpath(path, folder) if path else path
+        except ValueError:
+            return path
+
+    records = []
+    for rec in outputs:
+        row = dict(rec)
+        row['output'] = _rel(row.get('output'))
+        records.append(row)
+    data = {
+        'run': run,
+        'outputs': records,
+        'originals': [{**o, 'to': _rel(o.get('to'))} for o in originals],
+        'totals': {
+            'outputs': len(records),
+            'bytes': sum(r.get('bytes') or 0 for r in records),
+            'pixels': sum((r.get('width') or 0) * (r.get('height') or 0) for r in records),
+        },
+    }
+    json_path = os.path.join(folder, f"{stem}.json")
+    try:
+        tmp_path = _temp_output_path(json_path)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, json_path)
+
+        csv_path = os.path.join(folder, f"{stem}.csv")
+        tmp_path = _temp_output_path(csv_path)
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=MANIFEST_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            for rec in records:
+                box = rec.get('crop_box') or [None] * 4
+                writer.writerow({**rec, 'x1': box[0], 'y1': box[1], 'x2': box[2], 'y2': box[3]})
+        os.replace(tmp_path, csv_path)
+        return json_path
+    except Exception as e:
+        log.warning("could not write manifest: %s", e)
+        return None
+
+
+# ====================== JOBS (outside the class) ======================
+
+# Threads in the shared crop pool used by every job (GUI runs, station jobs, ...)
+CROP_WORKERS = max(1, min(8, os.cpu_count() or 1))
+
+
+class _FairScheduler:
+    """Shared pool of worker threads running the tasks of several jobs at once.
+    Workers take one task per job in turn (round-robin), so a 400-image folder can't
+    starve a 12-image one submitted after it. Tasks are plain callables.
+    """
+
+    def __init__(self, workers: int = CROP_WORKERS):
+        from collections import deque
+        self._deque = deque
+        self._cond = threading.Condition()
+        self._queues: dict[object, object] = {}   # job key -> deque of (batch, index, task)
+        self._turns = deque()                     # job keys with pending tasks, in turn order
+        self._workers = max(1, int(workers))
+        self._threads: list[threading.Thread] = []
+
+    def run(self, job_key, tasks: list, progress=None) -> list:
+        """Run `tasks` for `job_key` on the shared pool and block until all finished.
+        `progress(done, total)` is called (from a worker thread) after each task.
+        Returns the task results in order; a task that raised yields None.
+        """
+        if not tasks:
+            return []
+        batch = {'results': [None] * len(tasks), 'remaining': len(tasks), 'total': len(tasks),
+                 'progress': progress, 'event': threading.Event()}
+        with self._cond:
+            self._start_workers()
+            queue_ = self._queues.get(job_key)
+            if queue_ is None:
+                queue_ = self._queues[job_key] = self._deque()
+                self._turns.append(job_key)
+            queue_.extend((batch, i, task) for i, task in enumerate(tasks))
+            self._cond.notify_all()
+        batch['event'].wait()
+        return batch['results']
+
+    def _start_workers(self):
+        while len(self._threads) < self._workers:
+            t = threading.Thread(target=self._worker, daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def _next_task(self):
+        with self._cond:
+            while not self._turns:
+                self._cond.wait()
+            job_key = self._turns.popleft()
+            queue_ = self._queues[job_key]
+            item = queue_.popleft()
+            if queue_:
+                self._turns.append(job_key)
+            else:
+                del self._queues[job_key]
+            return item
+
+    def _worker(self):
+        while True:
+            batch, index, task = self._next_task()
+            try:
+                batch['results'][index] = task()
+            except Exception as e:
+                log.error("task failed: %s", e)
+            with self._cond:
+                batch['remaining'] -= 1
+                done = batch['total'] - batch['remaining']
+                finished = batch['remaining'] == 0
+            if batch['progress'] is not None:
+                try:
+                    batch['progress'](done, batch['total'])
+                except Exception:
+                    pass
+            if finished:
+                batch['event'].set()
+
+
+_SHARED_SCHEDULER = None
+_SHARED_SCHEDULER_LOCK = threading.Lock()
+
+
+def _shared_scheduler() -> _FairScheduler:
+    """The process-wide crop pool, created on first use."""
+    global _SHARED_SCHEDULER
+    with _SHARED_SCHEDULER_LOCK:
+        if _SHARED_SCHEDULER is None:
+            _SHARED_SCHEDULER = _FairScheduler()
+        return _SHARED_SCHEDULER
+
+
+@_traced('crop run')
+def run_crop_job(source_folder: str, profile_name: str, destination_folder: str = '', move: bool = False,
+                 delete_originals: bool = False, delete_after_move: bool = False,
+                 sets_mode: str = DEFAULT_SETS_MODE, progress=None) -> dict:
+    """Crop (and optionally archive) one Source folder with a profile, without any UI.
+
+    Crop writes the outputs next to the originals. With `move` (Crop & Move) the outputs
+    go straight into a new timestamped folder in `destination_folder` and the originals
+    are archived there in the same pass (or trashed with `delete_after_move`). In a sets
+    mode each set is cropped into its own subfolder of that run folder. Every crop runs
+    on the shared fair scheduler, so concurrent jobs share one bounded pool.
+    `progress(done, total)` reports finished crops.
+
+    Returns {'status': 'done'|'error', 'message', 'processed', 'moved', 'deleted',
+    'sets', 'archive_folder', 'manifest', 'outputs': [manifest records]}. A manifest of
+    the run (see _write_manifest) is written next to the outputs.
+    """
+    result = {'status': 'error', 'message': '', 'processed': 0, 'moved': 0, 'deleted': 0,
+              'sets': 0, 'archive_folder': None, 'manifest': None, 'outputs': []}
+    started_at = time.time()
+    started = time.perf_counter()
+
+    if not source_folder or not os.path.isdir(source_folder):
+        result['message'] = "No source folder selected."
+        return result
+    rules_map = load_profile_rules(profile_name)
+    if not rules_map:
+        result['message'] = f"Profile '{profile_name}' has no rules."
+        return result
+    metadata_policy = load_profile_metadata_policy(profile_name)
+    has_destination = bool(destination_folder and os.path.isdir(destination_folder))
+    if sets_mode not in SETS_MODES:
+        sets_mode = DEFAULT_SETS_MODE
+    if (move or sets_mode != 'off') and not has_destination:
+        result['message'] = "No destination folder selected."
+        return result
+
+    extensions = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tif", ".tiff", ".webp", ".heic", ".heif"}
+    image_paths = sorted(
+        [p for p in Path(source_folder).iterdir() if p.suffix.lower() in extensions and p.is_file()],
+        key=lambda p: p.stat().st_mtime)
+
+    # Snapshot the initial list of originals (absolute paths) so we have
+    # a stable index to refer to during deletion. This prevents newly
+    # created cropped files in the same folder from shifting positions.
+    initial_originals = [str(p.resolve()) for p in image_paths]
+
+    base_name = re.sub(r'[^a-zA-Z0-9_ -]', '', profile_name).replace(' ', '_').strip('_')
+
+    separators: list[Path] = []
+    if sets_mode != 'off':
+        try:
+            gap_seconds = float(load_config('sets_gap_seconds') or DEFAULT_SETS_GAP_SECONDS)
+        except Exception:
+            gap_seconds = DEFAULT_SETS_GAP_SECONDS
+        sets, separators = _split_into_sets(source_folder, image_paths, sets_mode, _profile_set_size(rules_map), gap_seconds)
+        if not sets:
+            result['message'] = "No images found in source folder."
+            return result
+    else:
+        if not image_paths:
+            result['message'] = "No images found in source folder."
+            return result
+        sets = [('', image_paths)]
+
+    planned = [(name, paths, _plan_applications(rules_map, len(paths))) for name, paths in sets]
+    # If no applications were created, nothing applies
+    if not any(apps for _name, _paths, apps in planned):
+        result['message'] = "No rules applicable to images."
+        return result
+
+    # Journal every filesystem step from here on so an interrupted run can be
+    # resumed or rolled back at the next startup (see _check_interrupted_runs).
+    journal = _RunJournal('crop', profile=profile_name, source=source_folder, save_after=bool(move), sets=sets_mode)
+
+    archive_folder = None
+    set_folders: list[str] = []
+    if move or sets_mode != 'off':
+        archive_folder = _new_archive_folder(destination_folder)
+        try:
+            for name in [''] + [name for name, _paths, _apps in planned if name]:
+                folder = os.path.join(archive_folder, name) if name else archive_folder
+                journal.plan('mkdir', dst=folder)
+                os.makedirs(folder, exist_ok=True)
+                journal.done('mkdir', dst=folder)
+        except Exception as e:
+            journal.finish()
+            result['message'] = f"Could not create {archive_folder}: {e}"
+            return result
+        set_folders = [os.path.join(archive_folder, name) if name else archive_folder for name, _paths, _apps in planned]
+    else:
+        set_folders = [source_folder]
+
+    # One task per output; each set keeps its own per-source metadata memo, filled here
+    # so concurrent tasks never race to read the same source
+    tasks = []
+    task_sets = []
+    for (name, paths, apps), folder in zip(planned, set_folders):
+        source_metadata: dict[str, dict] = {}
+        source_orientation: dict[str, int] = {}
+        _read_source_info(paths, [position for _ri, position, _r in apps], metadata_policy,
+                          source_metadata, source_orientation)
+        for app_idx, (rule_index, position, rule) in enumerate(apps, start=1):
+            tasks.append(lambda a=app_idx, pos=position, r=rule, ri=rule_index, ps=paths, f=folder, sm=source_metadata, so=source_orientation:
+                         _crop_application(a, pos, r, ps, base_name, f, metadata_policy, journal, sm, so, ri))
+            task_sets.append(name)
+    outputs = []
+    for record, set_name in zip(_shared_scheduler().run(object(), tasks, progress), task_sets):
+        if record:
+            record['set'] = set_name
+            outputs.append(record)
+    created_out_paths = {os.path.abspath(r['output']) for r in outputs}
+    processed_count = len(outputs)
+    journal.checkpoint()
+
+    # Originals: trash them (delete after cropping / delete after moving), or archive each
+    # set's originals into its output folder. Iterate the initial snapshot, never an output.
+    # Only originals with at least one written crop are touched; the others (every crop
+    # failed, e.g. the disk filled up) stay in the Source folder and are logged as kept.
+    succeeded = {os.path.realpath(r['source']) for r in outputs}
+    set_originals = []
+    kept = []
+    for _n, paths, _a in planned:
+        originals = [str(p) for p in paths if os.path.abspath(p) not in created_out_paths]
+        set_originals.append([p for p in originals if os.path.realpath(p) in succeeded])
+        kept += [p for p in originals if os.path.realpath(p) not in succeeded]
+    leftovers = [str(p) for p in separators]
+    deleted_count = 0
+    moved_count = 0
+    originals_log: list[dict] = []
+    if kept and (move or delete_originals):
+        log.warning("%d original(s) kept in the Source folder: no crop was written for them", len(kept))
+        originals_log = [{'source': p, 'action': 'kept', 'to': None} for p in kept]
+    if (delete_originals or (move and delete_after_move)) and processed_count:
+        if sets_mode == 'off':
+            to_trash = [orig for orig in initial_originals
+                        if os.path.abspath(orig) not in created_out_paths and os.path.realpath(orig) in succeeded]
+        else:
+            to_trash = [p for originals in set_originals for p in originals] + leftovers
+        outcomes = _trash_files(to_trash, journal=journal)
+        deleted_count = _count_removed(outcomes)
+        originals_log += [{'source': path, 'action': outcome, 'to': None} for path, outcome in outcomes.items()]
+    elif move and not delete_after_move:
+        for originals, folder in zip(set_originals + [leftovers], set_folders + [archive_folder]):
+            moved = _archive_originals([p for p in originals if os.path.isfile(p)], folder, journal=journal)
+            moved_count += len(moved)
+            moved_names = {os.path.basename(m) for m in moved}
+            originals_log += [{'source': p, 'action': 'moved' if os.path.basename(p) in moved_names else 'kept',
+                               'to': os.path.join(folder, os.path.basename(p)) if os.path.basename(p) in moved_names else None}
+                              for p in originals]
+    journal.finish()
+
+    manifest_folder = archive_folder or source_folder
+    result['manifest'] = _write_manifest(manifest_folder, f"{base_name}_manifest", {
+        'kind': 'crop_and_move' if move else 'crop',
+        'profile': profile_name,
+        'metadata_policy': metadata_policy,
+        'sets_mode': sets_mode,
+        'source_folder': os.path.abspath(source_folder),
+        'output_folder': os.path.abspath(manifest_folder),
+        'started': datetime.fromtimestamp(started_at).isoformat(timespec='seconds'),
+        'seconds': round(time.perf_counter() - started, 3),
+    }, outputs, originals_log)
+
+    if archive_folder and sets_mode != 'off':
+        msg = f"Cropped {processed_count} image(s) in {len(planned)} set(s) into {os.path.basename(archive_folder)}."
+    elif archive_folder:
+        msg = f"Cropped {processed_count} image(s) into {os.path.basename(archive_folder)}."
+    else:
+        msg = f"Finished cropping {processed_count} image(s)."
+    if moved_count:
+        msg += f" Moved {moved_count} original file(s)."
+    if deleted_count:
+        msg += f" Deleted {deleted_count} original file(s)."
+    result.update(status='done', message=msg, processed=processed_count, moved=moved_count,
+                  deleted=deleted_count, sets=len(planned), archive_folder=archive_folder, outputs=outputs)
+    return result
+
+
+@_traced('move run')
+def run_move_job(source_folder: str, profile_name: str, destination_folder: str,
+                 delete_after_move: bool = False) -> dict:
+    """Move the profile's cropped outputs and the originals from the Source folder into a
+    new timestamped folder in the Destination, without any UI (see run_move_only).
+    With `delete_after_move` only the outputs are moved and the originals are trashed.
+    Writes move_manifest.json/.csv into the new folder.
+    Returns {'status': 'done'|'error', 'message', 'moved', 'deleted', 'archive_folder', 'manifest'}.
+    """
+    result = {'status': 'error', 'message': '', 'moved': 0, 'deleted': 0, 'archive_folder': None, 'manifest': None}
+    started_at = time.time()
+    started = time.perf_counter()
+    if not source_folder or not os.path.isdir(source_folder):
+        result['message'] = "No source folder selected."
+        return result
+    if not destination_folder or not os.path.isdir(destination_folder):
+        result['message'] = "No destination folder selected."
+        return result
+    do_delete_after_move = bool(delete_after_move)
+
+    new_archive_folder = _new_archive_folder(destination_folder)
+    result['archive_folder'] = new_archive_folder
+    timestamp = os.path.basename(new_archive_folder)
+
+    journal = _RunJournal('move', profile=profile_name, source=source_folder, destination=destination_folder)
+    try:
+        journal.plan('mkdir', dst=new_archive_folder)
+        os.makedirs(new_archive_folder, exist_ok=True)
+        journal.done('mkdir', dst=new_archive_folder)
+
+        # Determine which files are "cropped outputs" for this profile.
+        # This mirrors the naming used by run_cropping: <base_name>_suffix.ext
+        base_name = re.sub(r'[^a-zA-Z0-9_ -]', '', profile_name).replace(' ', '_').strip('_')
+        output_prefix = f"{base_name}_"
+        image_exts = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".webp", ".heic", ".heif"}
+
+        all_files = [f for f in os.listdir(source_folder) if os.path.isfile(os.path.join(source_folder, f))]
+        # Files that look like cropped outputs (to be moved)
+        cropped_files = [f for f in all_files if f.startswith(output_prefix) and os.path.splitext(f)[1].lower() in image_exts]
+        # The crop run's manifest travels with its outputs (its paths are relative)
+        cropped_files += [f for f in all_files if f in (f"{base_name}_manifest.json", f"{base_name}_manifest.csv")]
+        # Originals are image files that are NOT cropped outputs
+        original_files = [f for f in all_files if os.path.splitext(f)[1].lower() in image_exts and f not in cropped_files]
+
+        moved_count = 0
+        deleted_count = 0
+
+        created_out_paths = set()
+
+        # Move files. If delete-after-moving is enabled only the outputs are
+        # moved and the originals are deleted below; otherwise move everything
+        # (both cropped outputs and the original image files) so the Source
+        # folder is emptied by the Move action. _move_files renames when Source
+        # and Destination share a volume, so no bytes are copied in that case.
+        if do_delete_after_move:
+            all_to_move = list(cropped_files)
+        else:
+            all_to_move = []
+            # preserve order: move cropped outputs first then originals
+            all_to_move.extend(cropped_files)
+            # add originals that are not already in cropped_files
+            for f in original_files:
+                if f not in cropped_files:
+                    all_to_move.append(f)
+
+        moved_paths, _failed = _move_files(
+            [(os.path.join(source_folder, f), os.path.join(new_archive_folder, f)) for f in all_to_move],
+            same_fs=_same_filesystem(source_folder, new_archive_folder), journal=journal)
+        moved_count = len(moved_paths)
+        created_out_paths.update(os.path.abspath(p) for p in moved_paths)
+
+        # If delete-after-moving is enabled: delete the original image files (not the cropped outputs)
+        if do_delete_after_move:
+            to_trash = [os.path.join(source_folder, f) for f in original_files
+                        if os.path.abspath(os.path.join(source_folder, f)) not in created_out_paths]
+            outcomes = _trash_files(to_trash, journal=journal)
+            deleted_count = _count_removed(outcomes)
+        else:
+            outcomes = {}
+        journal.finish()
+
+        moved_set = set(moved_paths)
+        outputs = []
+        for f in all_to_move:
+            dst = os.path.join(new_archive_folder, f)
+            if dst in moved_set:
+                try:
+                    size = os.path.getsize(dst)
+                except OSError:
+                    size = None
+                outputs.append({'source': os.path.join(source_folder, f), 'output': dst, 'bytes': size})
+        result['manifest'] = _write_manifest(new_archive_folder, 'move_manifest', {
+            'kind': 'move',
+            'profile': profile_name,
+            'source_folder': os.path.abspath(source_folder),
+            'output_folder': os.path.abspath(new_archive_folder),
+            'started': datetime.fromtimestamp(started_at).isoformat(timespec='seconds'),
+            'seconds': round(time.perf_counter() - started, 3),
+        }, outputs, [{'source': path, 'action': outcome, 'to': None} for path, outcome in outcomes.items()])
+
+        if deleted_count:
+            msg = f"Moved {moved_count} files to {timestamp}. Deleted {deleted_count} original file(s)."
+        else:
+            msg = f"Moved {moved_count} files to {timestamp}"
+        result.update(status='done', message=msg, moved=moved_count, deleted=deleted_count)
+    except Exception as e:
+        result['message'] = f"Move failed: {e}"
+    finally:
+        # a failed run isn't an interrupted one: don't offer it for resume/rollback at startup
+        journal.finish()
+    return result
+
+
+
+# ====================== JOB QUEUE (outside the class) ======================
+
+# Persistent queue of crop / move / import / export jobs (SQLite in the config folder).
+# Jobs survive restarts: anything still 'running' when the app died is queued again.
+JOBS_DB = os.path.join(CONFIG_FOLDER, 'jobs.sqlite3')
+JOB_KINDS = ('crop', 'move', 'import', 'export')
+JOB_STATUSES = ('queued', 'running', 'done', 'failed', 'cancelled')
+# Jobs executed at the same time; their crops still share the fair crop pool
+JOB_WORKERS = 2
+
+
+@_traced('import run')
+def run_import_job(files: list[str], source_folder: str, order_mode: str = DEFAULT_IMPORT_ORDER) -> dict:
+    """Headless import of `files` into `source_folder` (see _run_import)."""
+    results = queue.Queue()
+    _run_import(list(files), source_folder, results, order_mode)
+    counts = {'imported': 0, 'duplicates': 0, 'skipped': 0}
+    while True:
+        item = results.get()
+        if item[0] == 'done':
+            break
+        outcome = item[3]
+        if outcome in (IMPORT_LINKED, IMPORT_COPIED):
+            counts['imported'] += 1
+        elif outcome == IMPORT_DUPLICATE:
+            counts['duplicates'] += 1
+        else:
+            counts['skipped'] += 1
+    msg = f"Imported {counts['imported']} image(s)."
+    if counts['duplicates']:
+        msg += f" {counts['duplicates']} duplicate(s) not copied."
+    if counts['skipped']:
+        msg += f" {counts['skipped']} skipped."
+    return {'status': 'done', 'message': msg, **counts}
+
+
+def run_export_job(folder: str, target_folder: str) -> dict:
+    """Copy every file of `folder` (e.g. a run's archive folder, sets included) into
+    `target_folder`, keeping the subfolder layout. Links instead of copying where the
+    filesystem allows it (see _import_one)."""
+    if not folder or not os.path.isdir(folder):
+        return {'status': 'error', 'message': f"Folder not found: {folder}"}
+    exported = 0
+    failed = 0
+    dest_root = os.path.join(target_folder, os.path.basename(os.path.normpath(folder)))
+    for root, _dirs, files in os.walk(folder):
+        dest_dir = os.path.join(dest_root, os.path.relpath(root, folder))
+        os.makedirs(dest_dir, exist_ok=True)
+        same_fs = _same_filesystem(root, dest_dir)
+        for name in files:
+            if name.startswith('.'):
+                continue
+            try:
+                if _import_one(os.path.join(root, name), os.path.join(dest_dir, name), same_fs) != IMPORT_EXISTS:
+                    exported += 1
+            except Exception:
+                failed += 1
+    msg = f"Exported {exported} file(s) to {dest_root}."
+    if failed:
+        msg += f" {failed} failed."
+    return {'status': 'done' if not failed else 'error', 'message': msg, 'exported': exported, 'failed': failed}
+
+
+def _execute_job(kind: str, params: dict) -> dict:
+    """Run one queued job with the same engine the GUI uses."""
+    if kind == 'crop':
+        return run_crop_job(params.get('source', ''), params.get('profile', ''), params.get('destination', ''),
+                            move=bool(params.get('move', True)),
+                            delete_originals=bool(params.get('delete_originals', False)),
+                            delete_after_move=bool(params.get('delete_after_move', False)),
+                            sets_mode=params.get('sets_mode', DEFAULT_SETS_MODE))
+    if kind == 'move':
+        return run_move_job(params.get('source', ''), params.get('profile', ''), params.get('destination', ''),
+                            delete_after_move=bool(params.get('delete_after_move', False)))
+    if kind == 'import':
+        return run_import_job(params.get('files', []), params.get('source', ''),
+                              params.get('order_mode', DEFAULT_IMPORT_ORDER))
+    if kind == 'export':
+        return run_export_job(params.get('folder', ''), params.get('target', ''))
+    return {'status': 'error', 'message': f"Unknown job kind: {kind}"}
+
+
+class JobQueue:
+    """SQLite-backed job queue. Higher priority first, then oldest first.
+    Every call uses its own short-lived connection, so any thread (GUI, job workers,
+    the API server) and other processes (the CLI) can use the queue at once.
+    """
+
+    def __init__(self, path: str = JOBS_DB):
+        self.path = path
+        _ensure_config()
+        with self._connect() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                params TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'queued',
+                message TEXT NOT NULL DEFAULT '',
+                result TEXT,
+                created REAL NOT NULL,
+                started REAL,
+                finished REAL,
+                pid INTEGER)""")
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_pending ON jobs (status, priority DESC, id)")
+
+    def _connect(self):
+        import sqlite3
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        db.execute("PRAGMA journal_mode=WAL")
+        return _ClosingConnection(db)
+
+    def enqueue(self, kind: str, params: dict, priority: int = 0) -> int:
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        with self._connect() as db:
+            cur = db.execute("INSERT INTO jobs (kind, params, priority, created) VALUES (?, ?, ?, ?)",
+                             (kind, json.dumps(params), int(priority), time.time()))
+            return int(cur.lastrowid)
+
+    def claim_next(self):
+        """Atomically mark the next queued job as running and return it (or None)."""
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute("SELECT * FROM jobs WHERE status = 'queued' ORDER BY priority DESC, id LIMIT 1").fetchone()
+            if row is None:
+                db.execute("COMMIT")
+                return None
+            db.execute("UPDATE jobs SET status = 'running', started = ?, pid = ? WHERE id = ?", (time.time(), os.getpid(), row['id']))
+            db.execute("COMMIT")
+            return dict(row)
+
+    def finish(self, job_id: int, result: dict):
+        status = 'done' if result.get('status') == 'done' else 'failed'
+        with self._connect() as db:
+            db.execute("UPDATE jobs SET status = ?, message = ?, result = ?, finished = ? WHERE id = ? AND status = 'running'",
+                       (status, str(result.get('message', '')), json.dumps(result, default=str), time.time(), job_id))
+
+    def get(self, job_id: int):
+        with self._connect() as db:
+            row = db.execute("SELECT * FROM jobs WHERE id = ?", (int(job_id),)).fetchone()
+            return dict(row) if row else None
+
+    def recent(self, limit: int = 200) -> list[dict]:
+        """Newest jobs first."""
+        with self._connect() as db:
+            return [dict(r) for r in db.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (int(limit),))]
+
+    def queued(self) -> list[dict]:
+        """Jobs waiting to run, in the order they would be claimed."""
+        with self._connect() as db:
+            return [dict(r) for r in db.execute("SELECT * FROM jobs WHERE status = 'queued' ORDER BY priority DESC, id")]
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a job that hasn't started yet."""
+        with self._connect() as db:
+            return db.execute("UPDATE jobs SET status = 'cancelled', finished = ? WHERE id = ? AND status = 'queued'",
+                              (time.time(), int(job_id))).rowcount > 0
+
+    def retry(self, job_id: int) -> bool:
+        """Queue a failed or cancelled job again."""
+        with self._connect() as db:
+            return db.execute("UPDATE jobs SET status = 'queued', message = '', started = NULL, finished = NULL "
+                              "WHERE id = ? AND status IN ('failed', 'cancelled')", (int(job_id),)).rowcount > 0
+
+    def set_priority(self, job_id: int, priority: int):
+        with self._connect() as db:
+            db.execute("UPDATE jobs SET priority = ? WHERE id = ?", (int(priority), int(job_id)))
+
+    def requeue_interrupted(self) -> int:
+        """Put jobs left 'running' by a process that no longer exists back in the queue
+        (jobs another live instance or the CLI is running are left alone)."""
+        with self._connect() as db:
+            rows = db.execute("SELECT id, pid FROM jobs WHERE status = 'running'").fetchall()
+            stale = [row['id'] for row in rows if not _pid_alive(row['pid'])]
+            for job_id in stale:
+                db.execute("UPDATE jobs SET status = 'queued', started = NULL, pid = NULL WHERE id = ? AND status = 'running'", (job_id,))
+            return len(stale)
+
+
+def _pid_alive(pid) -> bool:
+    """True if a process with this id is still running."""
+    if not pid:
+        return False
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, int(pid))  # PROCESS_QUERY_LIMITED_INFORMATION
+            if not handle:
+                return False
+            code = ctypes.c_ulong()
+            ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+            ctypes.windll.kernel32.CloseHandle(handle)
+            return code.value == 259  # STILL_ACTIVE
+        except Exception:
+            return False
+    try:
+        os.kill(int(pid), 0)
+        return True
+    except PermissionError:
+        return True
+    except Exception:
+        return False
+
+
+class _ClosingConnection:
+    """Context manager that closes an sqlite3 connection (sqlite3's own only commits)."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        return self.db
+
+    def __exit__(self, *exc):
+        self.db.close()
+        return False
+
+
+class JobRunner:
+    """Pool of JOB_WORKERS threads executing queued jobs until stopped. `on_change`
+    is called (from a worker thread) whenever a job starts or finishes."""
+
+    def __init__(self, job_queue: JobQueue, workers: int = JOB_WORKERS, on_change=None):
+        self.queue = job_queue
+        self.workers = max(1, int(workers))
+        self.on_change = on_change
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self):
+        for _ in range(self.workers):
+            t = threading.Thread(target=self._worker, daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def wake(self):
+        """Check the queue now instead of at the next poll (call after enqueue)."""
+        self._wake.set()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def run_until_empty(self):
+        """Execute queued jobs on the calling thread until none are left (CLI)."""
+        while self._run_one():
+            pass
+
+    def _run_one(self) -> bool:
+        job = self.queue.claim_next()
+        if job is None:
+            return False
+        self._notify()
+        try:
+            result = _execute_job(job['kind'], json.loads(job['params']))
+        except Exception as e:
+            result = {'status': 'error', 'message': str(e)}
+        self.queue.finish(job['id'], result)
+        self._notify()
+        return True
+
+    def _notify(self):
+        if self.on_change is not None:
+            try:
+                self.on_change()
+            except Exception:
+                pass
+
+    def _worker(self):
+        while not self._stop.is_set():
+            try:
+                ran = self._run_one()
+            except Exception as e:
+                log.error("job worker error: %s", e)
+                ran = False
+            if not ran:
+                self._wake.wait(2.0)
+                self._wake.clear()
+
+
+def _format_job_row(job: dict) -> str:
+    created = datetime.fromtimestamp(job['created']).strftime('%Y-%m-%d %H:%M:%S')
+    return f"{job['id']:>5}  {job['kind']:<7} {job['priority']:>4}  {job['status']:<10} {created}  {job['message']}"
+
+
+
+# ====================== LOCAL HTTP/JSON API (outside the class) ======================
+
+# Optional API for other local programs (e.g. a PIM) to queue crops. Only ever bound
+# to the loopback interface; requests whose Host (or browser Origin) isn't this local
+# server are refused so a web page can't reach it through DNS rebinding.
+API_HOST = '127.0.0.1'
+DEFAULT_API_PORT = 8765
+_API_MAX_BODY = 1024 * 1024
+_API_LOOPBACK_NAMES = ('127.0.0.1', 'localhost', '::1')
+# Fresh bearer token for each server run; only local users who can read the config folder can call the API
+API_TOKEN_FILE = os.path.join(CONFIG_FOLDER, 'api_token')
+_HTTP_REASONS = {200: 'OK', 201: 'Created', 400: 'Bad Request', 401: 'Unauthorized', 403: 'Forbidden', 404: 'Not Found',
+                 405: 'Method Not Allowed', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+def _job_view(job: dict) -> dict:
+    """Public JSON form of a queue row."""
+    view = {k: job.get(k) for k in ('id', 'kind', 'priority', 'status', 'message', 'created', 'started', 'finished')}
+    view['params'] = json.loads(job.get('params') or '{}')
+    return view
+
+
+def _job_manifest(job: dict) -> dict | None:
+    """The run manifest a finished crop or move job wrote (None until it has one)."""
+    try:
+        result = json.loads(job.get('result') or 'null')
+    except Exception:
+        result = None
+    if not result or not result.get('manifest'):
+        return None
+    try:
+        with open(result['manifest'], 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except Exception:
+        return None
+    manifest['job'] = job['id']
+    manifest['path'] = result['manifest']
+    return manifest
+
+
+def _api_dispatch(job_queue: JobQueue, method: str, path: str, body: bytes, on_enqueue=None) -> tuple[int, object]:
+    """Route one request. Blocking (SQLite); the server runs it in an executor.
+
+    POST /jobs                  {"source", "profile", "destination", "priority"?} -> {"id"}
+    GET  /jobs                  recent jobs
+    GET  /jobs/<id>             status of one job
+    GET  /jobs/<id>/manifest    outputs of a finished crop job
+    DELETE /jobs/<id>           cancel a job that hasn't started
+
+    Only Crop & Move jobs can be submitted, and never with the delete flags: a caller
+    must not be able to move, import or trash arbitrary folders.
+    """
+    parts = [p for p in path.split('?', 1)[0].split('/') if p]
+    if not parts or parts[0] != 'jobs':
+        return 404, {'error': 'not found'}
+    if len(parts) == 1:
+        if method == 'GET':
+            return 200, [_job_view(j) for j in job_queue.recent()]
+        if method != 'POST':
+            return 405, {'error': 'method not allowed'}
+        try:
+            params = json.loads(body.decode('utf-8') or '{}')
+            if not isinstance(params, dict):
+                raise ValueError("expected a JSON object")
+        except Exception as e:
+            return 400, {'error': f"invalid JSON: {e}"}
+        kind = params.pop('kind', 'crop')
+        if kind != 'crop':
+            return 400, {'error': 'only crop jobs can be submitted over the API'}
+        refused = [k for k in ('delete_originals', 'delete_after_move') if params.get(k)]
+        if refused:
+            return 400, {'error': f"not allowed over the API: {', '.join(refused)}"}
+        missing = [k for k in ('source', 'profile', 'destination') if not params.get(k)]
+        if missing:
+            return 400, {'error': f"missing: {', '.join(missing)}"}
+        params.setdefault('move', True)
+        try:
+            priority = int(params.pop('priority', 0))
+        except Exception:
+            return 400, {'error': 'priority must be an integer'}
+        job_id = job_queue.enqueue(kind, params, priority)
+        if on_enqueue is not None:
+            on_enqueue()
+        return 201, {'id': job_id, 'status': 'queued'}
+
+    try:
+        job_id = int(parts[1])
+    except Exception:
+        return 404, {'error': 'not found'}
+    job = job_queue.get(job_id)
+    if job is None:
+        return 404, {'error': 'no such job'}
+    if len(parts) == 2 and method == 'GET':
+        return 200, _job_view(job)
+    if len(parts) == 2 and method == 'DELETE':
+        if job_queue.cancel(job_id):
+            return 200, _job_view(job_queue.get(job_id))
+        return 400, {'error': f"job is {job['status']}"}
+    if len(parts) == 3 and parts[2] == 'manifest' and method == 'GET':
+        manifest = _job_manifest(job)
+        if manifest is None:
+            return 404, {'error': f"no manifest (job is {job['status']})"}
+        return 200, manifest
+    return 405 if len(parts) <= 3 else 404, {'error': 'not supported'}
+
+
+def _api_is_local(url: str, port: int) -> bool:
+    """True if `url` ('//host[:port]' for a Host header, 'http://host[:port]' for an
+    Origin) names this server: a loopback name and the port it listens on."""
+    from urllib.parse import urlsplit
+    try:
+        parts = urlsplit(url)
+        url_port = parts.port or (80 if parts.scheme in ('', 'http') else None)
+    except ValueError:
+        return False
+    return parts.scheme in ('', 'http') and parts.hostname in _API_LOOPBACK_NAMES and url_port == port
+
+
+def _api_new_token() -> str:
+    """Generate this run's API token and write it to API_TOKEN_FILE, readable only by
+    the current user, for local clients to send as 'Authorization: Bearer <token>'."""
+    import secrets
+    _ensure_config()
+    token = secrets.token_urlsafe(32)
+    fd = os.open(API_TOKEN_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(token)
+    return token
+
+
+async def _api_handle(reader, writer, job_queue: JobQueue, port: int, token: str, on_enqueue=None):
+    import asyncio
+    import hmac
+    status, payload = 500, {'error': 'internal error'}
+    try:
+        request_line = (await asyncio.wait_for(reader.readline(), 10)).decode('latin-1').strip()
+        method, path, _version = request_line.split(' ', 2)
+        headers = {}
+        while True:
+            line = (await asyncio.wait_for(reader.readline(), 10)).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', '0') or 0)
+        # Browsers always send Origin on cross-origin POSTs; other local clients needn't
+        origin = headers.get('origin')
+        if not _api_is_local('//' + headers.get('host', ''), port):
+            status, payload = 403, {'error': 'forbidden host'}
+        elif origin is not None and not (origin.startswith('http://') and _api_is_local(origin, port)):
+            status, payload = 403, {'error': 'forbidden origin'}
+        elif not hmac.compare_digest(headers.get('authorization', ''), f"Bearer {token}"):
+            status, payload = 401, {'error': f"missing or wrong token (see {API_TOKEN_FILE})"}
+        elif length > _API_MAX_BODY:
+            status, payload = 413, {'error': 'body too large'}
+        else:
+            body = await reader.readexactly(length) if length else b''
+            loop = asyncio.get_running_loop()
+            status, payload = await loop.run_in_executor(
+                None, _api_dispatch, job_queue, method.upper(), path, body, on_enqueue)
+    except Exception as e:
+        status, payload = 400, {'error': f"bad request: {e}"}
+    data = json.dumps(payload).encode('utf-8')
+    head = (f"HTTP/1.1 {status} {_HTTP_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n").encode('latin-1')
+    try:
+        writer.write(head + data)
+        await writer.drain()
+        writer.close()
+    except Exception:
+        pass
+
+
+def start_api_server(job_queue: JobQueue, port: int = DEFAULT_API_PORT, on_enqueue=None):
+    """Serve the API on 127.0.0.1:`port` from a background thread running its own
+    asyncio loop. Requests must carry the token written to API_TOKEN_FILE. Returns a
+    function that stops the server. Raises OSError if the port can't be bound."""
+    import asyncio
+    token = _api_new_token()
+    loop = asyncio.new_event_loop()
+
+    async def _start():
+        return await asyncio.start_server(
+            lambda r, w: _api_handle(r, w, job_queue, port, token, on_enqueue), API_HOST, port)
+
+    server = loop.run_until_complete(_start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    log.info("API listening on http://%s:%s/jobs", API_HOST, port)
+
+    def _stop():
+        def _shutdown():
+            server.close()
+            loop.stop()
+        loop.call_soon_threadsafe(_shutdown)
+
+    return _stop
 
 
 # ====================== CONFIG SYSTEM (outside the class) ======================
 
 
+_config_ready = False
+_config_lock = threading.Lock()
+
+
+def _ensure_config():
+    """Run ensure_config_exists once per process, on first use of the config folder.
+    Called by everything that reads or writes it, so code that imports this module
+    without running __main__ (the --run-cropping-gui delegate, tests) still finds the
+    folder created and migrated."""
+    global _config_ready
+    if _config_ready:
+        return
+    with _config_lock:
+        if not _config_ready:
+            ensure_config_exists()
+            _config_ready = True
+
+
 def ensure_config_exists():
     # If the app was run from a PyInstaller onefile bundle, resources may have been
     # extracted to sys._MEIPASS in a temp folder. If there is a config folder there
@@ -150,7 +2694,7 @@ def ensure_config_exists():
 
     if not os.path.exists(CONFIG_FOLDER):
         os.makedirs(CONFIG_FOLDER)
-        print("Created folder: config")
+        log.info("created folder: %s", CONFIG_FOLDER)
 
     # If the config file doesn't exist, create with sane defaults
     if not os.path.exists(CONFIG_FILE):
@@ -170,7 +2714,15 @@ def ensure_config_exists():
             f.write("confirm_delete_after_moving,True\n")
             # Persist whether to show the onboarding / first-run wizard. Default True shows it on first run.
             f.write("show_onboarding,True\n")
-        print("Created: config/config.csv")
+            # How dropped images are ordered (see IMPORT_ORDER_MODES). Default keeps their own timestamps.
+            f.write("import_order,keep\n")
+            # Split the Source folder into several product sets per run (see SETS_MODES). Default: one set.
+            f.write("sets_mode,off\n")
+            f.write("sets_gap_seconds,60\n")
+            # Local HTTP/JSON API for other programs on this computer (off by default)
+            f.write("api_enabled,False\n")
+            f.write("api_port,8765\n")
+        log.info("created: %s", CONFIG_FILE)
     else:
         # Migration: if an older key 'confirm_delete_originals' exists, rename it to the new key
         try:
@@ -197,13 +2749,14 @@ def ensure_config_exists():
                 with open(CONFIG_FILE, 'w', encoding='utf-8', newline='') as f:
                     writer = csv.writer(f)
                     writer.writerows(out_rows)
-                print("Migrated config: confirm_delete_originals -> confirm_delete_after_cropping")
+                log.info("migrated config: confirm_delete_originals -> confirm_delete_after_cropping")
         except Exception:
             # best-effort: ignore migration errors to avoid breaking startup
             pass
 
 
 def save_config(setting: str, value: str):
+    _ensure_config()
     rows = []
     try:
         with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
@@ -225,6 +2778,7 @@ def save_config(setting: str, value: str):
 
 
 def load_config(setting: str) -> str:
+    _ensure_config()
     if not os.path.exists(CONFIG_FILE):
         return ""
     with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
@@ -235,8 +2789,31 @@ def load_config(setting: str) -> str:
     return ""
 
 
+STATIONS_FILE = os.path.join(CONFIG_FOLDER, 'stations.json')
+
+
+def load_stations() -> list[dict]:
+    """Saved station jobs: [{'source', 'profile', 'destination'}, ...]."""
+    try:
+        with open(STATIONS_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return [d for d in data if isinstance(d, dict) and d.get('source') and d.get('profile')]
+    except Exception:
+        return []
+
+
+def save_stations(stations: list[dict]):
+    _ensure_config()
+    try:
+        with open(STATIONS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(stations, f, indent=2)
+    except Exception as e:
+        log.warning("could not save stations: %s", e)
+
+
 def load_profiles() -> list[str]:
     """Scans the CONFIG_FOLDER for files ending in .profile and returns a list of their base names."""
+    _ensure_config()
     profiles = []
     if os.path.exists(CONFIG_FOLDER):
         for item in os.listdir(CONFIG_FOLDER):
@@ -249,6 +2826,7 @@ def load_profile_rules(profile_name: str) -> dict[int, list[dict]] | None:
     """Loads the cropping rules from a specified profile file."""
     if profile_name == "— No Profile Selected —":
         return None
+    _ensure_config()
 
     safe_name = re.sub(r'[\\/:*?"<>|]', '_', profile_name)
     file_path = os.path.join(CONFIG_FOLDER, f"{safe_name}.profile")
@@ -282,21 +2860,35 @@ def load_profile_rules(profile_name: str) -> dict[int, list[dict]] | None:
                     rules_map.setdefault(position, []).append(rule)
         return rules_map
     except Exception as e:
-        print(f"ERROR loading profile '{profile_name}': {e}")
+        log.error("could not load profile %r: %s", profile_name, e)
         return None
 
 
-ensure_config_exists()
+def load_profile_metadata_policy(profile_name: str) -> str:
+    """Returns the profile's 'metadata_policy' (one of METADATA_POLICIES), defaulting to strip."""
+    safe_name = re.sub(r'[\\/:*?"<>|]', '_', profile_name or '')
+    file_path = os.path.join(CONFIG_FOLDER, f"{safe_name}.profile")
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            policy = json.load(f).get('metadata_policy', DEFAULT_METADATA_POLICY)
+    except Exception:
+        return DEFAULT_METADATA_POLICY
+    return policy if policy in METADATA_POLICIES else DEFAULT_METADATA_POLICY
+
+
+_startup_profile.mark('module body')
 
 # Fixed left panel width (pixels). Change this value to manually adjust the left column width.
 LEFT_PANEL_FIXED_WIDTH = 200
 
 
 # ========================= MAIN APPLICATION CLASS =========================
-class ImageCroppingApp(TkinterDnD.Tk):
+class ImageCroppingApp(tk.Tk):
     def __init__(self):
         super().__init__()
-        print("[image_wizard] __init__ start")
+        _startup_profile.mark('Tk root')
+        _ensure_config()
+        log.debug("__init__ start")
         try:
             # When the window is closed, just destroy it (no debug logging)
             self.protocol('WM_DELETE_WINDOW', self.destroy)
@@ -308,12 +2900,12 @@ class ImageCroppingApp(TkinterDnD.Tk):
 
         # Initialize ttkbootstrap style (Cosmo theme)
         try:
-            self.style = Style('cosmo')
-            print("[image_wizard] style initialized")
+            self.style = _lazy_import('ttkbootstrap').Style('cosmo')
+            log.debug("style initialized")
         except Exception:
             # fallback: continue without crashing
             self.style = None
-            print("[image_wizard] style failed, continuing")
+            log.warning("style failed, continuing")
 
         # Set window title and geometry FIRST to prevent white box flash
         self.title("Image Splitter Pro v1.0.0 Beta")
@@ -383,6 +2975,7 @@ class ImageCroppingApp(TkinterDnD.Tk):
         except Exception:
             # Non-fatal: don't prevent the app from launching if icon setup fails
             pass
+        _startup_profile.mark('theme + window icon')
 
 
         self.grid_columnconfigure(0, weight=1)
@@ -405,28 +2998,110 @@ class ImageCroppingApp(TkinterDnD.Tk):
 
         saved_source = load_config("source_folder")
         saved_dest = load_config("destination_folder")
-        print(f"[image_wizard] saved_source={saved_source!r}, saved_dest={saved_dest!r}")
+        log.debug("saved_source=%r, saved_dest=%r", saved_source, saved_dest)
         if saved_source and os.path.isdir(saved_source):
             self.file_paths["source_folder"] = saved_source
         if saved_dest and os.path.isdir(saved_dest):
             # use the correctly named local variable
             self.file_paths["destination_folder"] = saved_dest
-        print(f"[image_wizard] file_paths after load: {self.file_paths}")
+        log.debug("file_paths after load: %s", self.file_paths)
+
+        # Local API preference (the Edit menu binds to it; the server starts after the job queue)
+        self._stop_api = None
+        self.api_enabled_var = tk.BooleanVar(value=str(load_config("api_enabled")).lower() in ("1", "true", "yes", "on"))
+
+        _startup_profile.mark('settings')
+
+        self.create_widgets()
+        log.debug("create_widgets done")
+        _startup_profile.mark('widgets')
+
+        # --- BIND RESIZE EVENT ---
+        self.bind("<Configure>", self.on_window_resize)
+
+        # Thumbnails, drag-and-drop and the job queue start once the window has been
+        # drawn (see _after_first_paint) so they don't hold up the first paint.
+        self.job_queue = None
+        self.job_runner = None
+        self._jobs_dirty = True
+        try:
+            self.after(0, lambda: self.after_idle(self._after_first_paint))
+        except Exception:
+            pass
+        try:
+            self.after(300, self._maybe_show_onboarding)
+        except Exception:
+            pass
+        try:
+            self.after(500, self._check_interrupted_runs)
+        except Exception:
+            pass
+
+        log.debug("__init__ end")
+        _startup_profile.mark('__init__ end')
 
-        self.create_widgets()
-        print("[image_wizard] create_widgets done")
+    def _after_first_paint(self):
+        """Runs on the first idle pass after mainloop has drawn the window: prints the
+        --profile-startup breakdown, then starts the work deferred from __init__."""
+        _startup_profile.mark('first paint')
+        _startup_profile.report()
 
-        # --- BIND RESIZE EVENT ---
-        self.bind("<Configure>", self.on_window_resize)
+        self._enable_drag_and_drop()
+        _startup_profile.mark('drag-and-drop')
 
         # --- START THE POLLING LOOP ---
         self.start_auto_refresh()
-        print("[image_wizard] start_auto_refresh scheduled")
+        log.debug("start_auto_refresh scheduled")
+        _startup_profile.mark('first thumbnail refresh')
+
+        self._start_job_services()
+        _startup_profile.mark('job queue')
+
+    def _start_job_services(self):
+        # --- PERSISTENT JOB QUEUE ---
+        # Jobs queued in an earlier session (or by the CLI) only run here once confirmed
         try:
-            self.after(300, self._maybe_show_onboarding)
-        except Exception:
-            pass
-        print("[image_wizard] __init__ end")
+            self.job_queue = JobQueue()
+            resumed = self.job_queue.requeue_interrupted()
+            if resumed:
+                log.info("re-queued %d interrupted job(s)", resumed)
+            self._confirm_pending_jobs()
+            self.job_runner = JobRunner(self.job_queue, on_change=self._mark_jobs_dirty).start()
+            self.after(1000, self._poll_job_queue)
+        except Exception as e:
+            log.warning("job queue unavailable: %s", e)
+            self.job_queue = None
+            self.job_runner = None
+
+        # --- OPTIONAL LOCAL API (Edit → Enable Local API) ---
+        if self.api_enabled_var.get():
+            self._set_api_running(True)
+        self.api_enabled_var.trace_add('write', lambda *args: self._on_api_toggled())
+
+    def _confirm_pending_jobs(self):
+        """Ask before running jobs that were queued outside this window (the CLI, the
+        local API, an earlier session); declined jobs are cancelled and can be queued
+        again with Retry in the Jobs window or --retry-job."""
+        pending = self.job_queue.queued()
+        if not pending:
+            return
+        deleting = 0
+        for job in pending:
+            try:
+                params = json.loads(job['params'])
+            except Exception:
+                params = {}
+            if params.get('delete_originals') or params.get('delete_after_move'):
+                deleting += 1
+        kinds = ', '.join(sorted({job['kind'] for job in pending}))
+        text = f"{len(pending)} job(s) ({kinds}) were queued earlier and have not run yet."
+        if deleting:
+            text += f"\n{deleting} of them delete the original files."
+        text += "\n\nYes: run them now\nNo: cancel them (Retry in Jobs queues one again)"
+        if not messagebox.askyesno("Queued Jobs", text, parent=self):
+            for job in pending:
+                self.job_queue.cancel(job['id'])
+            self._jobs_dirty = True
 
     def create_widgets(self):
         # use ttk.Frame for modern look
@@ -490,15 +3165,15 @@ class ImageCroppingApp(TkinterDnD.Tk):
         # Expose these as attributes so the menu can enable/disable them together with menu entries
         # On macOS, tk.Button doesn't respect bg/fg colors well, so use TBButton with primary bootstyle
         if sys.platform == 'darwin':
-            self.crop_btn = TBButton(parent_frame, text="Crop", command=lambda: self.run_cropping(save_after=False), bootstyle='primary')
+            self.crop_btn = _bootstyle_button(parent_frame, 'primary', text="Crop", command=lambda: self.run_cropping(save_after=False))
         else:
             self.crop_btn = tk.Button(parent_frame, text="Crop", command=lambda: self.run_cropping(save_after=False), bg='#0d6efd', fg='white', activebackground='#0b5bd0', activeforeground='white', bd=1, relief='raised')
         self.crop_btn.grid(row=5, column=0, sticky="ew", pady=5, ipady=8)
-        self.move_btn = TBButton(parent_frame, text="Move", command=self.run_move_only, bootstyle='warning')
+        self.move_btn = _bootstyle_button(parent_frame, 'warning', text="Move", command=self.run_move_only)
         self.move_btn.grid(row=6, column=0, sticky="ew", pady=5, ipady=8)
         # Use explicit blue tk.Button for Crop & Move to match the Crop button
         if sys.platform == 'darwin':
-            self.crop_move_btn = TBButton(parent_frame, text="Crop & Move", command=lambda: self.run_cropping(save_after=True), bootstyle='primary')
+            self.crop_move_btn = _bootstyle_button(parent_frame, 'primary', text="Crop & Move", command=lambda: self.run_cropping(save_after=True))
         else:
             self.crop_move_btn = tk.Button(parent_frame, text="Crop & Move", command=lambda: self.run_cropping(save_after=True), bg='#0d6efd', fg='white', activebackground='#0b5bd0', activeforeground='white', bd=1, relief='raised')
         self.crop_move_btn.grid(row=7, column=0, sticky="ew", pady=5, ipady=12)
@@ -558,6 +3233,22 @@ class ImageCroppingApp(TkinterDnD.Tk):
                 self.delete_move_var.trace('w', _on_delete_move_changed)
             except Exception:
                 pass
+
+        # How dropped images are ordered (Edit → Order Dropped Images By)
+        saved_order = load_config("import_order")
+        self.import_order_var = tk.StringVar(value=saved_order if saved_order in IMPORT_ORDER_MODES else DEFAULT_IMPORT_ORDER)
+        try:
+            self.import_order_var.trace_add('write', lambda *args: save_config("import_order", self.import_order_var.get()))
+        except Exception:
+            pass
+
+        # Multi-set batching (Edit → Split Source into Sets)
+        saved_sets_mode = load_config("sets_mode")
+        self.sets_mode_var = tk.StringVar(value=saved_sets_mode if saved_sets_mode in SETS_MODES else DEFAULT_SETS_MODE)
+        try:
+            self.sets_mode_var.trace_add('write', lambda *args: save_config("sets_mode", self.sets_mode_var.get()))
+        except Exception:
+            pass
         # Left-column UI cleanup: remove the inline checkbox and Select/Open folder buttons.
         # The 'Delete Original Image after Cropping' option and the Select/Open folder actions
         # remain available in the Edit and File menus respectively.
@@ -590,6 +3281,9 @@ class ImageCroppingApp(TkinterDnD.Tk):
         # existing code that calls self.status_label.config(...) continues to work.
         self.status_label = _NullLabel()
 
+        # Progress line for background work (imports); only gridded while a job runs
+        self.progress_label = ttk.Label(top_frame, text="", foreground="#0d6efd", font=('Helvetica', 9, 'italic'))
+
         # Support link (top-right corner) that opens the external site
         # support_url = "https://www.abelxl.com/"
         # try:
@@ -659,15 +3353,7 @@ class ImageCroppingApp(TkinterDnD.Tk):
         self.canvas.bind("<MouseWheel>", on_mousewheel)
         self.thumb_frame.bind("<MouseWheel>", on_mousewheel)
 
-        # Enable drag-and-drop on the canvas
-        if DND_FILES:
-            try:
-                self.canvas.drop_target_register(DND_FILES)
-                self.canvas.dnd_bind('<<Drop>>', self._on_drop)
-                self.canvas.dnd_bind('<<DragEnter>>', self._on_drag_enter)
-                self.canvas.dnd_bind('<<DragLeave>>', self._on_drag_leave)
-            except Exception:
-                pass  # Silently fail if drag-and-drop isn't available
+        # Drag-and-drop on the canvas is enabled after the first paint (_enable_drag_and_drop)
 
         # Bind arrow keys for thumbnail navigation
         self.canvas.bind("<Left>", lambda e: self.navigate_thumbnail('left'))
@@ -678,9 +3364,8 @@ class ImageCroppingApp(TkinterDnD.Tk):
         try:
             self.create_menubar()
         except Exception:
-            # If menubar creation fails, don't crash the UI; just log traceback to console
-            import traceback
-            traceback.print_exc()
+            # If menubar creation fails, don't crash the UI; just log the traceback
+            log.exception("create_menubar failed")
 
     # ========================= DYNAMIC POLLING & SORTING =========================
     def on_window_resize(self, event):
@@ -692,6 +3377,23 @@ class ImageCroppingApp(TkinterDnD.Tk):
         self.after(2000, self.start_auto_refresh)
 
     # ========================= DRAG-AND-DROP HANDLERS =========================
+    def _enable_drag_and_drop(self):
+        """Load the tkdnd Tcl package into this window's interpreter and make the thumbnail
+        canvas a drop target. Importing tkinterdnd2 adds the dnd methods to every widget,
+        so the main window can stay a plain tk.Tk until the window is on screen."""
+        dnd = _lazy_import('tkinterdnd2')
+        if dnd is None:
+            return  # no tkinterdnd2: the app works without drag-and-drop
+        try:
+            require = getattr(dnd.TkinterDnD, 'require', None) or dnd.TkinterDnD._require
+            self.TkdndVersion = require(self)
+            self.canvas.drop_target_register(dnd.DND_FILES)
+            self.canvas.dnd_bind('<<Drop>>', self._on_drop)
+            self.canvas.dnd_bind('<<DragEnter>>', self._on_drag_enter)
+            self.canvas.dnd_bind('<<DragLeave>>', self._on_drag_leave)
+        except Exception:
+            pass  # Silently fail if drag-and-drop isn't available
+
     def _on_drag_enter(self, event):
         """Visual feedback when dragging over the canvas."""
         try:
@@ -768,44 +3470,103 @@ class ImageCroppingApp(TkinterDnD.Tk):
             if not image_files:
                 return
 
-            # Copy files to source folder
-            copied_count = 0
-            skipped_count = 0
+            # Import in the background so the UI stays responsive; progress is shown
+            # in the status bar and thumbnails appear as the files arrive.
+            self._start_import(image_files, source_folder, announce=not unsupported_files)
 
-            for file_path in image_files:
-                try:
-                    filename = os.path.basename(file_path)
-                    destination = os.path.join(source_folder, filename)
+        except Exception as e:
+            messagebox.showerror("Drop Error", f"Failed to process dropped files: {e}", parent=self)
 
-                    # Check if file already exists
-                    if os.path.exists(destination):
-                        skipped_count += 1
-                        continue
+    def _start_import(self, files: list[str], source_folder: str, announce: bool = True):
+        """Start a background import job for dropped files (see _run_import)."""
+        job = {
+            'total': len(files),
+            'copied': 0,
+            'skipped': 0,
+            'duplicates': 0,
+            'source_folder': source_folder,
+            'announce': announce,
+            'results': queue.Queue(),
+            'last_refresh': 0.0,
+        }
+        order_mode = self.import_order_var.get() if hasattr(self, 'import_order_var') else DEFAULT_IMPORT_ORDER
+        threading.Thread(target=_run_import, args=(files, source_folder, job['results'], order_mode), daemon=True).start()
+        self._show_progress(f"Importing 0/{job['total']}…", key=id(job))
+        self.after(100, lambda: self._poll_import(job))
+
+    def _poll_import(self, job: dict):
+        """Drain an import job's results on the Tk thread and update the UI."""
+        finished = False
+        arrived = False
+        try:
+            while True:
+                item = job['results'].get_nowait()
+                if item[0] == 'done':
+                    finished = True
+                    break
+                _kind, _src, _dst, outcome = item
+                if outcome in (IMPORT_LINKED, IMPORT_COPIED):
+                    job['copied'] += 1
+                    arrived = True
+                elif outcome == IMPORT_DUPLICATE:
+                    job['duplicates'] += 1
+                else:
+                    job['skipped'] += 1
+        except queue.Empty:
+            pass
 
-                    # Copy the file
-                    shutil.copy2(file_path, destination)
-                    copied_count += 1
-                except Exception:
-                    skipped_count += 1
+        done_count = job['copied'] + job['skipped'] + job['duplicates']
+        # Refresh the grid at most about once a second while files keep arriving;
+        # already-decoded thumbnails are reused so only the new files cost anything.
+        now = time.monotonic()
+        if (arrived and now - job['last_refresh'] >= 1.0) or finished:
+            job['last_refresh'] = now
+            if self.file_paths.get("source_folder") == job['source_folder']:
+                self.refresh_thumbnails(is_polling=True)
+
+        if not finished:
+            self._show_progress(f"Importing {done_count}/{job['total']}…", key=id(job))
+            self.after(150, lambda: self._poll_import(job))
+            return
 
-            # Show result message (only if no unsupported files warning was shown, or as a second message)
-            if not unsupported_files:
+        self._show_progress(None, key=id(job))
+        copied_count, skipped_count, duplicate_count = job['copied'], job['skipped'], job['duplicates']
+        # Show result message (only if no unsupported files warning was shown, or as a second message)
+        try:
+            if job['announce']:
                 msg = f"Copied {copied_count} image(s) to Source Folder."
+                if duplicate_count:
+                    msg += f"\n{duplicate_count} duplicate(s) of images already there were not copied."
                 if skipped_count:
                     msg += f"\n{skipped_count} file(s) skipped (already exist or failed)."
                 messagebox.showinfo("Files Copied", msg, parent=self)
-            elif copied_count > 0 or skipped_count > 0:
+            elif copied_count > 0 or skipped_count > 0 or duplicate_count > 0:
                 # Show a brief success message after the unsupported files warning
                 msg = f"Result: {copied_count} copied"
+                if duplicate_count:
+                    msg += f", {duplicate_count} duplicate(s)"
                 if skipped_count:
                     msg += f", {skipped_count} skipped"
                 messagebox.showinfo("Copy Complete", msg, parent=self)
+        except Exception:
+            pass
 
-            # Refresh thumbnails to show new images
-            self.refresh_thumbnails()
-
-        except Exception as e:
-            messagebox.showerror("Drop Error", f"Failed to process dropped files: {e}", parent=self)
+    def _show_progress(self, text, key='default'):
+        """Set the progress line for `key` (one line per running job) in the status bar,
+        or remove it when `text` is None. The bar is hidden when no job is running."""
+        lines = self.__dict__.setdefault('_progress_lines', {})
+        if text:
+            lines[key] = text
+        else:
+            lines.pop(key, None)
+        try:
+            if lines:
+                self.progress_label.config(text='\n'.join(lines.values()))
+                self.progress_label.grid(row=0, column=0, sticky='w', padx=(0, 6))
+            else:
+                self.progress_label.grid_remove()
+        except Exception:
+            pass
 
     def _parse_drop_files(self, data):
         """Parse the file paths from tkinterdnd2 drop event data.
@@ -845,7 +3606,8 @@ class ImageCroppingApp(TkinterDnD.Tk):
             # --- UPDATED SORTING LOGIC: SORT BY MODIFIED TIME ---
             # This ensures preview order matches the internal cropping sequence
             all_files = [p for p in Path(source).iterdir() if p.suffix.lower() in extensions and p.is_file()]
-            all_files.sort(key=lambda p: p.stat().st_mtime)
+            mtimes = {p.name: p.stat().st_mtime for p in all_files}
+            all_files.sort(key=lambda p: mtimes[p.name])
             current_files = [f.name for f in all_files]
         except:
             return
@@ -898,13 +3660,24 @@ class ImageCroppingApp(TkinterDnD.Tk):
         slot_width = thumb_size_px + padding_px
         num_cols = max(1, current_width // slot_width) if current_width > 1 else 2
 
+        # Decoded thumbnails keyed by (path, mtime, size); a rebuild (new files arriving
+        # during an import, a resize) only decodes the files it hasn't seen before.
+        # New ones come from the thumbnail cache shared with the Profile Editor,
+        # which persists on disk across restarts.
+        photo_cache = getattr(self, '_thumb_photo_cache', {})
+        next_cache = {}
+
         for idx, fname in enumerate(current_files):
             try:
                 img_path = os.path.join(source, fname)
-                # Open the image before creating a thumbnail
-                with Image.open(img_path) as img:
-                    img.thumbnail((thumb_size_px, thumb_size_px), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img.copy())
+                cache_key = (img_path, mtimes.get(fname), thumb_size_px)
+                photo = photo_cache.get(cache_key)
+                if photo is None:
+                    thumb = _editor.load_thumbnail(img_path, (thumb_size_px, thumb_size_px))
+                    if thumb is None:
+                        continue
+                    photo = ImageTk.PhotoImage(thumb)
+                next_cache[cache_key] = photo
 
                 label = tk.Label(self.thumb_frame, image=photo, bg="white", bd=1, relief="solid",
                                 highlightthickness=2, highlightbackground="#E0E0E0", highlightcolor="#E0E0E0")
@@ -929,6 +3702,7 @@ class ImageCroppingApp(TkinterDnD.Tk):
                     row += 2
             except Exception:
                 continue
+        self._thumb_photo_cache = next_cache
 
     def select_thumbnail(self, index):
         """Select a thumbnail by index and update visual feedback."""
@@ -1023,6 +3797,9 @@ class ImageCroppingApp(TkinterDnD.Tk):
 
     # ========================= CORE LOGIC =========================
     def run_move_only(self):
+        """Move cropped outputs and originals from the Source folder into a new
+        timestamped folder in the Destination (Crop & Move archives in its own pass).
+        """
         # Require a profile to be selected before moving
         try:
             profile_name = self.selected_profile.get()
@@ -1045,173 +3822,92 @@ class ImageCroppingApp(TkinterDnD.Tk):
             do_delete_after_move = bool(getattr(self, 'delete_move_var', None) and self.delete_move_var.get())
         except Exception:
             do_delete_after_move = False
-        if do_delete_after_move:
+        if do_delete_after_move and not self._confirm_delete_after_move():
             try:
-                pref = load_config('confirm_delete_after_moving')
-                show_dialog = True
-                if isinstance(pref, str) and pref != '':
-                    show_dialog = str(pref).lower() in ('1', 'true', 'yes', 'on')
+                self.status_label.config(text="Move cancelled.", foreground="red")
             except Exception:
-                show_dialog = True
-
-            if show_dialog:
-                confirmed, do_not_show_again = self._show_confirm_delete_after_move_dialog()
-                if not confirmed:
-                    try:
-                        self.status_label.config(text="Move cancelled.", foreground="red")
-                    except Exception:
-                        pass
-                    return
-                if do_not_show_again:
-                    try:
-                        save_config('confirm_delete_after_moving', 'False')
-                    except Exception:
-                        pass
-
-        timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-        new_archive_folder = os.path.join(destination_folder, timestamp)
+                pass
+            return
 
+        result = run_move_job(source_folder, profile_name, destination_folder, delete_after_move=do_delete_after_move)
         try:
-            os.makedirs(new_archive_folder, exist_ok=True)
-
-            # Determine which files are "cropped outputs" for this profile.
-            # This mirrors the naming used by run_cropping: <base_name>_suffix.ext
-            base_name = re.sub(r'[^a-zA-Z0-9_ -]', '', profile_name).replace(' ', '_').strip('_')
-            output_prefix = f"{base_name}_"
-            image_exts = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tiff", ".webp", ".heic", ".heif"}
-
-            all_files = [f for f in os.listdir(source_folder) if os.path.isfile(os.path.join(source_folder, f))]
-            # Files that look like cropped outputs (to be moved)
-            cropped_files = [f for f in all_files if f.startswith(output_prefix) and os.path.splitext(f)[1].lower() in image_exts]
-            # Originals are image files that are NOT cropped outputs
-            original_files = [f for f in all_files if os.path.splitext(f)[1].lower() in image_exts and f not in cropped_files]
-
-            moved_count = 0
-            deleted_count = 0
-
-            do_delete_after_move = bool(getattr(self, 'delete_move_var', None) and self.delete_move_var.get())
-
-            # If delete-after-moving is enabled we will copy outputs then delete originals.
-            # Otherwise we simply move the outputs (previous behavior changed to only move outputs).
-            # Use the already-imported send2trash function from the top of the file
-            send2trash_fn = send2trash if do_delete_after_move else None
-
-            created_out_paths = set()
-
-            # Move or copy files. If delete-after-moving is enabled we copy
-            # outputs then delete originals; otherwise move everything (both
-            # cropped outputs and the original image files) so the Source
-            # folder is emptied by the Move action.
-            if do_delete_after_move:
-                # Copy outputs to archive; originals will be deleted below.
-                for fname in cropped_files:
-                    src = os.path.join(source_folder, fname)
-                    dst = os.path.join(new_archive_folder, fname)
-                    try:
-                        shutil.copy2(src, dst)
-                        moved_count += 1
-                        created_out_paths.add(os.path.abspath(dst))
-                    except Exception:
-                        # skip failures per-file
-                        continue
+            if result['status'] != 'done':
+                self.status_label.config(text=result['message'], foreground="red")
             else:
-                # Move both cropped outputs and any original images so nothing is left behind.
-                all_to_move = []
-                # preserve order: move cropped outputs first then originals
-                all_to_move.extend(cropped_files)
-                # add originals that are not already in cropped_files
-                for f in original_files:
-                    if f not in cropped_files:
-                        all_to_move.append(f)
-
-                for fname in all_to_move:
-                    src = os.path.join(source_folder, fname)
-                    dst = os.path.join(new_archive_folder, fname)
-                    try:
-                        shutil.move(src, dst)
-                        moved_count += 1
-                        created_out_paths.add(os.path.abspath(dst))
-                    except Exception:
-                        # skip failures per-file
-                        continue
-
-            # If delete-after-moving is enabled: delete source copies of the cropped outputs first,
-            # then delete original image files (not the cropped outputs)
-            if do_delete_after_move:
-                # First delete the source copies of the cropped outputs (we copied them above)
-                for fname in cropped_files:
-                    try:
-                        src_path = os.path.abspath(os.path.join(source_folder, fname))
-                        if src_path in created_out_paths:
-                            # very unlikely, but don't delete if equal to created output
-                            continue
-                        if os.path.isfile(src_path):
-                            try:
-                                if send2trash_fn:
-                                    try:
-                                        send2trash_fn(src_path)
-                                        deleted_count += 1
-                                    except Exception:
-                                        try:
-                                            os.remove(src_path)
-                                            deleted_count += 1
-                                        except Exception:
-                                            pass
-                                else:
-                                    try:
-                                        os.remove(src_path)
-                                        deleted_count += 1
-                                    except Exception:
-                                        pass
-                            except Exception:
-                                pass
-                    except Exception:
-                        continue
-
-                # Then delete the original image files (which are distinct from cropped outputs)
-                if original_files:
-                    for fname in original_files:
-                        try:
-                            orig_path = os.path.abspath(os.path.join(source_folder, fname))
-                            # Skip if somehow orig_path equals a created output
-                            if orig_path in created_out_paths:
-                                continue
-                            if os.path.isfile(orig_path):
-                                try:
-                                    if send2trash_fn:
-                                        try:
-                                            send2trash_fn(orig_path)
-                                            deleted_count += 1
-                                        except Exception:
-                                            try:
-                                                os.remove(orig_path)
-                                                deleted_count += 1
-                                            except Exception:
-                                                pass
-                                    else:
-                                        try:
-                                            os.remove(orig_path)
-                                            deleted_count += 1
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    pass
-                        except Exception:
-                            continue
+                self.status_label.config(text=result['message'], foreground=("green" if result['moved'] or result['deleted'] else "red"))
+        except Exception:
+            pass
 
-            # Update status
+    def _check_interrupted_runs(self):
+        """Offer to resume or roll back runs whose journal was left behind by a crash."""
+        for path in find_interrupted_journals():
+            records = _read_journal(path)
+            begin = records[0] if records and records[0].get('event') == 'begin' else {}
+            kind = 'Crop' if begin.get('kind') == 'crop' else 'Move'
+            started = ''
             try:
-                if deleted_count:
-                    self.status_label.config(text=f"Moved {moved_count} files to {timestamp}. Deleted {deleted_count} original file(s).", foreground="green")
-                else:
-                    self.status_label.config(text=f"Moved {moved_count} files to {timestamp}", foreground=("green" if moved_count else "red"))
+                started = datetime.fromtimestamp(float(begin.get('t'))).strftime('%Y-%m-%d %H:%M:%S')
             except Exception:
                 pass
+            try:
+                choice = messagebox.askyesnocancel(
+                    "Interrupted Run",
+                    f"A {kind} run started {started} did not finish.\n"
+                    f"Source: {begin.get('source', '?')}\n\n"
+                    "Yes: resume it (finish the pending moves/deletions)\n"
+                    "No: roll it back (move files back, remove its outputs)\n"
+                    "Cancel: decide later")
+            except Exception:
+                return
+            if choice is None:
+                continue
+            try:
+                if choice:
+                    summary = resume_journal(path)
+                    text = f"Resumed interrupted run: moved {summary['moved']}, deleted {summary['trashed']} file(s)."
+                    if summary['unwritten']:
+                        text += f" {summary['unwritten']} crop(s) were not written; run Crop again."
+                else:
+                    summary = rollback_journal(path)
+                    text = f"Rolled back interrupted run: restored {summary['restored']}, removed {summary['removed']} file(s)."
+                    if summary['in_trash']:
+                        text += f" {summary['in_trash']} original(s) are in the Trash."
+                self.status_label.config(text=text, foreground="green")
+            except Exception as e:
+                log.warning("journal recovery failed for %s: %s", path, e)
+        try:
+            self.refresh_thumbnails()
+        except Exception:
+            pass
 
-        except Exception as e:
-            self.status_label.config(text=f"Move failed: {e}", foreground="red")
+    def _confirm_delete_after_move(self) -> bool:
+        """Show the delete-after-move confirmation unless the user opted out.
+        Returns False if the user cancelled.
+        """
+        try:
+            pref = load_config('confirm_delete_after_moving')
+            show_dialog = True
+            if isinstance(pref, str) and pref != '':
+                show_dialog = str(pref).lower() in ('1', 'true', 'yes', 'on')
+        except Exception:
+            show_dialog = True
+
+        if show_dialog:
+            confirmed, do_not_show_again = self._show_confirm_delete_after_move_dialog()
+            if not confirmed:
+                return False
+            if do_not_show_again:
+                try:
+                    save_config('confirm_delete_after_moving', 'False')
+                except Exception:
+                    pass
+        return True
 
     def run_cropping(self, save_after=False):
+        if getattr(self, '_crop_job', None) is not None:
+            self.status_label.config(text="A crop is already running.", foreground="red")
+            return
+
         # Before starting, if the user has enabled delete-originals, maybe prompt for confirmation.
         try:
             delete_enabled = bool(getattr(self, 'delete_original_var', None) and self.delete_original_var.get())
@@ -1246,6 +3942,20 @@ class ImageCroppingApp(TkinterDnD.Tk):
                     except Exception:
                         pass
 
+        # Crop & Move archives in the same pass, so ask the delete-after-move question up front
+        delete_after_move = False
+        if save_after:
+            try:
+                delete_after_move = bool(getattr(self, 'delete_move_var', None) and self.delete_move_var.get())
+            except Exception:
+                delete_after_move = False
+            if delete_after_move and not self._confirm_delete_after_move():
+                try:
+                    self.status_label.config(text="Crop & Move cancelled.", foreground="red")
+                except Exception:
+                    pass
+                return
+
         profile_name = self.selected_profile.get()
         source_folder = self.file_paths["source_folder"]
 
@@ -1262,285 +3972,319 @@ class ImageCroppingApp(TkinterDnD.Tk):
             self.status_label.config(text="No source folder selected.", foreground="red")
             return
 
-        rules_map = load_profile_rules(profile_name)
-        if not rules_map: return
-
-        extensions = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tif", ".tiff", ".webp", ".heic", ".heif"}
-        image_paths = sorted(
-            [p for p in Path(source_folder).iterdir() if p.suffix.lower() in extensions and p.is_file()],
-            key=lambda p: p.stat().st_mtime)
-
-        # Snapshot the initial list of originals (absolute paths) so we have
-        # a stable index to refer to during deletion. This prevents newly
-        # created cropped files in the same folder from shifting positions.
-        initial_originals = [str(p.resolve()) for p in image_paths]
-
-        if not image_paths:
-            self.status_label.config(text="No images found in source folder.", foreground="red")
+        # Sets mode: the folder holds several products; each set gets its own output folder
+        sets_mode = self.sets_mode_var.get() if hasattr(self, 'sets_mode_var') else DEFAULT_SETS_MODE
+        if sets_mode not in SETS_MODES:
+            sets_mode = DEFAULT_SETS_MODE
+        destination_folder = self.file_paths.get("destination_folder", "")
+        has_destination = bool(destination_folder and os.path.isdir(destination_folder))
+        if sets_mode != 'off' and not has_destination:
+            try:
+                messagebox.showwarning("Destination Required", "Sets mode writes each set into its own folder. Please select a Destination Folder first.")
+            except Exception:
+                pass
             return
 
-        base_name = re.sub(r'[^a-zA-Z0-9_ -]', '', profile_name).replace(' ', '_').strip('_')
-
-        processed_count = 0
-        skipped_count = 0
-        # Track originals that were actually processed and outputs we created.
-        # We'll delete originals after processing if the user enabled the checkbox.
-        processed_originals: set[str] = set()
-        created_out_paths: set[str] = set()
-        # Precompute sorted rule positions for fallback lookups
-        sorted_rule_positions = sorted([p for p in rules_map.keys()])
-
-        # Informative diagnostics for debugging
         try:
-            self.status_label.config(text=f"Loaded profile '{profile_name}' with {len(sorted_rule_positions)} rule(s). Found {len(image_paths)} image(s).", foreground="black")
+            delete_originals = bool(getattr(self, 'delete_original_var', None) and self.delete_original_var.get())
         except Exception:
-            pass
-
-        # Build the complete list of (rule_index, position, rule) applications
-        # by iterating rules in file order. Rules that target an explicit position
-        # are applied to that position. Rules with apply_to_all_remaining=True
-        # are applied to any positions that don't already have an explicit rule
-        # (and that haven't been filled yet by an earlier apply_all).
-        applications: list[tuple[int, int, dict]] = []  # (rule_index, position, rule)
-
-        # Flatten all rules in file order based on their stored _rule_index
-        all_rules: list[dict] = []
-        for p in sorted(rules_map.keys()):
-            for r in rules_map.get(p, []):
-                all_rules.append(r)
-        all_rules.sort(key=lambda rr: int(rr.get('_rule_index', 999999)))
+            delete_originals = False
 
-        image_count = len(image_paths)
-        # positions that have explicit rules in the profile (do not override these)
-        explicit_positions = set(rules_map.keys())
-        # positions already assigned by an earlier apply_all
-        filled_by_apply_all: set[int] = set()
+        # Crop & Move writes the outputs straight into a new timestamped archive folder
+        # and archives the originals in the same pass (see run_crop_job). The job runs on
+        # a coordinator thread, like run_stations, so the window stays responsive.
+        job = {'done': 0, 'total': 0, 'result': None}
 
-        for rule in all_rules:
-            rule_index = int(rule.get('_rule_index', 999999))
+        def _progress(done, total):
+            job['done'], job['total'] = done, total
 
-            # If this rule targets an explicit position, apply it there
+        def _run():
             try:
-                rule_pos = int(rule.get('position', rule.get('position_number', 0)))
-            except Exception:
-                rule_pos = 0
-
-            if 1 <= rule_pos <= image_count:
-                applications.append((rule_index, rule_pos, rule))
-
-            # If this rule requests apply-to-all, apply it to any positions that
-            # don't already have an explicit rule and haven't already been filled
-            # (and that haven't been filled yet by an earlier apply_all).
-            if rule.get('apply_to_all_remaining'):
-                for p in range(1, image_count + 1):
-                    if p in explicit_positions:
-                        # explicit rule exists for this position; skip
-                        continue
-                    if p in filled_by_apply_all:
-                        # already filled by an earlier apply_all
-                        continue
-                    # Assign this apply_all rule to position p
-                    applications.append((rule_index, p, rule))
-                    filled_by_apply_all.add(p)
-
-        # If no applications were created, nothing applies
-        if not applications:
-            self.status_label.config(text="No rules applicable to images.", foreground="red")
+                job['result'] = run_crop_job(
+                    source_folder, profile_name, destination_folder,
+                    move=bool(save_after and has_destination),
+                    delete_originals=delete_originals,
+                    delete_after_move=delete_after_move,
+                    sets_mode=sets_mode, progress=_progress)
+            except Exception as e:
+                job['result'] = {'status': 'error', 'message': str(e), 'processed': 0}
+
+        self._crop_job = job
+        threading.Thread(target=_run, daemon=True).start()
+        self.after(200, lambda: self._poll_cropping(job, save_after and not has_destination))
+
+    def _poll_cropping(self, job: dict, move_after: bool):
+        """Refresh the crop's progress line until its job finishes, then report the result."""
+        if job['result'] is None:
+            self._show_progress(f"Cropping: {job['done']}/{job['total'] or '?'}", key='crop')
+            self.after(200, lambda: self._poll_cropping(job, move_after))
             return
-
-        # Sort applications by rule file-order so outputs follow the rule listing order.
-        applications.sort(key=lambda t: t[0])
-
-        # Now perform cropping in the order of applications; name files sequentially a,b,c...
-        def _suffix_for_index(i: int) -> str:
-            # 1 -> a, 2 -> b, ... 26 -> z, 27 -> 27, 28 -> 28, etc.
-            if 1 <= i <= 26:
-                return chr(96 + i)
-            return str(i)
-
-        for app_idx, (rule_index, position, rule) in enumerate(applications, start=1):
-            # Map position to image path (guard bounds)
-            if position <= 0 or position > len(image_paths):
-                # invalid position — skip
-                continue
-            img_path = image_paths[position - 1]
-
+        self._crop_job = None
+        self._show_progress(None, key='crop')
+        result = job['result']
+        if result['status'] != 'done':
+            self.status_label.config(text=result['message'], foreground="red")
+            return
+        if move_after:
+            self.run_move_only()
+            return
+        self.status_label.config(text=result['message'], foreground=("green" if result['processed'] else "red"))
+
+    def run_stations(self, stations: list[dict] | None = None):
+        """Crop & Move every station (source, profile, destination) concurrently. Each job
+        runs on its own coordinator thread; the crops of all jobs share the fair crop pool,
+        and each station gets its own progress line in the main window."""
+        stations = load_stations() if stations is None else stations
+        if not stations:
             try:
-                with Image.open(img_path) as source_img:
-                    # Determine whether this application came from an apply_all rule
-                    # that originates from another position. If so, and if that
-                    # originating rule's crop equals the originating image's full
-                    # dimensions and the aspect_ratio is 'none', then the user's
-                    # intent is likely to keep the target image at its original
-                    # size — so do not force the originating image dimensions.
-                    use_original_size_for_target = False
-                    try:
-                        rule_origin_pos = int(rule.get('position', rule.get('position_number', 0)))
-                    except Exception:
-                        rule_origin_pos = 0
-
-                    if 1 <= rule_origin_pos <= len(image_paths) and rule_origin_pos != position and rule.get('aspect_ratio', 'none') == 'none':
-                        try:
-                            # get the originating image path and inspect its crop
-                            origin_path = image_paths[rule_origin_pos - 1]
-                            with Image.open(origin_path) as origin_img:
-                                c_rule = rule.get('crop', {})
-                                try:
-                                    rx1 = int(c_rule.get('x1', 0))
-                                    ry1 = int(c_rule.get('y1', 0))
-                                    rx2 = int(c_rule.get('x2', origin_img.width))
-                                    ry2 = int(c_rule.get('y2', origin_img.height))
-                                except Exception:
-                                    rx1, ry1, rx2, ry2 = 0, 0, origin_img.width, origin_img.height
-
-                                # if the rule's crop exactly matches the origin's full size
-                                if rx1 == 0 and ry1 == 0 and rx2 == origin_img.width and ry2 == origin_img.height:
-                                    use_original_size_for_target = True
-                        except Exception:
-                            # if anything fails, fall back to normal cropping
-                            use_original_size_for_target = False
-
-                    if use_original_size_for_target:
-                        # create an un-cropped copy of the target image
-                        cropped_img = source_img.copy()
-                        # mark coordinates as full-target so later logic treats it as full image
-                        x1, y1, x2, y2 = 0, 0, source_img.width, source_img.height
-                    else:
-                        c = rule.get('crop', {})
-                        try:
-                            x1 = int(c.get('x1', 0))
-                            y1 = int(c.get('y1', 0))
-                            x2 = int(c.get('x2', source_img.width))
-                            y2 = int(c.get('y2', source_img.height))
-                        except Exception:
-                            continue
-
-                        x1 = max(0, min(x1, source_img.width - 1))
-                        y1 = max(0, min(y1, source_img.height - 1))
-                        x2 = max(0, min(x2, source_img.width))
-                        y2 = max(0, min(y2, source_img.height))
-                        if x2 <= x1 or y2 <= y1:
-                            continue
-
-                        cropped_img = source_img.crop((x1, y1, x2, y2))
-
-                    suf = _suffix_for_index(app_idx)
-                    # Convert HEIC/HEIF images to JPEG
-                    original_ext = img_path.suffix.lower()
-                    if original_ext in ('.heic', '.heif'):
-                        output_ext = '.jpg'
-                    else:
-                        output_ext = img_path.suffix
-                    output_file_name = f"{base_name}_{suf}{output_ext}"
-                    out_path = os.path.join(source_folder, output_file_name)
-
-                    compression_percent = int(rule.get('compression', rule.get('compression_percent', 0)))
-
-                    # If no compression requested and the crop is the full image, prefer
-                    # to re-save via Pillow at high quality to strip EXIF, otherwise fall back
-                    # to copying bytes. For cropped images we must save the cropped image.
-                    is_full_image = (x1 == 0 and y1 == 0 and x2 == source_img.width and y2 == source_img.height)
-
-                    try:
-                        if compression_percent <= 0 and is_full_image:
-                            # Try re-saving at high quality (95) which removes metadata.
-                            try:
-                                _save_image_preset(source_img, out_path, quality=95)
-                                try:
-                                    now = time.time()
-                                    os.utime(out_path, (now, now))
-                                except Exception:
-                                    pass
-                            except Exception:
-                                # Fallback: copy original bytes and update mtime.
-                                try:
-                                    src_path = os.path.abspath(img_path)
-                                    dst_path = os.path.abspath(out_path)
-                                    if src_path != dst_path:
-                                        shutil.copy2(src_path, dst_path)
-                                        try:
-                                            now = time.time()
-                                            os.utime(dst_path, (now, now))
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    pass
-                        else:
-                            # Save cropped image; map compression percent to Pillow quality.
-                            if compression_percent <= 0:
-                                _save_image_preset(cropped_img, out_path, quality=95)
-                            else:
-                                pillow_quality = max(1, min(95, int(round(95 * (100 - compression_percent) / 100))))
-                                _save_image_preset(cropped_img, out_path, quality=pillow_quality)
-                    except Exception:
-                        # Best-effort fallback: try saving with defaults
-                        try:
-                            _save_image_preset(cropped_img, out_path, quality=95)
-                        except Exception:
-                            pass
+                messagebox.showinfo("No Stations", "Add stations under Actions → Stations... first.", parent=self)
+            except Exception:
+                pass
+            return
+        try:
+            delete_after_move = bool(getattr(self, 'delete_move_var', None) and self.delete_move_var.get())
+        except Exception:
+            delete_after_move = False
+        if delete_after_move and not self._confirm_delete_after_move():
+            return
 
-                    # record that this original was processed and note the new output path
-                    try:
-                        processed_originals.add(str(img_path))
-                        created_out_paths.add(os.path.abspath(out_path))
-                    except Exception:
-                        pass
+        jobs = []
+        for station in stations:
+            job = {
+                'name': os.path.basename(os.path.normpath(station['source'])) or station['source'],
+                'done': 0,
+                'total': 0,
+                'result': None,
+            }
 
-                    processed_count += 1
-            except Exception:
-                continue
+            def _progress(done, total, job=job):
+                job['done'], job['total'] = done, total
 
-        # If the user enabled deletion of original images, remove the originals that were processed.
-        deleted_count = 0
-        if getattr(self, 'delete_original_var', None) and self.delete_original_var.get() and processed_originals:
-            # Prefer moving files to the OS Trash using send2trash for safety.
-            # Use the already-imported send2trash function from the top of the file
-            send2trash_fn = send2trash
-
-            # Iterate the initial snapshot so deletions target the original
-            # files that were present at the start of the crop operation.
-            for orig in list(initial_originals):
+            def _run(station=station, job=job, progress=_progress):
                 try:
-                    # We now delete ALL originals that existed at the start,
-                    # regardless of whether a rule processed them. This matches
-                    # the requested behavior: remove every original image.
-                    orig_abspath = os.path.abspath(orig)
-                    # Never delete an output we just created by this run
-                    if orig_abspath in created_out_paths:
-                        continue
-                    if os.path.isfile(orig_abspath):
-                        try:
-                            if send2trash_fn:
-                                try:
-                                    send2trash_fn(orig_abspath)
-                                    deleted_count += 1
-                                except Exception:
-                                    try:
-                                        os.remove(orig_abspath)
-                                        deleted_count += 1
-                                    except Exception:
-                                        pass
-                            else:
-                                try:
-                                    os.remove(orig_abspath)
-                                    deleted_count += 1
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-                except Exception:
-                    continue
+                    job['result'] = run_crop_job(station['source'], station['profile'], station.get('destination', ''),
+                                                 move=True, delete_after_move=delete_after_move, progress=progress)
+                except Exception as e:
+                    job['result'] = {'status': 'error', 'message': str(e), 'processed': 0}
+
+            jobs.append(job)
+            threading.Thread(target=_run, daemon=True).start()
+        self.after(200, lambda: self._poll_stations(jobs))
+
+    def _poll_stations(self, jobs: list[dict]):
+        """Refresh per-station progress lines until every station job has finished."""
+        for job in jobs:
+            if job['result'] is None:
+                text = f"{job['name']}: {job['done']}/{job['total'] or '?'}"
+            else:
+                text = f"{job['name']}: {job['result']['message']}"
+            self._show_progress(text, key=id(job))
+        if any(job['result'] is None for job in jobs):
+            self.after(200, lambda: self._poll_stations(jobs))
+            return
+        # leave the final lines up briefly so the operator can read them
+        self.after(8000, lambda: [self._show_progress(None, key=id(job)) for job in jobs])
+        try:
+            self.refresh_thumbnails()
+        except Exception:
+            pass
 
-        # Final status message
-        if save_after:
-            self.run_move_only()
-        else:
-            msg = f"Finished cropping {processed_count} image(s)."
-            if skipped_count:
-                msg += f" Skipped {skipped_count} image(s) with no matching rule."
-            if deleted_count:
-                msg += f" Deleted {deleted_count} original file(s)."
-            self.status_label.config(text=msg, foreground=("green" if processed_count else "red"))
+    def _show_stations_dialog(self):
+        """Edit the station list: each row is a (Source folder, profile, Destination folder) job."""
+        dlg = tk.Toplevel(self)
+        dlg.title("Stations")
+        dlg.transient(self)
+        stations = load_stations()
+
+        tree = ttk.Treeview(dlg, columns=('source', 'profile', 'destination'), show='headings', height=8)
+        for col, title, width in (('source', 'Source Folder', 260), ('profile', 'Profile', 140), ('destination', 'Destination Folder', 260)):
+            tree.heading(col, text=title)
+            tree.column(col, width=width)
+        tree.grid(row=0, column=0, columnspan=5, sticky='nsew', padx=10, pady=10)
+        dlg.grid_columnconfigure(0, weight=1)
+        dlg.grid_rowconfigure(0, weight=1)
+
+        def _reload():
+            tree.delete(*tree.get_children())
+            for i, st in enumerate(stations):
+                tree.insert('', 'end', iid=str(i), values=(st['source'], st['profile'], st.get('destination', '')))
+
+        def _add():
+            profile = self.selected_profile.get()
+            if not profile or profile == "— No Profile Selected —":
+                messagebox.showwarning("Profile Required", "Select the station's profile in the main window first.", parent=dlg)
+                return
+            source = filedialog.askdirectory(title="Station Source Folder", parent=dlg)
+            if not source:
+                return
+            destination = filedialog.askdirectory(title="Station Destination Folder", parent=dlg)
+            if not destination:
+                return
+            stations.append({'source': source, 'profile': profile, 'destination': destination})
+            save_stations(stations)
+            _reload()
+
+        def _remove():
+            for iid in sorted((int(i) for i in tree.selection()), reverse=True):
+                del stations[iid]
+            save_stations(stations)
+            _reload()
+
+        ttk.Button(dlg, text="Add (uses selected profile)...", command=_add).grid(row=1, column=0, sticky='w', padx=10, pady=(0, 10))
+        ttk.Button(dlg, text="Remove", command=_remove).grid(row=1, column=1, padx=5, pady=(0, 10))
+        ttk.Button(dlg, text="Crop & Move All", command=lambda: (dlg.destroy(), self.run_stations(stations))).grid(row=1, column=2, padx=5, pady=(0, 10))
+        ttk.Button(dlg, text="Queue All", command=lambda: (dlg.destroy(), self.enqueue_stations(stations))).grid(row=1, column=3, padx=5, pady=(0, 10))
+        ttk.Button(dlg, text="Close", command=dlg.destroy).grid(row=1, column=4, padx=(5, 10), pady=(0, 10))
+        _reload()
+
+    # ========================= JOB QUEUE =========================
+    def _mark_jobs_dirty(self):
+        # called from job worker threads; the Tk thread picks it up in _poll_job_queue
+        self._jobs_dirty = True
+
+    def _poll_job_queue(self):
+        """Show queue activity in the progress bar and refresh views when jobs change."""
+        try:
+            if self._jobs_dirty and self.job_queue is not None:
+                self._jobs_dirty = False
+                jobs = self.job_queue.recent()
+                running = sum(1 for j in jobs if j['status'] == 'running')
+                queued = sum(1 for j in jobs if j['status'] == 'queued')
+                if running or queued:
+                    self._show_progress(f"Jobs: {running} running, {queued} queued", key='job_queue')
+                else:
+                    self._show_progress(None, key='job_queue')
+                    self.refresh_thumbnails()
+                refresh_dialog = getattr(self, '_job_dialog_reload', None)
+                if refresh_dialog is not None:
+                    refresh_dialog(jobs)
+        except Exception as e:
+            log.warning("job queue poll failed: %s", e)
+        self.after(1000, self._poll_job_queue)
+
+    def _enqueue(self, kind: str, params: dict, priority: int = 0):
+        if self.job_queue is None:
+            messagebox.showerror("Job Queue", "The job queue is not available.", parent=self)
+            return None
+        job_id = self.job_queue.enqueue(kind, params, priority)
+        self._mark_jobs_dirty()
+        if self.job_runner is not None:
+            self.job_runner.wake()
+        return job_id
+
+    def _api_port(self) -> int:
+        try:
+            return int(load_config("api_port") or DEFAULT_API_PORT)
+        except Exception:
+            return DEFAULT_API_PORT
+
+    def _set_api_running(self, running: bool) -> bool:
+        """Start or stop the local API server; returns whether it is running."""
+        if running and self._stop_api is None and self.job_queue is not None:
+            try:
+                def _on_enqueue():
+                    self._mark_jobs_dirty()
+                    if self.job_runner is not None:
+                        self.job_runner.wake()
+                self._stop_api = start_api_server(self.job_queue, self._api_port(), on_enqueue=_on_enqueue)
+            except Exception as e:
+                log.error("API server failed to start: %s", e)
+                return False
+        elif not running and self._stop_api is not None:
+            self._stop_api()
+            self._stop_api = None
+        return self._stop_api is not None
+
+    def _on_api_toggled(self):
+        wanted = bool(self.api_enabled_var.get())
+        running = self._set_api_running(wanted)
+        save_config("api_enabled", "True" if running else "False")
+        if wanted and not running:
+            messagebox.showerror("Local API", f"Could not listen on {API_HOST}:{self._api_port()}. Is the port in use?", parent=self)
+            self.api_enabled_var.set(False)
+
+    def enqueue_current_crop(self):
+        """Queue a Crop & Move of the current Source folder with the selected profile."""
+        profile_name = self.selected_profile.get()
+        if not profile_name or profile_name == "— No Profile Selected —":
+            messagebox.showwarning("Profile Required", "Please select a profile before proceeding.")
+            return
+        source_folder = self.file_paths.get("source_folder", "")
+        destination_folder = self.file_paths.get("destination_folder", "")
+        if not source_folder or not destination_folder:
+            messagebox.showwarning("Folders Required", "Please select a Source and a Destination Folder first.")
+            return
+        delete_after_move = bool(getattr(self, 'delete_move_var', None) and self.delete_move_var.get())
+        if delete_after_move and not self._confirm_delete_after_move():
+            return
+        sets_mode = self.sets_mode_var.get() if hasattr(self, 'sets_mode_var') else DEFAULT_SETS_MODE
+        self._enqueue('crop', {'source': source_folder, 'profile': profile_name, 'destination': destination_folder,
+                               'move': True, 'delete_after_move': delete_after_move, 'sets_mode': sets_mode})
+
+    def enqueue_stations(self, stations: list[dict]):
+        """Queue a Crop & Move job per station."""
+        for station in stations:
+            self._enqueue('crop', {'source': station['source'], 'profile': station['profile'],
+                                   'destination': station.get('destination', ''), 'move': True})
+
+    def _show_job_queue_dialog(self):
+        """Inspect and manage the persistent job queue."""
+        if self.job_queue is None:
+            messagebox.showerror("Job Queue", "The job queue is not available.", parent=self)
+            return
+        dlg = tk.Toplevel(self)
+        dlg.title("Job Queue")
+        dlg.transient(self)
+        columns = (('id', 'ID', 50), ('kind', 'Kind', 70), ('priority', 'Priority', 60), ('status', 'Status', 80),
+                   ('created', 'Queued', 140), ('message', 'Result', 380))
+        tree = ttk.Treeview(dlg, columns=[c[0] for c in columns], show='headings', height=14)
+        for col, title, width in columns:
+            tree.heading(col, text=title)
+            tree.column(col, width=width, anchor='w')
+        tree.grid(row=0, column=0, columnspan=6, sticky='nsew', padx=10, pady=10)
+        dlg.grid_columnconfigure(0, weight=1)
+        dlg.grid_rowconfigure(0, weight=1)
+
+        def _reload(jobs=None):
+            if not dlg.winfo_exists():
+                return
+            selected = tree.selection()
+            tree.delete(*tree.get_children())
+            for job in (jobs if jobs is not None else self.job_queue.recent()):
+                created = datetime.fromtimestamp(job['created']).strftime('%Y-%m-%d %H:%M:%S')
+                tree.insert('', 'end', iid=str(job['id']), values=(job['id'], job['kind'], job['priority'], job['status'], created, job['message']))
+            for iid in selected:
+                if tree.exists(iid):
+                    tree.selection_add(iid)
+
+        def _each_selected(action):
+            for iid in tree.selection():
+                action(int(iid))
+            self._mark_jobs_dirty()
+            if self.job_runner is not None:
+                self.job_runner.wake()
+            _reload()
+
+        def _bump(delta):
+            def _apply(job_id):
+                job = self.job_queue.get(job_id)
+                if job:
+                    self.job_queue.set_priority(job_id, job['priority'] + delta)
+            _each_selected(_apply)
+
+        def _close():
+            self._job_dialog_reload = None
+            dlg.destroy()
+
+        ttk.Button(dlg, text="Refresh", command=_reload).grid(row=1, column=0, sticky='w', padx=10, pady=(0, 10))
+        ttk.Button(dlg, text="Priority +", command=lambda: _bump(1)).grid(row=1, column=1, padx=5, pady=(0, 10))
+        ttk.Button(dlg, text="Priority −", command=lambda: _bump(-1)).grid(row=1, column=2, padx=5, pady=(0, 10))
+        ttk.Button(dlg, text="Cancel Job", command=lambda: _each_selected(self.job_queue.cancel)).grid(row=1, column=3, padx=5, pady=(0, 10))
+        ttk.Button(dlg, text="Retry", command=lambda: _each_selected(self.job_queue.retry)).grid(row=1, column=4, padx=5, pady=(0, 10))
+        ttk.Button(dlg, text="Close", command=_close).grid(row=1, column=5, padx=(5, 10), pady=(0, 10))
+        dlg.protocol("WM_DELETE_WINDOW", _close)
+        self._job_dialog_reload = _reload
+        _reload()
 
     # ========================= HELPERS =========================
     def refresh_profile_dropdown(self):
@@ -1706,39 +4450,49 @@ class ImageCroppingApp(TkinterDnD.Tk):
             pass
 
     def create_profile_window(self):
-        # Prefer the delegated flag when frozen so the bootloader runs our
-        # delegated handler which imports the embedded profile_editor from sys._MEIPASS.
-        try:
-            if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-                # Invoke the same exe with a flag the __main__ handles
-                self.profile_process = subprocess.Popen([sys.executable, '--run-cropping-gui'])
-                self.check_profile_process()
-                return
-        except Exception:
-            pass
-
-        # Non-frozen: run the local script next to the module
-        target_script = os.path.join(os.path.dirname(__file__), "profile_editor.py")
-        if os.path.exists(target_script):
-            self.profile_process = subprocess.Popen([sys.executable, target_script])
-            self.check_profile_process()
+        self._open_profile_editor()
 
     def edit_profile_window(self):
         profile_path = filedialog.askopenfilename(initialdir=CONFIG_FOLDER, filetypes=(("Profile Files", "*.profile"),))
         if not profile_path:
             return
+        self._open_profile_editor(profile_path)
+
+    def _open_profile_editor(self, profile_path: str | None = None):
+        """Open the Profile Editor as a Toplevel of this window. Running in this process
+        it starts instantly and shares the thumbnail/preview caches and config.csv; the
+        profile list is refreshed whenever the editor saves, duplicates or deletes a
+        profile, and once more when it closes. Falls back to a separate process if the
+        editor window can't be opened here."""
+        try:
+            editor = _editor.open_cropping_window(parent=self, profile_file_path=profile_path,
+                                                  on_profiles_changed=self.refresh_profile_dropdown)
+        except Exception as e:
+            log.warning("could not open the profile editor in-process: %s", e)
+            self._spawn_profile_editor(profile_path)
+            return
+        if editor is not None:
+            window = editor.winfo_toplevel()
+            window.bind('<Destroy>', lambda e, w=window: self.refresh_profile_dropdown() if e.widget is w else None, add='+')
+
+    def _spawn_profile_editor(self, profile_path: str | None = None):
+        """Run the Profile Editor as a separate process and refresh the profile list when it exits."""
+        extra = [profile_path] if profile_path else []
+        # Prefer the delegated flag when frozen so the bootloader runs our
+        # delegated handler which imports the embedded profile_editor from sys._MEIPASS.
         try:
             if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-                # delegate to the frozen exe which will import the embedded module
-                self.profile_process = subprocess.Popen([sys.executable, '--run-cropping-gui', profile_path])
+                # Invoke the same exe with a flag the __main__ handles
+                self.profile_process = subprocess.Popen([sys.executable, '--run-cropping-gui'] + extra)
                 self.check_profile_process()
                 return
         except Exception:
             pass
 
+        # Non-frozen: run the local script next to the module
         target_script = os.path.join(os.path.dirname(__file__), "profile_editor.py")
         if os.path.exists(target_script):
-            self.profile_process = subprocess.Popen([sys.executable, target_script, profile_path])
+            self.profile_process = subprocess.Popen([sys.executable, target_script] + extra)
             self.check_profile_process()
 
     def check_profile_process(self):
@@ -1750,7 +4504,6 @@ class ImageCroppingApp(TkinterDnD.Tk):
 
     def create_menubar(self):
         # Build a traditional top menubar (File, Edit, Select, Actions)
-        import traceback
         try:
             self.menubar = tk.Menu(self)
 
@@ -1800,6 +4553,18 @@ class ImageCroppingApp(TkinterDnD.Tk):
                     self.edit_menu.add_checkbutton(label='Delete Original Images after Moving', variable=self.delete_move_var)
                 except Exception:
                     pass
+            # Import order for dropped images (persisted in config.csv)
+            self.import_order_menu = tk.Menu(self.edit_menu, tearoff=0)
+            for _mode, _label in IMPORT_ORDER_MODES.items():
+                self.import_order_menu.add_radiobutton(label=_label, value=_mode, variable=self.import_order_var)
+            self.edit_menu.add_cascade(label='Order Dropped Images By', menu=self.import_order_menu)
+            # Multi-set batching: crop several products from one Source folder per run
+            self.sets_menu = tk.Menu(self.edit_menu, tearoff=0)
+            for _mode, _label in SETS_MODES.items():
+                self.sets_menu.add_radiobutton(label=_label, value=_mode, variable=self.sets_mode_var)
+            self.edit_menu.add_cascade(label='Split Source into Sets', menu=self.sets_menu)
+            self.edit_menu.add_separator()
+            self.edit_menu.add_checkbutton(label=f'Enable Local API ({API_HOST}:{self._api_port()})', variable=self.api_enabled_var)
             # Removed divider and 'Preferences...' per user request
             self.menubar.add_cascade(label='Edit', menu=self.edit_menu)
 
@@ -1808,23 +4573,31 @@ class ImageCroppingApp(TkinterDnD.Tk):
             self.actions_menu.add_command(label='Crop', command=lambda: self.run_cropping(save_after=False), accelerator=f'{mod_key}+R')
             self.actions_menu.add_command(label='Crop & Move', command=lambda: self.run_cropping(save_after=True), accelerator=f'{mod_key}+Shift+R')
             self.actions_menu.add_command(label='Move', command=lambda: self.run_move_only(), accelerator=f'{mod_key}+M')
+            self.actions_menu.add_separator()
+            # Several photo stations (Source folders) cropped concurrently from one window
+            self.actions_menu.add_command(label='Stations...', command=lambda: self._show_stations_dialog())
+            self.actions_menu.add_command(label='Crop & Move All Stations', command=lambda: self.run_stations())
+            self.actions_menu.add_separator()
+            # Persistent job queue: queue work now, it runs in the background (and after a restart)
+            self.actions_menu.add_command(label='Queue Crop & Move', command=lambda: self.enqueue_current_crop())
+            self.actions_menu.add_command(label='Job Queue...', command=lambda: self._show_job_queue_dialog())
             self.menubar.add_cascade(label='Actions', menu=self.actions_menu)
 
             # --- Help menu (previously 'Info') ---
             self.info_menu = tk.Menu(self.menubar, tearoff=0)
             # Support link updated to the Image Splitter Pro release/post URL
-            self.info_menu.add_command(label='Support Us', command=lambda: webbrowser.open('https://www.abelxl.com/2026/01/image-splitter-pro.html'))
+            self.info_menu.add_command(label='Support Us', command=lambda: _open_url('https://www.abelxl.com/2026/01/image-splitter-pro.html'))
             # Open the project repository so users can check releases/updates
-            self.info_menu.add_command(label='Check for Updates', command=lambda: webbrowser.open('https://github.com/AbelXL/Image-Splitter-Pro'))
+            self.info_menu.add_command(label='Check for Updates', command=lambda: _open_url('https://github.com/AbelXL/Image-Splitter-Pro'))
             # New: quick links to file issues on GitHub
             self.info_menu.add_separator()
             self.info_menu.add_command(
                 label='Report a Bug',
-                command=lambda: webbrowser.open('https://github.com/AbelXL/Image-Splitter-Pro/issues/new?template=submit-bug-report.md')
+                command=lambda: _open_url('https://github.com/AbelXL/Image-Splitter-Pro/issues/new?template=submit-bug-report.md')
             )
             self.info_menu.add_command(
                 label='Request a Feature',
-                command=lambda: webbrowser.open('https://github.com/AbelXL/Image-Splitter-Pro/issues/new?template=request-a-feature.md')
+                command=lambda: _open_url('https://github.com/AbelXL/Image-Splitter-Pro/issues/new?template=request-a-feature.md')
             )
             # Version displayed as a disabled menu item
             self.info_menu.add_command(label='Version 1.0.0', state='disabled')
@@ -1874,11 +4647,10 @@ class ImageCroppingApp(TkinterDnD.Tk):
             try:
                 self.update_menu_state()
             except Exception:
-                traceback.print_exc()
+                log.exception("update_menu_state failed")
         except Exception:
-            # If menu creation fails, print the traceback so the user can see why
-            print("[ERROR] create_menubar: failed to create menubar")
-            traceback.print_exc()
+            # If menu creation fails, log the traceback so the user can see why
+            log.exception("create_menubar: failed to create menubar")
             return
 
     def update_menu_state(self):
@@ -1945,21 +4717,8 @@ class ImageCroppingApp(TkinterDnD.Tk):
             pass
 
     def open_profile_in_editor(self, profile_name: str):
-        """Open the specified profile in the external editor."""
-        profile_arg = os.path.join(CONFIG_FOLDER, f"{profile_name}.profile")
-        try:
-            if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-                self.profile_process = subprocess.Popen([sys.executable, '--run-cropping-gui', profile_arg])
-                self.check_profile_process()
-                return
-        except Exception:
-            pass
-
-        target_script = os.path.join(os.path.dirname(__file__), "profile_editor.py")
-        if os.path.exists(target_script):
-            # Pass the selected profile directly as an argument
-            self.profile_process = subprocess.Popen([sys.executable, target_script, profile_arg])
-            self.check_profile_process()
+        """Open the specified profile in the Profile Editor."""
+        self._open_profile_editor(os.path.join(CONFIG_FOLDER, f"{profile_name}.profile"))
 
     def _show_confirm_delete_dialog(self):
         """Show the confirmation dialog for delete-originals.
@@ -2011,7 +4770,7 @@ class ImageCroppingApp(TkinterDnD.Tk):
             # Return the result
             return confirmed[0], do_not_show_var.get()
         except Exception as e:
-            print(f"Error showing confirmation dialog: {e}")
+            log.error("could not show the confirmation dialog: %s", e)
             if dialog:
                 dialog.destroy()
         return False, False
@@ -2066,7 +4825,7 @@ class ImageCroppingApp(TkinterDnD.Tk):
             # Return the result
             return confirmed[0], do_not_show_var.get()
         except Exception as e:
-            print(f"Error showing confirmation dialog: {e}")
+            log.error("could not show the confirmation dialog: %s", e)
             if dialog:
                 dialog.destroy()
         return False, False
@@ -2220,7 +4979,11 @@ class ImageCroppingApp(TkinterDnD.Tk):
             return False, False
 
 if __name__ == "__main__":
+    # --log-level / --trace are consumed here so the checks below see the remaining arguments
+    sys.argv[1:] = _configure_logging(sys.argv[1:])
     try:
+        # Create/migrate the config folder before anything reads it (not at import time)
+        _ensure_config()
         # Diagnostic flag: print config locations and exit
         if len(sys.argv) >= 2 and sys.argv[1] == '--print-config':
             print(f"CONFIG_FOLDER={CONFIG_FOLDER}")
@@ -2228,47 +4991,76 @@ if __name__ == "__main__":
             print(f"sys.executable={sys.executable}")
             print(f"sys._MEIPASS={'<not set>' if not hasattr(sys, '_MEIPASS') else sys._MEIPASS}")
             sys.exit(0)
+        # Job queue from the command line:
+        #   --jobs                              list the queue (newest first)
+        #   --enqueue KIND key=value ...        queue a job (priority=N optional), e.g.
+        #       --enqueue crop source=/in profile=Shirts destination=/out priority=5
+        #   --cancel-job ID / --retry-job ID
+        #   --run-jobs                          run queued jobs in this process until the queue is empty
+        #   --serve-api [PORT]                  serve the local API and run jobs without the GUI
+        if len(sys.argv) >= 2 and sys.argv[1] in ('--jobs', '--enqueue', '--cancel-job', '--retry-job', '--run-jobs', '--serve-api'):
+            job_queue = JobQueue()
+            if sys.argv[1] == '--jobs':
+                for job in job_queue.recent():
+                    print(_format_job_row(job))
+            elif sys.argv[1] == '--enqueue':
+                if len(sys.argv) < 3:
+                    print(f"usage: --enqueue {{{'|'.join(JOB_KINDS)}}} key=value ...")
+                    sys.exit(2)
+                params = dict(arg.split('=', 1) for arg in sys.argv[3:] if '=' in arg)
+                try:
+                    priority = int(params.pop('priority', 0))
+                except ValueError:
+                    priority = None
+                if sys.argv[2] not in JOB_KINDS or priority is None:
+                    print(f"usage: --enqueue {{{'|'.join(JOB_KINDS)}}} key=value ... [priority=N]")
+                    sys.exit(2)
+                for flag in ('move', 'delete_originals', 'delete_after_move'):
+                    if flag in params:
+                        params[flag] = str(params[flag]).lower() in ('1', 'true', 'yes', 'on')
+                if 'files' in params:
+                    params['files'] = params['files'].split(os.pathsep)
+                print(job_queue.enqueue(sys.argv[2], params, priority))
+            elif sys.argv[1] in ('--cancel-job', '--retry-job'):
+                if len(sys.argv) < 3 or not sys.argv[2].isdigit():
+                    print(f"usage: {sys.argv[1]} ID")
+                    sys.exit(2)
+                action = job_queue.cancel if sys.argv[1] == '--cancel-job' else job_queue.retry
+                sys.exit(0 if action(int(sys.argv[2])) else 1)
+            elif sys.argv[1] == '--serve-api':
+                job_queue.requeue_interrupted()
+                runner = JobRunner(job_queue).start()
+                port = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_API_PORT
+                start_api_server(job_queue, port, on_enqueue=runner.wake)
+                print(f"API listening on http://{API_HOST}:{port}/jobs (token in {API_TOKEN_FILE})")
+                try:
+                    threading.Event().wait()
+                except KeyboardInterrupt:
+                    pass
+            else:
+                job_queue.requeue_interrupted()
+                JobRunner(job_queue).run_until_empty()
+            sys.exit(0)
         # Delegated runner: when the onefile exe is invoked as
         #   image_wizard.exe --run-cropping-gui [optional_profile_path]
         # we import and run the embedded profile_editor module instead of
         # launching a second copy of the full app.
         if len(sys.argv) >= 2 and sys.argv[1] == '--run-cropping-gui':
             profile_arg = sys.argv[2] if len(sys.argv) > 2 else None
-            # Locate profile_editor.py: prefer sys._MEIPASS when frozen
+            # profile_editor.py is already loaded (see PROFILE EDITOR MODULE)
             try:
-                if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
-                    target = os.path.join(sys._MEIPASS, 'profile_editor.py')
-                else:
-                    target = os.path.join(os.path.dirname(__file__), 'profile_editor.py')
-                if os.path.exists(target):
-                    import importlib.util
-                    spec = importlib.util.spec_from_file_location('embedded_profile_editor', target)
-                    if spec and spec.loader:
-                        mod = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(mod)
-                        if hasattr(mod, 'open_cropping_window'):
-                            try:
-                                mod.open_cropping_window(parent=None, profile_file_path=profile_arg)
-                            except TypeError:
-                                mod.open_cropping_window(parent=None)
-                        else:
-                            # Fallback: if module has no entrypoint, try running as script
-                            if hasattr(mod, '__file__'):
-                                run_target = mod.__file__
-                                subprocess.call([sys.executable, run_target] + ([profile_arg] if profile_arg else []))
-                        # After cropping GUI exits, terminate this process
-                        sys.exit(0)
+                _editor.open_cropping_window(parent=None, profile_file_path=profile_arg)
+                # After cropping GUI exits, terminate this process
+                sys.exit(0)
             except Exception:
                 # If anything fails, fall through to normal startup so user still gets the main app.
-                import traceback
-                traceback.print_exc()
+                log.exception("could not run the embedded profile editor")
 
-        print("[image_wizard] launching ImageCroppingApp...")
+        log.debug("launching ImageCroppingApp...")
         app = ImageCroppingApp()
-        print("[image_wizard] created app, entering mainloop")
+        log.debug("created app, entering mainloop")
         app.mainloop()
-        print("[image_wizard] mainloop exited")
+        log.debug("mainloop exited")
     except Exception:
         # Global exception handler: log any uncaught exceptions to the console
-        import traceback
-        traceback.print_exc()
+        log.exception("unhandled error")
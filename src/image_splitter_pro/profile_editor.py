@@ -11,6 +11,13 @@ from tkinter import messagebox
 from tkinter import simpledialog
 import csv
 import re
+import time
+import hashlib
+import threading
+import queue
+import logging
+import contextlib
+from collections import OrderedDict
 
 
 
@@ -21,14 +28,27 @@ import re
 #This project was developed with the assistance of AI logic-modeling to ensure high-performance image handling and a modern user experience.
 #This project is licensed under the **MIT License**. This means you are free to use, modify, and distribute the software, provided that the original copyright notice and this permission notice are included in all copies or substantial portions of the software.
 
-# Try to import ttkbootstrap if available. We keep a minimal, safe fallback so
+# ttkbootstrap is optional and imported the first time a window is built (see
+# _import_ttkbootstrap), so main.py can import this module for its shared image
+# helpers without paying for the theme package. We keep a minimal, safe fallback so
 # the module can run whether ttkbootstrap is installed (useful for bundling).
-try:
-    import ttkbootstrap as tb
-    TTB_AVAILABLE = True
-except Exception:
-    tb = None
-    TTB_AVAILABLE = False
+tb = None
+TTB_AVAILABLE = False
+_ttb_checked = False
+
+
+def _import_ttkbootstrap() -> bool:
+    """Import ttkbootstrap on first call; returns whether it is available."""
+    global tb, TTB_AVAILABLE, _ttb_checked
+    if not _ttb_checked:
+        _ttb_checked = True
+        try:
+            import ttkbootstrap as tb
+            TTB_AVAILABLE = True
+        except Exception:
+            tb = None
+            TTB_AVAILABLE = False
+    return TTB_AVAILABLE
 
 
 try:
@@ -39,13 +59,79 @@ except Exception:
     ImageTk = None
     PIL_AVAILABLE = False
 
-# HEIC support
-try:
-    from pillow_heif import register_heif_opener
-    register_heif_opener()
-    HEIC_SUPPORTED = True
-except ImportError:
-    HEIC_SUPPORTED = False
+# Diagnostics go through `logging`. Hosted by main.py this logger is a child of its
+# 'image_wizard' logger, so --log-level and --trace there apply here too; standalone,
+# only warnings and errors are shown.
+log = logging.getLogger('image_wizard.cropping_gui2')
+
+
+def _log_span(name: str, start: float, end: float, args: dict | None = None):
+    """Log a finished span (perf_counter start/end) at DEBUG; main.py's --trace
+    handler turns it into a trace event."""
+    log.debug('%s took %.1f ms', name, (end - start) * 1000, extra={'span': (name, start, end, args or {})})
+
+
+class _Span:
+    """Context manager timing a block as a span (see _span)."""
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None:
+            self.args['error'] = repr(exc)
+        _log_span(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+
+_NO_SPAN = contextlib.nullcontext()
+
+
+def _span(name: str, **args):
+    """`with _span('name', key=value):` times the block; a shared no-op context unless
+    DEBUG logging (or main.py's --trace) is on."""
+    if not log.isEnabledFor(logging.DEBUG):
+        return _NO_SPAN
+    return _Span(name, args)
+
+
+# HEIC support. pillow_heif is imported and registered the first time a HEIC/HEIF
+# file is opened (see _ensure_heif_opener), not on import; None until then.
+HEIC_SUPPORTED = None
+_heif_lock = threading.Lock()
+
+
+def _ensure_heif_opener(path) -> bool:
+    """Register pillow_heif's opener with Pillow before the first HEIC/HEIF file is
+    opened; returns immediately for other files. Returns whether HEIF can be read."""
+    global HEIC_SUPPORTED
+    if HEIC_SUPPORTED is not None or not str(path).lower().endswith(('.heic', '.heif')):
+        return bool(HEIC_SUPPORTED)
+    with _heif_lock:
+        if HEIC_SUPPORTED is None:
+            try:
+                from pillow_heif import register_heif_opener
+                register_heif_opener()
+                HEIC_SUPPORTED = True
+            except Exception:
+                HEIC_SUPPORTED = False
+    return HEIC_SUPPORTED
+
+
+# Per-profile output metadata policies (saved as the profile's 'metadata_policy' key).
+# Keys must match METADATA_POLICIES in main.py; values are the labels shown in the editor.
+METADATA_POLICY_LABELS = {
+    'strip': 'Strip all metadata',
+    'icc': 'Keep color profile (ICC)',
+    'icc_orientation_copyright': 'Keep ICC + orientation/copyright',
+}
 
 # Choose a resampling filter in a way that doesn't raise a static-analysis
 # error when PIL is not available. If PIL is present it will pick LANCZOS if
@@ -56,30 +142,421 @@ if PIL_AVAILABLE:
 else:
     _RESAMPLE_FILTER = None
 
+# EXIF orientation -> transpose that shows the stored pixels upright (mirrors
+# ImageOps.exif_transpose). Crop coordinates are edited in this upright space,
+# which is also the space the crop engine in main.py interprets them in.
+_ORIENTATION_TRANSPOSE = {}
+if PIL_AVAILABLE:
+    _ORIENTATION_TRANSPOSE = {
+        2: Image.Transpose.FLIP_LEFT_RIGHT,
+        3: Image.Transpose.ROTATE_180,
+        4: Image.Transpose.FLIP_TOP_BOTTOM,
+        5: Image.Transpose.TRANSPOSE,
+        6: Image.Transpose.ROTATE_270,
+        7: Image.Transpose.TRANSVERSE,
+        8: Image.Transpose.ROTATE_90,
+    }
+
+
+def _image_orientation(img) -> int:
+    """Return the EXIF orientation (1-8) of an opened image; 1 when missing or invalid."""
+    try:
+        orientation = int(img.getexif().get(0x0112, 1))
+    except Exception:
+        return 1
+    return orientation if orientation in _ORIENTATION_TRANSPOSE else 1
+
+
+# Maximum rate at which a crop drag writes the numeric X1/Y1/X2/Y2 fields; the
+# exact values are written once more when the mouse button is released.
+CROP_SYNC_HZ = 30
+
+
+# ====== Preview cache (outside the class) ======
+
+# Upper bound on the memory held by cached preview bitmaps (RGBA estimate).
+PREVIEW_CACHE_MAX_BYTES = 96 * 1024 * 1024
+
+
+class _PreviewCache:
+    """LRU cache of fitted, upright preview images keyed by (path, mtime, canvas size).
+
+    Switching between rules that show the same image (or back to a recent one)
+    reuses the bitmap instead of decoding and resizing the file again. A changed
+    file gets a new key through its mtime; the oldest entries are evicted once
+    the estimated size exceeds `max_bytes`. Safe to use from worker threads.
+    """
+
+    def __init__(self, max_bytes: int = PREVIEW_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: str, canvas_size: tuple) -> tuple | None:
+        """Cache key for `path` fitted to `canvas_size`; None if the file can't be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size, tuple(canvas_size))
+
+    def get(self, key):
+        """Return (image, original_size) for `key` and mark it recently used, or None."""
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0], entry[1]
+
+    def put(self, key, image, original_size: tuple):
+        if key is None or image is None:
+            return
+        cost = image.width * image.height * 4
+        if cost > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (image, tuple(original_size), cost)
+            self._bytes += cost
+            while self._bytes > self.max_bytes and self._entries:
+                _k, (_img, _size, freed) = self._entries.popitem(last=False)
+                self._bytes -= freed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+# One cache per process so every editor window shares it
+_preview_cache = _PreviewCache()
+
+
+def _fit_size(iw: int, ih: int, cw: int, ch: int) -> tuple:
+    """Size (w, h) that fits an iw x ih image inside a cw x ch canvas with an 8 px margin,
+    preserving the aspect ratio. Images that already fit keep their size."""
+    if iw <= cw and ih <= ch:
+        return iw, ih
+    img_ratio = iw / ih
+    canvas_ratio = cw / ch
+    # Guard: canvas may be very small during initial layout. Ensure
+    # computed new_w/new_h are at least 1 so Pillow.resize() never
+    # receives non-positive dimensions which raise an exception.
+    if img_ratio > canvas_ratio:
+        new_w = max(1, cw - 8)
+        new_h = max(1, round(new_w / img_ratio))
+    else:
+        new_h = max(1, ch - 8)
+        new_w = max(1, round(new_h * img_ratio))
+    return new_w, new_h
+
+
+def _decode_reduced(img, size: tuple):
+    """Decode `img` at the smallest integer downscale that is still at least `size`.
+
+    JPEGs are asked for a DCT-scaled draft (1/2, 1/4 or 1/8 decoded directly, so a
+    45 MP file never materializes at full resolution); other formats are decoded
+    and box-reduced by the largest whole factor. The final, high-quality resample
+    to `size` is left to the caller. Callers must read the original size first:
+    `img.size` changes here.
+    """
+    try:
+        if img.format == 'JPEG':
+            img.draft(None, size)
+            return img
+        factor = min(img.width // max(1, size[0]), img.height // max(1, size[1]))
+        if factor >= 2:
+            return img.reduce(factor)
+    except Exception:
+        pass
+    return img
+
+
+def _load_preview_image(path: str, canvas_size: tuple):
+    """Decode `path` and return (preview image, original size) where the preview is
+    upright (EXIF orientation applied) and fitted to `canvas_size`. The original size
+    is in upright space too, so saved crop coordinates match what the user sees.
+    Served from the shared preview cache when possible; raises if Pillow can't open the file.
+    """
+    key = _PreviewCache.key(path, canvas_size)
+    cached = _preview_cache.get(key)
+    if cached is not None:
+        return cached
+    cw, ch = canvas_size
+    _ensure_heif_opener(path)
+    img = Image.open(path)
+    orientation = _image_orientation(img)
+    original_iw, original_ih = img.size
+    if orientation in (5, 6, 7, 8):
+        original_iw, original_ih = original_ih, original_iw
+
+    new_w, new_h = _fit_size(original_iw, original_ih, cw, ch)
+    if (new_w, new_h) != (original_iw, original_ih):
+        # resize the stored pixels first so only the small preview gets transposed
+        raw_size = (new_h, new_w) if orientation in (5, 6, 7, 8) else (new_w, new_h)
+        img = _decode_reduced(img, raw_size)
+        if _RESAMPLE_FILTER is not None:
+            img = img.resize(raw_size, _RESAMPLE_FILTER)
+        else:
+            img = img.resize(raw_size)
+    else:
+        img.load()
+    if orientation != 1:
+        img = img.transpose(_ORIENTATION_TRANSPOSE[orientation])
+    _preview_cache.put(key, img, (original_iw, original_ih))
+    return img, (original_iw, original_ih)
+
+
+def _load_placeholder_image(path: str, canvas_size: tuple):
+    """Quick low-res stand-in for _load_preview_image: a 1/8-scale JPEG draft stretched
+    to the same fitted size, so the crop rectangle needn't move when the full preview
+    replaces it. Returns (image, original size), or None when no cheap version exists
+    (non-JPEG files, or images small enough to load directly)."""
+    _ensure_heif_opener(path)
+    with Image.open(path) as src:
+        if src.format != 'JPEG':
+            return None
+        orientation = _image_orientation(src)
+        original_iw, original_ih = src.size
+        if orientation in (5, 6, 7, 8):
+            original_iw, original_ih = original_ih, original_iw
+        new_w, new_h = _fit_size(original_iw, original_ih, *canvas_size)
+        if original_iw < new_w * 4:
+            return None
+        raw_size = (new_h, new_w) if orientation in (5, 6, 7, 8) else (new_w, new_h)
+        src.draft(None, (max(1, raw_size[0] // 8), max(1, raw_size[1] // 8)))
+        img = src.resize(raw_size, getattr(Image, 'BILINEAR', 2))
+    if orientation != 1:
+        img = img.transpose(_ORIENTATION_TRANSPOSE[orientation])
+    return img, (original_iw, original_ih)
+
+
+class _PreviewLoader:
+    """Single background thread that decodes editor previews and zoom levels.
+
+    Only the latest request is kept: asking for a new preview while one is queued
+    replaces it, and a load that is already running skips its full decode once a
+    newer request exists. Zoom levels (see _ImagePyramid) have their own latest-only
+    slot and wait behind a pending preview. Results go to `results` as
+    (generation, 'low'|'full'|'error', path, image or exception, original size), or
+    (generation, 'level', path, pyramid, level) once a pyramid level is built, for
+    the Tk thread to pick up.
+    """
+
+    def __init__(self):
+        self.results = queue.Queue()
+        self._cond = threading.Condition()
+        self._pending = None
+        self._level_pending = None
+        self._latest = 0
+        self._running = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='preview-loader', daemon=True)
+        self._thread.start()
+
+    def request(self, generation: int, path: str, canvas_size: tuple):
+        with self._cond:
+            self._pending = (generation, path, canvas_size)
+            self._latest = generation
+            self._cond.notify()
+
+    def request_level(self, generation: int, pyramid, k: int):
+        """Build level `k` of `pyramid` in the background (replaces any queued level)."""
+        with self._cond:
+            self._level_pending = (generation, pyramid, k)
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._pending = None
+            self._level_pending = None
+            self._cond.notify()
+
+    def busy(self, generation: int) -> bool:
+        """True while the load for `generation`, or any level build, is queued or running."""
+        with self._cond:
+            if self._level_pending is not None or (self._pending is not None and self._pending[0] == generation):
+                return True
+            return self._running is not None and (self._running[0] == 'level' or self._running[1] == generation)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and self._level_pending is None and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                if self._pending is not None:
+                    job, self._pending = ('preview', self._pending), None
+                else:
+                    job, self._level_pending = ('level', self._level_pending), None
+                self._running = (job[0], job[1][0])
+            try:
+                if job[0] == 'level':
+                    self._build_level(*job[1])
+                else:
+                    self._load_preview(*job[1])
+            finally:
+                with self._cond:
+                    self._running = None
+
+    def _load_preview(self, generation: int, path: str, canvas_size: tuple):
+        try:
+            with _span('preview placeholder', path=path):
+                low = _load_placeholder_image(path, canvas_size)
+            if low is not None:
+                self.results.put((generation, 'low', path, low[0], low[1]))
+            if self._latest == generation:
+                with _span('preview decode', path=path):
+                    img, original_size = _load_preview_image(path, canvas_size)
+                self.results.put((generation, 'full', path, img, original_size))
+        except Exception as e:
+            self.results.put((generation, 'error', path, e, None))
+
+    def _build_level(self, generation: int, pyramid, k: int):
+        try:
+            with _span('pyramid level', path=pyramid.path, level=k):
+                pyramid.build(k)
+            self.results.put((generation, 'level', pyramid.path, pyramid, k))
+        except Exception as e:
+            log.warning('zoom level %s of %s failed: %s', k, pyramid.path, e)
+
+
+# ====== Zoom pyramid (outside the class) ======
+
+# Deepest zoom: this many screen pixels per source pixel
+PREVIEW_MAX_MAGNIFICATION = 4
+
+
+class _ImagePyramid:
+    """Power-of-two levels of one source image, upright, built on demand.
+
+    Level k is the image downscaled by 2**k. The zoomed editor view renders its
+    visible region from the coarsest level that still has at least one source
+    pixel per screen pixel, so the work per redraw depends on the canvas size,
+    not the zoom. Levels are built on the _PreviewLoader thread (build) and read
+    without blocking on the Tk thread (get/nearest); only the level on screen and
+    the next coarser one are kept (keep), so a full-resolution level lives only
+    while the view is zoomed in that far. JPEG levels 1-3 are decoded directly at
+    that scale (DCT draft); others are box-reduced from a finer decode.
+    `size` is the upright size of the source, already known from its preview.
+    """
+
+    def __init__(self, path: str, size: tuple):
+        self.path = path
+        self.size = tuple(size)
+        self.mtime = None
+        self.levels = {}
+        self._lock = threading.Lock()
+        # format / EXIF orientation / stored size, read on the worker by _probe
+        self._info = None
+
+    def _probe(self):
+        if self._info is None:
+            _ensure_heif_opener(self.path)
+            with Image.open(self.path) as img:
+                self._info = (img.format, _image_orientation(img), img.size)
+        return self._info
+
+    def _decode(self, k: int):
+        _fmt, orientation, (w, h) = self._probe()
+        img = Image.open(self.path)
+        if k:
+            img.draft(None, (max(1, w >> k), max(1, h >> k)))
+        img.load()
+        if orientation != 1:
+            img = img.transpose(_ORIENTATION_TRANSPOSE[orientation])
+        return img
+
+    @staticmethod
+    def _reduce(img, factor: int):
+        if factor <= 1:
+            return img
+        try:
+            return img.reduce(factor)
+        except Exception:
+            return img.resize((max(1, img.width // factor), max(1, img.height // factor)))
+
+    def build(self, k: int):
+        """Build level `k` (k >= 0) from the nearest finer level held, else from a
+        decode; blocking, call from the loader thread."""
+        with self._lock:
+            img = self.levels.get(k)
+            finer = [j for j in self.levels if j < k]
+            base = max(finer) if finer else None
+            source = self.levels.get(base) if base is not None else None
+        if img is not None:
+            return img
+        if source is None:
+            fmt = self._probe()[0]
+            base = min(k, 3) if fmt == 'JPEG' else 0
+            source = self._decode(base)
+        img = self._reduce(source, 2 ** (k - base))
+        with self._lock:
+            self.levels[k] = img
+        return img
+
+    def get(self, k: int):
+        """Level `k` if it is built, else None (never blocks)."""
+        with self._lock:
+            return self.levels.get(k)
+
+    def nearest(self, k: int):
+        """The built level closest to `k` (finer first on ties), or None."""
+        with self._lock:
+            if not self.levels:
+                return None
+            return self.levels[min(self.levels, key=lambda j: (abs(j - k), j))]
+
+    def keep(self, k: int | None):
+        """Drop every level but `k` and `k + 1` (all of them for None)."""
+        with self._lock:
+            for j in list(self.levels):
+                if k is None or j not in (k, k + 1):
+                    del self.levels[j]
+
+    def level_for(self, source_per_screen: float) -> int:
+        """Coarsest level that keeps at least one source pixel per screen pixel."""
+        k = 0
+        while 2 ** (k + 1) <= source_per_screen and (self.size[0] >> (k + 1)) > 0:
+            k += 1
+        return k
+
 
-def open_cropping_window(parent=None, profile_file_path=None):
+def open_cropping_window(parent=None, profile_file_path=None, on_profiles_changed=None):
     """Open the full MinimalProfileEditor UI.
 
     If parent is None we create a new Tk root and run the mainloop. When used
     as an imported module the caller can provide a parent and embed the editor
-    into an existing event loop.
+    into an existing event loop; it then shares this process's preview and
+    thumbnail caches. `on_profiles_changed` is called after the editor saves,
+    duplicates or deletes a profile.
     """
-    print("[cropping_gui2] open_cropping_window called, parent=", parent)
+    log.debug('open_cropping_window called, parent=%s', parent)
+    _import_ttkbootstrap()
     created_root = False
     if parent is None:
         root = tk.Tk()
         created_root = True
-        # ensure a sensible default size so left controls are visible
-        try:
-            root.geometry('1000x600')
-        except Exception:
-            pass
     else:
         root = tk.Toplevel(parent)
         try:
             root.transient(parent)
         except Exception:
             pass
+    # ensure a sensible default size so left controls are visible
+    try:
+        root.geometry('1000x600')
+    except Exception:
+        pass
 
     try:
         root.title('Profile Editor')
@@ -87,9 +564,10 @@ def open_cropping_window(parent=None, profile_file_path=None):
         pass
 
     # Set Windows AppUserModelID FIRST for proper taskbar grouping and icon display
-    # This must be set before setting the icon
+    # This must be set before setting the icon. It is process-wide, so a hosted
+    # editor keeps the parent application's ID.
     try:
-        if sys.platform == 'win32':
+        if sys.platform == 'win32' and created_root:
             import ctypes
             # Set a unique AppUserModelID so Windows shows our custom icon in the taskbar
             myappid = 'ImageSplitterPro.CropEditor.1.0'
@@ -126,13 +604,14 @@ def open_cropping_window(parent=None, profile_file_path=None):
         if icon_path:
             # On Linux/Unix, wm_iconphoto is the standard method
             # On Windows, iconbitmap works better
+            # Hosted, only this Toplevel's icon is set (default=False), not the application's
             if sys.platform.startswith('linux') or sys.platform == 'darwin':
                 try:
                     # Use PIL.Image -> ImageTk.PhotoImage for Linux/Mac
                     if PIL_AVAILABLE:
                         img = Image.open(icon_path)
                         photo = ImageTk.PhotoImage(img)
-                        root.wm_iconphoto(True, photo)
+                        root.wm_iconphoto(created_root, photo)
                         # Keep reference to avoid garbage collection
                         root._app_icon = photo
                 except Exception:
@@ -146,7 +625,7 @@ def open_cropping_window(parent=None, profile_file_path=None):
                         if PIL_AVAILABLE:
                             img = Image.open(icon_path)
                             photo = ImageTk.PhotoImage(img)
-                            root.wm_iconphoto(True, photo)
+                            root.wm_iconphoto(created_root, photo)
                             root._app_icon = photo
                     except Exception:
                         pass
@@ -157,7 +636,8 @@ def open_cropping_window(parent=None, profile_file_path=None):
     # creating the root so the theme affects the widgets created below. We
     # keep this guarded so the module still works when ttkbootstrap isn't
     # installed (or not bundled) — the standard ttk theme will be used instead.
-    if TTB_AVAILABLE:
+    # A hosted editor inherits the parent application's (already applied) theme.
+    if TTB_AVAILABLE and created_root:
         try:
             # Create a Style instance which will apply the theme to ttk widgets.
             # Using 'cosmo' by default to match image_wizard's look.
@@ -174,7 +654,8 @@ def open_cropping_window(parent=None, profile_file_path=None):
     # Instantiate the editor frame and pack it to fill the window
     editor = None
     try:
-        editor = MinimalProfileEditor(root, initial_profile_path=profile_file_path)
+        editor = MinimalProfileEditor(root, initial_profile_path=profile_file_path,
+                                      on_profiles_changed=on_profiles_changed)
         editor.pack(fill='both', expand=True)
     except Exception:
         # Fallback: display a simple label if editor creation fails
@@ -188,7 +669,7 @@ def open_cropping_window(parent=None, profile_file_path=None):
     # support a quick --test auto-close mode for automated checks.
     if created_root:
         try:
-            print("[cropping_gui2] running mainloop (created_root=True)")
+            log.debug('running mainloop (created_root=True)')
             if '--test' in sys.argv:
                 try:
                     # schedule the window to close after a short delay for automated tests
@@ -211,36 +692,36 @@ def open_cropping_window(parent=None, profile_file_path=None):
             # Diagnostics: print environment and root state so we can debug
             # unexpected early mainloop exits when run from the user's setup.
             try:
-                print('[cropping_gui2] sys.argv=', sys.argv)
+                log.debug('sys.argv=%s', sys.argv)
             except Exception:
                 pass
             try:
-                print('[cropping_gui2] root.winfo_exists()=', int(bool(root.winfo_exists())))
+                log.debug('root.winfo_exists()=%d', int(bool(root.winfo_exists())))
             except Exception:
                 pass
             try:
-                print('[cropping_gui2] root.winfo_ismapped()=', int(bool(root.winfo_ismapped())))
+                log.debug('root.winfo_ismapped()=%d', int(bool(root.winfo_ismapped())))
             except Exception:
                 pass
             try:
-                print('[cropping_gui2] root.state()=', root.state())
+                log.debug('root.state()=%s', root.state())
             except Exception:
                 pass
             try:
-                print('[cropping_gui2] root children=', root.winfo_children())
+                log.debug('root children=%s', root.winfo_children())
             except Exception:
                 pass
             # Enter the Tk main loop normally
             root.mainloop()
             try:
-                print('[cropping_gui2] after mainloop root.winfo_exists()=', int(bool(root.winfo_exists())))
+                log.debug('after mainloop root.winfo_exists()=%d', int(bool(root.winfo_exists())))
             except Exception:
                 pass
             try:
-                print('[cropping_gui2] after mainloop root.winfo_children()=', root.winfo_children())
+                log.debug('after mainloop root.winfo_children()=%s', root.winfo_children())
             except Exception:
                 pass
-            print("[cropping_gui2] mainloop exited")
+            log.debug('mainloop exited')
         except Exception:
             pass
         return editor
@@ -281,6 +762,9 @@ def save_profile_to_path(profile: dict, path: str) -> bool:
         return False
 
 
+_config_memo = {}
+
+
 def load_config(setting: str) -> str:
     """Load a setting from config.csv located next to the running script/exe.
 
@@ -301,17 +785,156 @@ def load_config(setting: str) -> str:
 
     cfg_path = os.path.join(module_dir, 'config', 'config.csv')
 
-    if not os.path.exists(cfg_path):
+    # The parsed file is memoized until config.csv changes (the editor asks for the
+    # source folder on every rule switch).
+    try:
+        st = os.stat(cfg_path)
+    except OSError:
         return ""
+    stamp = (cfg_path, st.st_mtime_ns, st.st_size)
+    if _config_memo.get('stamp') != stamp:
+        values = {}
+        try:
+            with open(cfg_path, 'r', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                for row in reader:
+                    if len(row) >= 2 and row[0] not in values:
+                        values[row[0]] = row[1]
+        except Exception:
+            pass
+        _config_memo['stamp'] = stamp
+        _config_memo['values'] = values
+    return _config_memo['values'].get(setting, "")
+
+
+# ====== Thumbnail cache (outside the class) ======
+
+# Upright thumbnails shared by the Source Images dialog and the main window. One
+# canonical size is kept on disk (so thumbnails survive restarts and are shared
+# between windows) and scaled down to each view's box in memory.
+THUMB_CACHE_FOLDER = os.path.join(CONFIG_FOLDER, 'thumbs')
+THUMB_CACHE_BOX = (256, 256)
+THUMB_CACHE_MAX_FILES = 5000
+_thumb_memory = _PreviewCache(max_bytes=32 * 1024 * 1024)
+_thumb_prune_started = threading.Event()
+
+
+def _thumb_cache_file(path: str, st: os.stat_result) -> str:
+    digest = hashlib.blake2b(f'{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}'.encode('utf-8'),
+                             digest_size=16).hexdigest()
+    return os.path.join(THUMB_CACHE_FOLDER, digest + '.png')
+
+
+def _prune_thumbnail_cache():
+    """Delete the oldest cached thumbnails once there are more than THUMB_CACHE_MAX_FILES."""
+    try:
+        entries = [e for e in os.scandir(THUMB_CACHE_FOLDER) if e.name.endswith('.png')]
+        if len(entries) <= THUMB_CACHE_MAX_FILES:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for e in entries[:len(entries) - int(THUMB_CACHE_MAX_FILES * 0.8)]:
+            try:
+                os.remove(e.path)
+            except OSError:
+                pass
+    except Exception:
+        pass
+
+
+def _load_base_thumbnail(path: str, st: os.stat_result):
+    """Canonical (THUMB_CACHE_BOX) thumbnail of `path`, read from the disk cache or made
+    and stored there. Returns None if the image can't be read."""
+    cache_file = _thumb_cache_file(path, st)
+    try:
+        with Image.open(cache_file) as cached:
+            cached.load()
+            return cached
+    except Exception:
+        pass
     try:
-        with open(cfg_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) >= 2 and row[0] == setting:
-                    return row[1]
+        _ensure_heif_opener(path)
+        with Image.open(path) as img:
+            orientation = _image_orientation(img)
+            # thumbnail() lets JPEGs decode at a reduced (DCT) scale
+            img.thumbnail(THUMB_CACHE_BOX, _RESAMPLE_FILTER)
+            thumb = img.copy()
+    except Exception:
+        return None
+    if orientation != 1:
+        thumb = thumb.transpose(_ORIENTATION_TRANSPOSE[orientation])
+    if thumb.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P'):
+        thumb = thumb.convert('RGB')
+    try:
+        os.makedirs(THUMB_CACHE_FOLDER, exist_ok=True)
+        tmp_file = f'{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp'
+        thumb.save(tmp_file, 'PNG')
+        os.replace(tmp_file, cache_file)
+        if not _thumb_prune_started.is_set():
+            _thumb_prune_started.set()
+            threading.Thread(target=_prune_thumbnail_cache, daemon=True).start()
     except Exception:
         pass
-    return ""
+    return thumb
+
+
+def load_thumbnail(path: str, box: tuple):
+    """Return an upright PIL thumbnail of `path` that fits in `box` (width, height),
+    or None if the file can't be read. Safe to call from worker threads; turn the
+    result into a PhotoImage on the Tk thread."""
+    if not PIL_AVAILABLE:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size, tuple(box))
+    hit = _thumb_memory.get(key)
+    if hit is not None:
+        return hit[0]
+    base = _load_base_thumbnail(path, st)
+    if base is None:
+        return None
+    thumb = base.copy()
+    thumb.thumbnail(tuple(box), _RESAMPLE_FILTER)
+    _thumb_memory.put(key, thumb, base.size)
+    return thumb
+
+
+class _ThumbnailLoader:
+    """Background thread making thumbnails for the images a view currently shows.
+
+    request() replaces the outstanding work, so images scrolled past before their
+    turn are never decoded. Results go to `results` as (path, PIL image or None).
+    """
+
+    def __init__(self, box: tuple):
+        self.box = tuple(box)
+        self.results = queue.Queue()
+        self._cond = threading.Condition()
+        self._pending = []
+        self._closed = False
+        threading.Thread(target=self._run, name='thumbnail-loader', daemon=True).start()
+
+    def request(self, paths: list):
+        with self._cond:
+            self._pending = list(paths)
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._pending = []
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                path = self._pending.pop(0)
+            self.results.put((path, load_thumbnail(path, self.box)))
 
 
 class MinimalProfileEditor(tk.Frame):
@@ -599,13 +1222,21 @@ class MinimalProfileEditor(tk.Frame):
         except Exception:
             return orig
 
-    def __init__(self, master, initial_profile_path: str | None = None):
+    def __init__(self, master, initial_profile_path: str | None = None, on_profiles_changed=None):
+        _import_ttkbootstrap()
         super().__init__(master)
         self.master = master
+        # Called after a profile file is saved, duplicated or deleted (lets a hosting
+        # application refresh its profile list without polling)
+        self.on_profiles_changed = on_profiles_changed
+        # Stop this editor's background preview thread when it is closed
+        self.bind('<Destroy>', self._on_editor_destroy, add='+')
         # Track which rule outer frame is currently active (clicked/selected)
         self._active_rule_outer = None
         # Track updating state for crop inputs to prevent infinite loops
         self._updating_rule_crop_inputs = {}
+        # True while a crop drag writes the crop fields (see _sync_crop_drag)
+        self._syncing_crop_vars = False
         self.current_profile_path = None
         self.current_profile = {'profile_name': '', 'rules': []}
         # keep track of created rule boxes (each is a dict with 'outer' frame and 'label')
@@ -647,6 +1278,32 @@ class MinimalProfileEditor(tk.Frame):
         self.name_var = tk.StringVar(value='New Cropping Rule')
         ttk.Entry(top_name_row, textvariable=self.name_var, width=28).pack(side='left', padx=(8,0))
 
+        # Output metadata policy for the whole profile (default: strip, the historical behavior)
+        self.metadata_policy_var = tk.StringVar(value='strip')
+        try:
+            meta_row = ttk.Frame(left)
+            meta_row.pack(fill='x', padx=8, pady=(0, 4))
+            ttk.Label(meta_row, text='Metadata:').pack(side='left')
+            meta_label_var = tk.StringVar(value=METADATA_POLICY_LABELS['strip'])
+            meta_combo = ttk.Combobox(meta_row, textvariable=meta_label_var, state='readonly', width=28,
+                                      values=list(METADATA_POLICY_LABELS.values()))
+            meta_combo.pack(side='left', padx=(8, 0))
+
+            def _on_meta_label_changed(*args):
+                for key, label in METADATA_POLICY_LABELS.items():
+                    if label == meta_label_var.get() and self.metadata_policy_var.get() != key:
+                        self.metadata_policy_var.set(key)
+
+            def _on_meta_policy_changed(*args):
+                label = METADATA_POLICY_LABELS.get(self.metadata_policy_var.get(), METADATA_POLICY_LABELS['strip'])
+                if meta_label_var.get() != label:
+                    meta_label_var.set(label)
+
+            meta_label_var.trace_add('write', _on_meta_label_changed)
+            self.metadata_policy_var.trace_add('write', _on_meta_policy_changed)
+        except Exception:
+            pass
+
         # Container that will hold one or more rule boxes. New rules are added here.
         # Scrollable container that will hold one or more rule boxes. New rules
         # are added into an inner frame hosted by a Canvas so the user can
@@ -707,7 +1364,9 @@ class MinimalProfileEditor(tk.Frame):
                 pass
 
         try:
-            self.rules_canvas.bind_all('<MouseWheel>', _on_mousewheel)
+            # Bound on the editor's own window (not bind_all) so a hosting application's
+            # windows keep their scrolling
+            self.winfo_toplevel().bind('<MouseWheel>', _on_mousewheel, add='+')
         except Exception:
             pass
 
@@ -1088,7 +1747,7 @@ class MinimalProfileEditor(tk.Frame):
         self._updating_crop_inputs = False  # Flag to prevent infinite loops
 
         def _on_crop_input_changed(*args):
-            if self._updating_crop_inputs:
+            if self._updating_crop_inputs or self._syncing_crop_vars:
                 return
             try:
                 self._updating_crop_inputs = True
@@ -1278,12 +1937,25 @@ class MinimalProfileEditor(tk.Frame):
         self._crop_rect = None
         # map of handle canvas id -> handle name ('nw','ne','sw','se')
         self._crop_handles = {}
-        # drag data used while the user is interacting with the rectangle
-        self._crop_drag = {'action': None, 'handle': None, 'start_x': 0, 'start_y': 0, 'orig_rect': None}
+        # canvas id of the crop rectangle; it and the handles are created once and then moved
+        self._crop_rect_item = None
+        # drag data used while the user is interacting with the rectangle;
+        # 'x'/'y' hold the latest pointer position, applied once per idle pass;
+        # 'last_sync'/'sync_pending' rate-limit the field updates (see _sync_crop_drag)
+        self._crop_drag = {'action': None, 'handle': None, 'start_x': 0, 'start_y': 0, 'orig_rect': None,
+                           'x': 0, 'y': 0, 'pending': None, 'moved': False, 'last_sync': 0.0, 'sync_pending': None}
         # preview image bookkeeping to avoid GC and provide bounds before image loaded
         self._preview_image_ref = None
         self._preview_image_pos = (0, 0)
         self._preview_image_size = (0, 0)
+        # zoom/pan: the fitted preview is zoom 1; the pyramid backs deeper zooms
+        self._view_zoom = 1.0
+        self._preview_fit_image = None
+        self._preview_fit_size = (0, 0)
+        self._preview_path = None
+        self._preview_pyramid = None
+        self._view_render_pending = None
+        self._pan_start = None
         # Store original image dimensions (before scaling for preview) for accurate crop coordinate display
         self._original_image_size = (1, 1)
 
@@ -1294,6 +1966,24 @@ class MinimalProfileEditor(tk.Frame):
             self.canvas.bind('<ButtonRelease-1>', self._on_canvas_mouse_up)
             # when the canvas is resized we keep the rectangle as-is (image will be redrawn on new load)
             self.canvas.bind('<Configure>', lambda e: None)
+            # Zoom with the mouse wheel (around the pointer), pan by dragging with the
+            # middle or right button. Zooming all the way out returns to the fitted view.
+            self.canvas.bind('<MouseWheel>', self._on_canvas_wheel)
+            self.canvas.bind('<Button-4>', lambda e: self._zoom_preview(1.25, e.x, e.y))
+            self.canvas.bind('<Button-5>', lambda e: self._zoom_preview(0.8, e.x, e.y))
+            for button in (2, 3):
+                self.canvas.bind(f'<ButtonPress-{button}>', self._on_canvas_pan_start)
+                self.canvas.bind(f'<B{button}-Motion>', self._on_canvas_pan_move)
+        except Exception:
+            pass
+        # Cursor feedback for handles (helps users discover they can drag corners).
+        # Tag bindings belong to the canvas, so they are registered once here and
+        # apply to every handle item created later.
+        try:
+            c = self.canvas
+            for name, cursor in (('nw', 'size_nw_se'), ('se', 'size_nw_se'), ('ne', 'size_ne_sw'), ('sw', 'size_ne_sw')):
+                c.tag_bind(f'handle_{name}', '<Enter>', lambda e, canv=c, cur=cursor: canv.configure(cursor=cur))
+                c.tag_bind(f'handle_{name}', '<Leave>', lambda e, canv=c: canv.configure(cursor=''))
         except Exception:
             pass
 
@@ -1494,6 +2184,11 @@ class MinimalProfileEditor(tk.Frame):
                     self.current_profile_path = initial_profile_path
                     # Populate the name field from the explicitly provided profile
                     self.name_var.set(p.get('profile_name', os.path.splitext(os.path.basename(initial_profile_path))[0]))
+                    try:
+                        policy = p.get('metadata_policy', 'strip')
+                        self.metadata_policy_var.set(policy if policy in METADATA_POLICY_LABELS else 'strip')
+                    except Exception:
+                        pass
                     # populate UI rule boxes from loaded profile
                     try:
                         self._populate_rules_from_profile(p)
@@ -1509,6 +2204,19 @@ class MinimalProfileEditor(tk.Frame):
         # name unless the user explicitly loads or duplicates a profile.
         # Therefore we intentionally avoid selecting any profile here.
 
+    def _notify_profiles_changed(self):
+        if callable(self.on_profiles_changed):
+            try:
+                self.on_profiles_changed()
+            except Exception:
+                pass
+
+    def _on_editor_destroy(self, event):
+        if event.widget is self:
+            loader = getattr(self, '_preview_loader', None)
+            if loader is not None:
+                loader.close()
+
     def on_delete(self):
         """Delete the profile selected in the Edit Profiles list.
 
@@ -1575,6 +2283,7 @@ class MinimalProfileEditor(tk.Frame):
                 except Exception:
                     pass
                 return
+            self._notify_profiles_changed()
 
             # If the deleted file was the currently-loaded profile, clear it
             try:
@@ -1595,15 +2304,22 @@ class MinimalProfileEditor(tk.Frame):
                 pass
 
             # Close the window after successful deletion
-            try:
-                self.master.destroy()
-            except Exception:
+            self._close_window()
+        except Exception:
+            pass
+
+    def _close_window(self):
+        """Destroy the editor's window. Stopping the mainloop is only a fallback for a
+        standalone editor: hosted in another application's Toplevel, quit() would stop
+        that application's mainloop too."""
+        try:
+            self.master.destroy()
+        except Exception:
+            if isinstance(self.master, tk.Tk):
                 try:
                     self.master.quit()
                 except Exception:
                     pass
-        except Exception:
-            pass
 
     def _on_save_and_close(self):
         """Gather the UI data for all rules, save as JSON file named <ProfileName>.profile
@@ -1738,6 +2454,12 @@ class MinimalProfileEditor(tk.Frame):
 
             # keep profile_name for convenience, but image_wizard only requires top-level 'rules'
             profile = {'profile_name': name, 'rules': rules}
+            try:
+                policy = self.metadata_policy_var.get()
+                if policy in METADATA_POLICY_LABELS:
+                    profile['metadata_policy'] = policy
+            except Exception:
+                pass
 
             ok = save_profile_to_path(profile, path)
             if not ok:
@@ -1746,6 +2468,7 @@ class MinimalProfileEditor(tk.Frame):
                 except Exception:
                     pass
                 return
+            self._notify_profiles_changed()
 
             # update current profile and refresh list
             try:
@@ -1757,13 +2480,7 @@ class MinimalProfileEditor(tk.Frame):
                 pass
 
             # close the window (if it's a Toplevel or root)
-            try:
-                self.master.destroy()
-            except Exception:
-                try:
-                    self.master.quit()
-                except Exception:
-                    pass
+            self._close_window()
             return
         except Exception:
             try:
@@ -1877,6 +2594,8 @@ class MinimalProfileEditor(tk.Frame):
                 new_rules = src.get('rules', []) if src.get('rules') is not None else []
 
             new_profile = {'profile_name': new_name, 'rules': new_rules}
+            if src.get('metadata_policy') in METADATA_POLICY_LABELS:
+                new_profile['metadata_policy'] = src.get('metadata_policy')
             new_path = os.path.join(CONFIG_FOLDER, f"{new_name}.profile")
             ok = save_profile_to_path(new_profile, new_path)
             if not ok:
@@ -1885,6 +2604,7 @@ class MinimalProfileEditor(tk.Frame):
                 except Exception:
                     pass
                 return
+            self._notify_profiles_changed()
 
             try:
                 self.current_profile = new_profile
@@ -1954,15 +2674,16 @@ class MinimalProfileEditor(tk.Frame):
         except Exception:
             pass
 
-    def _open_image_preview(self, path: str):
-        """Load the image at `path` and display it centered and scaled in self.canvas.
-        Keeps a reference to the PhotoImage in self._preview_image_ref to avoid GC.
+    def _open_image_preview(self, path: str, on_ready=None):
+        """Load the image at `path` and display it scaled in self.canvas (see _show_preview).
+        Uncached images load in the background; `on_ready` is called once the preview
+        and its crop rectangle are in place.
         """
         try:
             # Diagnostics: if path doesn't exist, draw a helpful placeholder
             if not path or not os.path.exists(path):
                 try:
-                    print(f'[cropping_gui2] _open_image_preview: file not found: {path}')
+                    log.warning('_open_image_preview: file not found: %s', path)
                 except Exception:
                     pass
                 try:
@@ -1977,7 +2698,7 @@ class MinimalProfileEditor(tk.Frame):
 
             if not PIL_AVAILABLE:
                 try:
-                    print('[cropping_gui2] _open_image_preview: Pillow not available')
+                    log.warning('_open_image_preview: Pillow not available')
                 except Exception:
                     pass
                 try:
@@ -1990,64 +2711,160 @@ class MinimalProfileEditor(tk.Frame):
                     pass
                 return
 
-            # ensure canvas has up-to-date size
+            # Canvas size; a layout pass is only forced before the canvas is first mapped
             try:
-                self.canvas.update_idletasks()
-                cw = max(1, self.canvas.winfo_width())
-                ch = max(1, self.canvas.winfo_height())
+                cw = self.canvas.winfo_width()
+                ch = self.canvas.winfo_height()
+                if cw <= 1 or ch <= 1:
+                    self.canvas.update_idletasks()
+                    cw = max(1, self.canvas.winfo_width())
+                    ch = max(1, self.canvas.winfo_height())
             except Exception:
                 cw, ch = 800, 600
 
+            # A cached bitmap is shown right away; anything else is decoded on the
+            # preview worker so the event loop stays responsive (see _poll_preview_results).
+            generation = self._cancel_preview_load()
+            cached = _preview_cache.get(_PreviewCache.key(path, (cw, ch)))
+            if cached is not None:
+                self._show_preview(cached[0], cached[1], on_ready=on_ready, path=path)
+                return
+            self._preview_on_ready = on_ready
+            self._preview_placeholder_shown = False
+            # request -> result picked up on the Tk thread, logged as the 'preview load' span
+            self._preview_requested_at = time.perf_counter()
+            try:
+                self.canvas.delete('preview_loading')
+                self.canvas.create_text(max(1, cw) // 2, max(1, ch) // 2, text='Loading preview...', fill='#666',
+                                        font=('Segoe UI', 12), anchor='center', tags=('preview_loading',))
+            except Exception:
+                pass
+            if getattr(self, '_preview_loader', None) is None:
+                self._preview_loader = _PreviewLoader()
+            self._preview_loader.request(generation, path, (cw, ch))
+            self._schedule_preview_poll()
+        except Exception as e:
             try:
-                img = Image.open(path)
-            except Exception as e:
-                # failed to open image file despite existence
+                log.error('_open_image_preview: unexpected error while previewing %s: %s', path, e)
+            except Exception:
+                pass
+            # non-fatal: draw a non-blocking placeholder with diagnostic text
+            try:
+                self.canvas.delete('all')
+                w = max(1, self.canvas.winfo_width())
+                h = max(1, self.canvas.winfo_height())
+                txt = 'Preview not available\nAn unexpected error occurred while loading the image.'
+                self.canvas.create_text(w//2, h//2, text=txt, fill='#666', font=('Segoe UI', 12), anchor='center', width=int(w*0.9))
                 try:
-                    print(f'[cropping_gui2] _open_image_preview: Pillow failed to open {path}: {e}')
+                    self.preview_status_var.set('Preview not available (error)')
                 except Exception:
                     pass
-                try:
-                    self.canvas.delete('all')
-                    w = max(1, self.canvas.winfo_width())
-                    h = max(1, self.canvas.winfo_height())
-                    txt = f'Could not open image:\n{os.path.basename(path)}\n\n{str(e)}'
-                    self.canvas.create_text(w//2, h//2, text=txt, fill='#666', font=('Segoe UI', 12), anchor='center', width=int(w*0.9))
+            except Exception:
+                pass
+
+
+    def _cancel_preview_load(self) -> int:
+        """Invalidate any preview still loading (its result will be discarded) and
+        return the generation token for the next load."""
+        self._preview_generation = getattr(self, '_preview_generation', 0) + 1
+        try:
+            self.canvas.delete('preview_loading')
+        except Exception:
+            pass
+        return self._preview_generation
+
+    def _schedule_preview_poll(self):
+        if getattr(self, '_preview_poll_id', None) is None:
+            try:
+                self._preview_poll_id = self.after(25, self._poll_preview_results)
+            except Exception:
+                self._preview_poll_id = None
+
+    def _poll_preview_results(self):
+        """Apply finished preview loads from the worker. Results carry the generation
+        they were requested for; anything older than the current one is stale and
+        dropped. A low-res placeholder is shown first (with the crop rectangle already
+        in place) and its bitmap is swapped for the full preview when that arrives."""
+        self._preview_poll_id = None
+        loader = getattr(self, '_preview_loader', None)
+        if loader is None:
+            return
+        while True:
+            try:
+                generation, kind, path, payload, original_size = loader.results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'level':
+                # a zoom level finished: redraw if it belongs to the image still shown
+                if payload is self._preview_pyramid and self._view_zoom > 1.0 and self._view_render_pending is None:
+                    self._view_render_pending = self.after_idle(self._render_preview_view)
+                continue
+            if generation != getattr(self, '_preview_generation', 0):
+                continue
+            if kind != 'low' and log.isEnabledFor(logging.DEBUG):
+                _log_span('preview load', getattr(self, '_preview_requested_at', 0.0), time.perf_counter(),
+                          {'path': path, 'result': kind, 'placeholder': bool(self._preview_placeholder_shown)})
+            if kind == 'error':
+                self._cancel_preview_load()
+                self._show_preview_error(path, payload)
+            elif kind == 'low':
+                self._preview_placeholder_shown = True
+                self._show_preview(payload, original_size, on_ready=self._preview_on_ready, path=path)
+                self._preview_on_ready = None
+            elif self._preview_placeholder_shown and tuple(payload.size) == tuple(getattr(self, '_preview_fit_size', ())):
+                self._cancel_preview_load()
+                # keep the crop rectangle (and any zoom) and just swap in the sharp bitmap
+                self._preview_fit_image = payload
+                if getattr(self, '_view_zoom', 1.0) <= 1.0:
                     try:
-                        self.preview_status_var.set('Could not open image: ' + (os.path.basename(path) or '(no path)'))
+                        photo = ImageTk.PhotoImage(payload)
+                        self.canvas.itemconfigure(self._preview_image_item, image=photo)
+                        self._preview_image_ref = photo
                     except Exception:
-                        pass
-                except Exception:
-                    pass
-                return
-
-            # compute resized size preserving aspect ratio to fit into canvas
-            # Store original dimensions BEFORE any resizing
-            original_iw, original_ih = img.size
-
-            iw, ih = img.size
-            if iw > cw or ih > ch:
-                img_ratio = iw / ih
-                canvas_ratio = cw / ch
-                # Guard: canvas may be very small during initial layout. Ensure
-                # computed new_w/new_h are at least 1 so Pillow.resize() never
-                # receives non-positive dimensions which raise an exception.
-                if img_ratio > canvas_ratio:
-                    new_w = max(1, cw - 8)
-                    new_h = max(1, round(new_w / img_ratio))
-                else:
-                    new_h = max(1, ch - 8)
-                    new_w = max(1, round(new_h * img_ratio))
-                if _RESAMPLE_FILTER is not None:
-                    img = img.resize((new_w, new_h), _RESAMPLE_FILTER)
-                else:
-                    img = img.resize((new_w, new_h))
+                        self._show_preview(payload, original_size, path=path)
+            else:
+                self._cancel_preview_load()
+                self._show_preview(payload, original_size, on_ready=self._preview_on_ready, path=path)
+                self._preview_on_ready = None
+        # busy() is checked first: a result is queued before the worker goes idle
+        if loader.busy(getattr(self, '_preview_generation', 0)) or not loader.results.empty():
+            self._schedule_preview_poll()
+
+    def _show_preview_error(self, path: str, e):
+        # failed to open image file despite existence
+        try:
+            log.warning('_open_image_preview: Pillow failed to open %s: %s', path, e)
+        except Exception:
+            pass
+        try:
+            self.canvas.delete('all')
+            w = max(1, self.canvas.winfo_width())
+            h = max(1, self.canvas.winfo_height())
+            txt = f'Could not open image:\n{os.path.basename(path)}\n\n{str(e)}'
+            self.canvas.create_text(w//2, h//2, text=txt, fill='#666', font=('Segoe UI', 12), anchor='center', width=int(w*0.9))
+            try:
+                self.preview_status_var.set('Could not open image: ' + (os.path.basename(path) or '(no path)'))
+            except Exception:
+                pass
+        except Exception:
+            pass
 
+    def _show_preview(self, img, original_size: tuple, on_ready=None, path: str | None = None):
+        """Show the fitted preview `img` (see _load_preview_image) of `path` on the canvas
+        and set up the crop rectangle for the active rule. `original_size` is the upright
+        size of the source file. Keeps a reference to the PhotoImage in
+        self._preview_image_ref to avoid GC. The view starts un-zoomed.
+        `on_ready` runs afterwards (e.g. to apply the rule's aspect ratio).
+        """
+        original_iw, original_ih = original_size
+        try:
+            # `img` is already upright and fitted to the canvas (see _load_preview_image)
             photo = ImageTk.PhotoImage(img)
             # clear canvas and draw centered
             try:
                 self.canvas.delete('all')
                 # place image at top-left of the canvas per request
-                self.canvas.create_image(0, 0, image=photo, anchor='nw')
+                self._preview_image_item = self.canvas.create_image(0, 0, image=photo, anchor='nw')
                 # remember the displayed image bounds so crop interactions can be clamped
                 try:
                     # new_w/new_h exist when resizing was applied above; otherwise use original
@@ -2060,6 +2877,14 @@ class MinimalProfileEditor(tk.Frame):
                 self._original_image_size = (original_iw, original_ih)
                 # keep reference to avoid GC
                 self._preview_image_ref = photo
+                # zoom/pan state: the fitted image is zoom 1 (see _zoom_preview)
+                self._preview_fit_image = img
+                self._preview_fit_size = (iw, ih)
+                if path != self._preview_path:
+                    # release the previous image's pyramid (it may hold a full-resolution level)
+                    self._preview_pyramid = None
+                self._preview_path = path
+                self._view_zoom = 1.0
                 # initialize crop rectangle: prefer saved coords for active rule, otherwise use full preview
                 # Note: _crop_rect is kept in PREVIEW space. Saved values are in ORIGINAL space and need conversion.
                 try:
@@ -2201,34 +3026,204 @@ class MinimalProfileEditor(tk.Frame):
                 pass
         except Exception as e:
             try:
-                print(f'[cropping_gui2] _open_image_preview: unexpected error while previewing {path}: {e}')
+                log.error('_show_preview: unexpected error: %s', e)
             except Exception:
                 pass
-            # non-fatal: draw a non-blocking placeholder with diagnostic text
+        if callable(on_ready):
             try:
-                self.canvas.delete('all')
-                w = max(1, self.canvas.winfo_width())
-                h = max(1, self.canvas.winfo_height())
-                txt = 'Preview not available\nAn unexpected error occurred while loading the image.'
-                self.canvas.create_text(w//2, h//2, text=txt, fill='#666', font=('Segoe UI', 12), anchor='center', width=int(w*0.9))
-                try:
-                    self.preview_status_var.set('Preview not available (error)')
-                except Exception:
-                    pass
+                on_ready()
+            except Exception:
+                pass
+
+    # --- Zoom and pan ---
+    def _on_canvas_wheel(self, event):
+        try:
+            factor = 1.25 if event.delta > 0 else 0.8
+        except Exception:
+            return
+        self._zoom_preview(factor, event.x, event.y)
+        # don't let the rules list's global wheel binding scroll it as well
+        return 'break'
+
+    def _zoom_preview(self, factor: float, cx: float, cy: float):
+        """Zoom the preview by `factor`, keeping the image point under (cx, cy) in place.
+
+        While zoomed the preview behaves like a larger image placed at a (negative)
+        _preview_image_pos, so the crop rectangle stays in canvas space and every
+        existing clamp and conversion keeps working, with finer steps per source pixel.
+        """
+        try:
+            if self._preview_fit_image is None or self._crop_drag.get('action') is not None:
+                return
+            fit_w, fit_h = self._preview_fit_size
+            orig_w, _orig_h = self._original_image_size
+            if fit_w <= 0 or fit_h <= 0:
+                return
+            max_zoom = max(1.0, orig_w * PREVIEW_MAX_MAGNIFICATION / fit_w)
+            old_zoom = self._view_zoom
+            zoom = min(max(old_zoom * factor, 1.0), max_zoom)
+            if zoom == old_zoom:
+                return
+            c = self.canvas
+            cx, cy = c.canvasx(cx), c.canvasy(cy)
+            ix, iy = self._preview_image_pos
+            ratio = zoom / old_zoom
+            self._view_zoom = zoom
+            self._set_preview_view(cx - (cx - ix) * ratio, cy - (cy - iy) * ratio)
+        except Exception as e:
+            try:
+                log.error('_zoom_preview: %s', e)
+            except Exception:
+                pass
+
+    def _on_canvas_pan_start(self, event):
+        try:
+            c = self.canvas
+            self._pan_start = (c.canvasx(event.x), c.canvasy(event.y), self._preview_image_pos)
+        except Exception:
+            self._pan_start = None
+
+    def _on_canvas_pan_move(self, event):
+        try:
+            if self._pan_start is None or self._view_zoom <= 1.0:
+                return
+            c = self.canvas
+            sx, sy, (ix, iy) = self._pan_start
+            self._set_preview_view(ix + c.canvasx(event.x) - sx, iy + c.canvasy(event.y) - sy)
+        except Exception:
+            pass
+
+    def _set_preview_view(self, ix: float, iy: float):
+        """Place the (zoomed) preview at (ix, iy), clamped so it covers the canvas, and
+        carry the crop rectangle over through original-image coordinates."""
+        fit_w, fit_h = self._preview_fit_size
+        zoom = self._view_zoom
+        try:
+            cw = max(1, self.canvas.winfo_width())
+            ch = max(1, self.canvas.winfo_height())
+        except Exception:
+            cw, ch = fit_w, fit_h
+        rect_orig = None
+        if self._crop_rect is not None:
+            # Reuse the original-space rect of the previous view change while the user
+            # hasn't touched the rectangle since, so repeated zooming doesn't drift it.
+            last = getattr(self, '_view_rect_orig', None)
+            if last is not None and last[1] == tuple(self._crop_rect):
+                rect_orig = last[0]
+            else:
+                x1, y1 = self._preview_to_original_coords(self._crop_rect[0], self._crop_rect[1])
+                x2, y2 = self._preview_to_original_coords(self._crop_rect[2], self._crop_rect[3])
+                rect_orig = (x1, y1, x2, y2)
+        if zoom <= 1.0:
+            vw, vh = fit_w, fit_h
+            ix, iy = 0, 0
+        else:
+            vw, vh = max(1, int(round(fit_w * zoom))), max(1, int(round(fit_h * zoom)))
+            ix = int(round(min(0, max(ix, cw - vw)))) if vw > cw else 0
+            iy = int(round(min(0, max(iy, ch - vh)))) if vh > ch else 0
+        self._preview_image_size = (vw, vh)
+        self._preview_image_pos = (ix, iy)
+        if rect_orig is not None:
+            nx1, ny1 = self._original_to_preview_coords(rect_orig[0], rect_orig[1])
+            nx2, ny2 = self._original_to_preview_coords(rect_orig[2], rect_orig[3])
+            self._crop_rect = [nx1, ny1, nx2, ny2]
+            self._view_rect_orig = (rect_orig, tuple(self._crop_rect))
+            self._draw_crop_rectangle()
+        # one render per idle pass however many wheel/pan events arrive
+        if self._view_render_pending is None:
+            try:
+                self._view_render_pending = self.after_idle(self._render_preview_view)
+            except Exception:
+                self._view_render_pending = None
+
+    def _preview_pyramid_for_path(self):
+        path = self._preview_path
+        if not path:
+            return None
+        pyramid = self._preview_pyramid
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        if pyramid is None or pyramid.path != path or pyramid.mtime != mtime:
+            pyramid = self._preview_pyramid = _ImagePyramid(path, self._original_image_size)
+            pyramid.mtime = mtime
+        return pyramid
+
+    def _request_pyramid_level(self, pyramid, k: int):
+        loader = getattr(self, '_preview_loader', None)
+        if loader is None:
+            loader = self._preview_loader = _PreviewLoader()
+        loader.request_level(getattr(self, '_preview_generation', 0), pyramid, k)
+        self._schedule_preview_poll()
+
+    def _render_preview_view(self):
+        """Render only the visible part of the zoomed preview into the canvas image,
+        from the pyramid level matching the zoom (the fitted bitmap at zoom 1)."""
+        self._view_render_pending = None
+        try:
+            c = self.canvas
+            if self._view_zoom <= 1.0 or not self._preview_path:
+                region = self._preview_fit_image
+                x, y = 0, 0
+                # back at the fitted view: let go of any zoom level
+                if self._preview_pyramid is not None:
+                    self._preview_pyramid.keep(None)
+            else:
+                cw = max(1, c.winfo_width())
+                ch = max(1, c.winfo_height())
+                ix, iy = self._preview_image_pos
+                vw, vh = self._preview_image_size
+                # visible rectangle in zoomed-image coordinates
+                vx0, vy0 = max(0, -ix), max(0, -iy)
+                vx1, vy1 = min(vw, cw - ix), min(vh, ch - iy)
+                if vx1 <= vx0 or vy1 <= vy0:
+                    return
+                pyramid = self._preview_pyramid_for_path()
+                source_per_screen = pyramid.size[0] / vw
+                k = pyramid.level_for(source_per_screen)
+                level = pyramid.get(k)
+                if level is None:
+                    # decoded on the loader thread; until it arrives, scale up the
+                    # closest level already built (or the fitted preview)
+                    self._request_pyramid_level(pyramid, k)
+                    level = pyramid.nearest(k) or self._preview_fit_image
+                pyramid.keep(k)
+                sx, sy = level.width / vw, level.height / vh
+                box = (vx0 * sx, vy0 * sy, vx1 * sx, vy1 * sy)
+                # magnified: show crisp source pixels so edges can be placed exactly
+                if source_per_screen < 0.5:
+                    resample = getattr(Image, 'NEAREST', 0)
+                else:
+                    resample = getattr(Image, 'BILINEAR', 2)
+                region = level.resize((int(vx1 - vx0), int(vy1 - vy0)), resample, box=box)
+                x, y = ix + vx0, iy + vy0
+            if region is None:
+                return
+            photo = ImageTk.PhotoImage(region)
+            c.itemconfigure(self._preview_image_item, image=photo)
+            c.coords(self._preview_image_item, x, y)
+            self._preview_image_ref = photo
+            c.tag_raise('crop')
+        except Exception as e:
+            try:
+                log.error('_render_preview_view: %s', e)
             except Exception:
                 pass
 
     # --- Coordinate conversion helpers ---
     def _original_to_preview_coords(self, x, y):
-        """Convert coordinates from original image space to preview canvas space."""
+        """Convert coordinates from original image space to preview canvas space.
+        The preview image sits at _preview_image_pos (negative while zoomed and panned)."""
         try:
             orig_w, orig_h = getattr(self, '_original_image_size', (1, 1))
             prev_w, prev_h = self._preview_image_size
+            ix, iy = self._preview_image_pos
             if orig_w <= 0 or orig_h <= 0:
                 return (x, y)
             scale_x = prev_w / orig_w
             scale_y = prev_h / orig_h
-            return (int(x * scale_x), int(y * scale_y))
+            return (int(x * scale_x) + ix, int(y * scale_y) + iy)
         except Exception:
             return (x, y)
 
@@ -2237,11 +3232,12 @@ class MinimalProfileEditor(tk.Frame):
         try:
             orig_w, orig_h = getattr(self, '_original_image_size', (1, 1))
             prev_w, prev_h = self._preview_image_size
+            ix, iy = self._preview_image_pos
             if prev_w <= 0 or prev_h <= 0:
                 return (x, y)
             scale_x = orig_w / prev_w
             scale_y = orig_h / prev_h
-            return (int(x * scale_x), int(y * scale_y))
+            return (int((x - ix) * scale_x), int((y - iy) * scale_y))
         except Exception:
             return (x, y)
 
@@ -2249,7 +3245,8 @@ class MinimalProfileEditor(tk.Frame):
     def _draw_crop_rectangle(self):
         """Draw the red crop rectangle and corner handles on the canvas.
 
-        Existing crop items are removed and recreated. Handles use the tag 'crop_handle'
+        The items are created once (again only after the canvas was cleared) and
+        afterwards just moved with coords(). Handles use the tag 'crop_handle'
         so hit testing can find them.
 
         Note: _crop_rect is in PREVIEW space for easy mouse interaction. Values are
@@ -2262,13 +3259,21 @@ class MinimalProfileEditor(tk.Frame):
             x1, y1, x2, y2 = map(int, self._crop_rect)
 
             c = self.canvas
-            # remove previous crop items
-            try:
-                c.delete('crop')
-            except Exception:
-                pass
-            # main rectangle
-            c.create_rectangle(x1, y1, x2, y2, outline='red', width=2, tags=('crop',))
+            # (re)create the items if they don't exist yet or were removed by canvas.delete('all')
+            rect_item = self._crop_rect_item
+            if rect_item is None or not c.type(rect_item):
+                try:
+                    c.delete('crop')
+                except Exception:
+                    pass
+                self._crop_rect_item = c.create_rectangle(x1, y1, x2, y2, outline='red', width=2, tags=('crop',))
+                self._crop_handles = {}
+                for name in ('nw', 'ne', 'sw', 'se'):
+                    hid = c.create_rectangle(0, 0, 0, 0, fill='red', outline='black',
+                                             tags=('crop', 'crop_handle', f'handle_{name}'))
+                    self._crop_handles[hid] = name
+            else:
+                c.coords(rect_item, x1, y1, x2, y2)
             # compute adaptive handle size based on rect size so handles remain usable on small images
             rect_w = max(1, x2 - x1)
             rect_h = max(1, y2 - y1)
@@ -2295,7 +3300,7 @@ class MinimalProfileEditor(tk.Frame):
                 'sw': (x1, y2 - size, x1 + size, y2),
                 'se': (x2 - size, y2 - size, x2, y2),
             }
-            self._crop_handles = {}
+            handle_items = {name: hid for hid, name in self._crop_handles.items()}
             for name, (hx1, hy1, hx2, hy2) in handles.items():
                 # Clamp handle bbox to canvas/image bounds to avoid negative coords
                 try:
@@ -2314,24 +3319,9 @@ class MinimalProfileEditor(tk.Frame):
                         hy2 = min(hy2, maxy)
                 except Exception:
                     pass
-                hid = c.create_rectangle(hx1, hy1, hx2, hy2,
-                                         fill='red', outline='black', tags=('crop', 'crop_handle', f'handle_{name}'))
-                self._crop_handles[hid] = name
-
-            # Cursor feedback for handles (helps users discover they can drag corners)
-            try:
-                # bind tag-level enter/leave to change cursor when over any handle
-                # prefer directional sizing cursors where available
-                c.tag_bind('handle_nw', '<Enter>', lambda e, canv=c: canv.configure(cursor='size_nw_se'))
-                c.tag_bind('handle_nw', '<Leave>', lambda e, canv=c: canv.configure(cursor=''))
-                c.tag_bind('handle_se', '<Enter>', lambda e, canv=c: canv.configure(cursor='size_nw_se'))
-                c.tag_bind('handle_se', '<Leave>', lambda e, canv=c: canv.configure(cursor=''))
-                c.tag_bind('handle_ne', '<Enter>', lambda e, canv=c: canv.configure(cursor='size_ne_sw'))
-                c.tag_bind('handle_ne', '<Leave>', lambda e, canv=c: canv.configure(cursor=''))
-                c.tag_bind('handle_sw', '<Enter>', lambda e, canv=c: canv.configure(cursor='size_ne_sw'))
-                c.tag_bind('handle_sw', '<Leave>', lambda e, canv=c: canv.configure(cursor=''))
-            except Exception:
-                pass
+                c.coords(handle_items[name], hx1, hy1, hx2, hy2)
+            # keep the overlay above the preview image
+            c.tag_raise('crop')
         except Exception:
             pass
 
@@ -2409,12 +3399,27 @@ class MinimalProfileEditor(tk.Frame):
             pass
 
     def _on_canvas_mouse_move(self, event):
+        """Record the pointer position; the drag is applied once per idle pass, so a
+        burst of motion events costs a single redraw."""
         try:
             if self._crop_drag.get('action') is None:
                 return
             c = self.canvas
-            x = c.canvasx(event.x)
-            y = c.canvasy(event.y)
+            self._crop_drag['x'] = c.canvasx(event.x)
+            self._crop_drag['y'] = c.canvasy(event.y)
+            if self._crop_drag.get('pending') is None:
+                self._crop_drag['pending'] = self.after_idle(self._apply_crop_drag)
+        except Exception:
+            pass
+
+    def _apply_crop_drag(self):
+        """Move/resize the crop rectangle to the latest pointer position of the drag."""
+        try:
+            self._crop_drag['pending'] = None
+            if self._crop_drag.get('action') is None:
+                return
+            x = self._crop_drag['x']
+            y = self._crop_drag['y']
             dx = x - self._crop_drag['start_x']
             dy = y - self._crop_drag['start_y']
             orig = self._crop_drag.get('orig_rect') or [0,0,0,0]
@@ -2555,28 +3560,68 @@ class MinimalProfileEditor(tk.Frame):
                         pass
             # redraw
             self._draw_crop_rectangle()
-            # update the entry vars - use _sync_crop_values to convert from preview to original coords
-            try:
-                cx1 = int(self._crop_rect[0])
-                cy1 = int(self._crop_rect[1])
-                cx2 = int(self._crop_rect[2])
-                cy2 = int(self._crop_rect[3])
-                # Use _sync_crop_values which handles conversion from preview to original coordinates
-                try:
-                    active_outer = getattr(self, '_active_rule_outer', None)
-                except Exception:
-                    active_outer = None
+            self._crop_drag['moved'] = True
+            # update the entry vars, at most CROP_SYNC_HZ times a second
+            self._sync_crop_drag()
+        except Exception:
+            pass
+
+    def _sync_crop_drag(self, final: bool = False):
+        """Write the dragged rectangle to the crop fields (see _sync_crop_values).
+
+        During a drag this is rate-limited to CROP_SYNC_HZ: an update that comes too
+        soon is deferred, and a deferred update always shows the latest rectangle.
+        `final` writes immediately (used on mouse up so the fields end exact).
+        """
+        try:
+            drag = self._crop_drag
+            if drag.get('sync_pending') is not None:
+                if not final:
+                    return
                 try:
-                    self._sync_crop_values(cx1, cy1, cx2, cy2, active_outer=active_outer)
+                    self.after_cancel(drag['sync_pending'])
                 except Exception:
                     pass
+                drag['sync_pending'] = None
+            wait = drag.get('last_sync', 0.0) + 1.0 / CROP_SYNC_HZ - time.monotonic()
+            if wait > 0 and not final:
+                drag['sync_pending'] = self.after(max(1, int(wait * 1000)), self._sync_crop_drag_deferred)
+                return
+            drag['last_sync'] = time.monotonic()
+            # update the entry vars - use _sync_crop_values to convert from preview to original coords
+            cx1, cy1, cx2, cy2 = (int(v) for v in self._crop_rect)
+            try:
+                active_outer = getattr(self, '_active_rule_outer', None)
             except Exception:
-                pass
+                active_outer = None
+            # The dragged rectangle is authoritative: keep the fields' trace callbacks
+            # from re-applying the (half-written) values to it and redrawing again.
+            self._syncing_crop_vars = True
+            try:
+                self._sync_crop_values(cx1, cy1, cx2, cy2, active_outer=active_outer)
+            finally:
+                self._syncing_crop_vars = False
         except Exception:
             pass
 
+    def _sync_crop_drag_deferred(self):
+        self._crop_drag['sync_pending'] = None
+        self._sync_crop_drag()
+
     def _on_canvas_mouse_up(self, event):
         try:
+            # apply a motion still waiting for the idle pass so the final position is exact
+            pending = self._crop_drag.get('pending')
+            if pending is not None:
+                try:
+                    self.after_cancel(pending)
+                except Exception:
+                    pass
+                self._apply_crop_drag()
+            # final exact sync of the numeric fields
+            if self._crop_drag.get('action') is not None and self._crop_drag.get('moved'):
+                self._sync_crop_drag(final=True)
+            self._crop_drag['moved'] = False
             # clear drag state
             self._crop_drag['action'] = None
             self._crop_drag['handle'] = None
@@ -2681,29 +3726,34 @@ class MinimalProfileEditor(tk.Frame):
         exts = ('.jpg', '.jpeg', '.png', '.webp', '.bmp', '.gif', '.tif', '.tiff', '.heic', '.heif')
         files = []
         try:
-            for fn in os.listdir(src):
-                path = os.path.join(src, fn)
-                if os.path.isfile(path) and fn.lower().endswith(exts):
-                    try:
-                        mtime = os.path.getmtime(path)
-                    except Exception:
-                        mtime = 0
-                    files.append((mtime, fn, path))
+            # scandir reuses the directory entry's type (and on Windows its stat)
+            with os.scandir(src) as it:
+                for entry in it:
+                    fn = entry.name
+                    if fn.lower().endswith(exts) and entry.is_file():
+                        try:
+                            mtime = entry.stat().st_mtime
+                        except Exception:
+                            mtime = 0
+                        files.append((mtime, fn, entry.path))
             files.sort(key=lambda t: t[0])
             return [p for (_m, _n, p) in files]
         except Exception:
             return []
 
-    def _open_image_preview_by_position(self, position: int):
+    def _open_image_preview_by_position(self, position: int, on_ready=None):
         """Resolve the live source image for `position` (1-based) and show it in the preview.
 
         If no image exists for the given position, the canvas is cleared and a placeholder is shown.
+        `on_ready` is passed on to _open_image_preview.
         """
+        # a placeholder drawn below must not be overwritten by an earlier load
+        self._cancel_preview_load()
         try:
             imgs = self.get_source_images()
         except Exception as e:
             try:
-                print(f'[cropping_gui2] _open_image_preview_by_position: error listing source images: {e}')
+                log.warning('_open_image_preview_by_position: error listing source images: %s', e)
             except Exception:
                 pass
             imgs = []
@@ -2731,7 +3781,7 @@ class MinimalProfileEditor(tk.Frame):
         idx = position - 1
         if not imgs or idx < 0 or idx >= len(imgs):
             try:
-                print(f'[cropping_gui2] _open_image_preview_by_position: no image for position {position} (found {len(imgs)} images)')
+                log.info('_open_image_preview_by_position: no image for position %s (found %d images)', position, len(imgs))
             except Exception:
                 pass
             try:
@@ -2751,7 +3801,7 @@ class MinimalProfileEditor(tk.Frame):
         path = imgs[idx]
         if not os.path.exists(path):
             try:
-                print(f'[cropping_gui2] _open_image_preview_by_position: resolved path missing for position {position}: {path}')
+                log.warning('_open_image_preview_by_position: resolved path missing for position %s: %s', position, path)
             except Exception:
                 pass
             try:
@@ -2770,10 +3820,10 @@ class MinimalProfileEditor(tk.Frame):
 
         # Finally attempt to open the resolved path
         try:
-            self._open_image_preview(path)
+            self._open_image_preview(path, on_ready=on_ready)
         except Exception as e:
             try:
-                print(f'[cropping_gui2] _open_image_preview_by_position: failed to preview {path}: {e}')
+                log.warning('_open_image_preview_by_position: failed to preview %s: %s', path, e)
             except Exception:
                 pass
             try:
@@ -2789,7 +3839,7 @@ class MinimalProfileEditor(tk.Frame):
             except Exception:
                 pass
         try:
-            print(f'[cropping_gui2] _open_image_preview_by_position: success for {path}')
+            log.debug('_open_image_preview_by_position: success for %s', path)
         except Exception:
             pass
 
@@ -2810,22 +3860,8 @@ class MinimalProfileEditor(tk.Frame):
                 pass
             return
 
-        exts = ('.jpg', '.jpeg', '.png', '.webp', '.bmp', '.gif', '.tif', '.tiff', '.heic', '.heif')
-
-        # gather files with their modification time; sort oldest first
-        files = []
-        try:
-            for fn in os.listdir(src):
-                path = os.path.join(src, fn)
-                if os.path.isfile(path) and fn.lower().endswith(exts):
-                    try:
-                        mtime = os.path.getmtime(path)
-                    except Exception:
-                        mtime = 0
-                    files.append((mtime, fn, path))
-            files.sort(key=lambda t: t[0])
-        except Exception:
-            files = []
+        # same listing (and order: oldest first) the preview uses to resolve positions
+        files = self.get_source_images()
 
         dlg = tk.Toplevel(self.master)
         try:
@@ -2861,29 +3897,31 @@ class MinimalProfileEditor(tk.Frame):
         thumb_size = (200, 140)  # max width, max height
         thumb_refs = []
         thumb_data = []  # Store (lbl, path, idx, r, c) for keyboard navigation
+        # Cells start with a blank placeholder of the full thumbnail size so the grid
+        # is laid out immediately; images are filled in as they scroll into view.
+        try:
+            blank = tk.PhotoImage(master=dlg, width=thumb_size[0], height=thumb_size[1])
+            thumb_refs.append(blank)
+        except Exception:
+            blank = None
+        loading = {}  # path -> label still waiting for its thumbnail
 
         # populate grid
         r = 0
         c = 0
         # enumerate files so we can display position labels (oldest -> Position 1)
-        for idx, (mtime, name, path) in enumerate(files, start=1):
+        for idx, path in enumerate(files, start=1):
             cell = ttk.Frame(inner, width=thumb_size[0], padding=6)
             cell.grid(row=r, column=c, padx=4, pady=4, sticky='n')
 
             if PIL_AVAILABLE:
-                try:
-                    img = Image.open(path)
-                    img.thumbnail(thumb_size, _RESAMPLE_FILTER)
-                    photo = ImageTk.PhotoImage(img)
-                    # use tk.Label (not ttk) so we can control highlightthickness/bg easily
-                    # Always set highlightthickness=2 to reserve space and prevent layout shifts
-                    lbl = tk.Label(cell, image=photo, bd=0, relief='flat', highlightthickness=2, highlightbackground='#f0f0f0')
-                    lbl.image = photo
-                    lbl.pack()
-                    thumb_refs.append(photo)
-                except Exception:
-                    lbl = tk.Label(cell, text='[Unreadable]', bd=0, relief='flat', highlightthickness=2, highlightbackground='#f0f0f0')
-                    lbl.pack()
+                # use tk.Label (not ttk) so we can control highlightthickness/bg easily
+                # Always set highlightthickness=2 to reserve space and prevent layout shifts;
+                # the fixed pixel size keeps rows steady while thumbnails arrive
+                lbl = tk.Label(cell, image=blank, width=thumb_size[0], height=thumb_size[1], compound='center',
+                               bd=0, relief='flat', highlightthickness=2, highlightbackground='#f0f0f0')
+                lbl.pack()
+                loading[path] = lbl
             else:
                 # Pillow not available: show filename-only placeholder
                 lbl = tk.Label(cell, text='(Pillow not installed)', fg='#666', bd=0, relief='flat', highlightthickness=2, highlightbackground='#f0f0f0')
@@ -2947,18 +3985,88 @@ class MinimalProfileEditor(tk.Frame):
         dlg._thumb_data = thumb_data  # For keyboard navigation
         dlg._thumb_cols = cols  # For keyboard navigation
 
+        # --- Lazy thumbnails: only cells in (or one screen around) the viewport are
+        # requested; the loader drops requests that scrolled away before their turn.
+        loader = _ThumbnailLoader(thumb_size) if loading else None
+        visible_pending = [None]
+
+        def _request_visible():
+            visible_pending[0] = None
+            if loader is None or not loading:
+                return
+            try:
+                view_h = max(1, canvas.winfo_height())
+                top = canvas.canvasy(0) - view_h
+                bottom = canvas.canvasy(0) + 2 * view_h
+                wanted = []
+                for path, lbl in loading.items():
+                    cell = lbl.master
+                    y = cell.winfo_y()
+                    if y + cell.winfo_height() >= top and y <= bottom:
+                        wanted.append(path)
+                # nearest to the top of the view first
+                wanted.sort(key=lambda p: abs(loading[p].master.winfo_y() - canvas.canvasy(0)))
+                loader.request(wanted)
+            except Exception:
+                pass
+
+        def _schedule_visible(*_args):
+            if visible_pending[0] is None:
+                try:
+                    visible_pending[0] = dlg.after_idle(_request_visible)
+                except Exception:
+                    pass
+
+        def _poll_thumbnails():
+            if loader is None:
+                return
+            try:
+                while True:
+                    path, thumb = loader.results.get_nowait()
+                    lbl = loading.pop(path, None)
+                    if lbl is None:
+                        continue
+                    try:
+                        if thumb is None:
+                            lbl.configure(text='[Unreadable]')
+                        else:
+                            photo = ImageTk.PhotoImage(thumb, master=dlg)
+                            lbl.configure(image=photo)
+                            lbl.image = photo
+                            thumb_refs.append(photo)
+                    except Exception:
+                        pass
+            except queue.Empty:
+                pass
+            if loading:
+                try:
+                    dlg.after(30, _poll_thumbnails)
+                except Exception:
+                    pass
+
+        def _on_yscroll(first, last):
+            vscroll.set(first, last)
+            _schedule_visible()
+
+        if loader is not None:
+            canvas.configure(yscrollcommand=_on_yscroll)
+            dlg.bind('<Destroy>', lambda e: loader.close() if e.widget is dlg else None, add='+')
+            dlg.after(30, _poll_thumbnails)
+
         # update scrollregion when contents change
         def _on_inner_config(e):
             try:
                 canvas.configure(scrollregion=canvas.bbox('all'))
             except Exception:
                 pass
+            _schedule_visible()
 
         def _on_canvas_config(e):
             try:
                 canvas.itemconfig(window_item, width=e.width)
             except Exception:
                 pass
+            _schedule_visible()
 
         inner.bind('<Configure>', _on_inner_config)
         canvas.bind('<Configure>', _on_canvas_config)
@@ -3387,8 +4495,9 @@ class MinimalProfileEditor(tk.Frame):
             # Add trace callbacks to crop area inputs to update the crop box in real-time
             def _on_crop_input_changed_rule(*args, av=ar_var, caw=custom_aspect_width_var, cah=custom_aspect_height_var,
                                            x1v=x1_var, y1v=y1_var, x2v=x2_var, y2v=y2_var, rule_outer=outer):
-                # Check if we're already updating this rule's inputs
-                if self._updating_rule_crop_inputs.get(rule_outer, False):
+                # Check if we're already updating this rule's inputs (or a crop
+                # drag is writing them, see _sync_crop_drag)
+                if self._updating_rule_crop_inputs.get(rule_outer, False) or self._syncing_crop_vars:
                     return
                 try:
                     self._updating_rule_crop_inputs[rule_outer] = True
@@ -3830,6 +4939,17 @@ class MinimalProfileEditor(tk.Frame):
                                 break
                         except Exception:
                             pass
+                    # Only apply aspect if there are no saved coordinates
+                    # (saved coords already respect the aspect ratio and shouldn't be recalculated).
+                    # Runs once the preview is shown, which may be after a background load.
+                    def _apply_rule_aspect(has_saved_coords=has_saved_coords, aspect_var=aspect_var):
+                        try:
+                            if not has_saved_coords and aspect_var is not None and aspect_var.get() != 'none':
+                                self._apply_aspect_to_crop(aspect_var.get())
+                                self._draw_crop_rectangle()
+                        except Exception:
+                            pass
+
                     if pos is not None:
                         # show by position (preferred) so preview resolves the live file for that slot
                         try:
@@ -3837,7 +4957,7 @@ class MinimalProfileEditor(tk.Frame):
                                 self.preview_status_var.set(f'Resolving Position {int(pos)}...')
                             except Exception:
                                 pass
-                            self._open_image_preview_by_position(int(pos))
+                            self._open_image_preview_by_position(int(pos), on_ready=_apply_rule_aspect)
                         except Exception:
                             # fallback to explicit path if position resolution fails
                             try:
@@ -3846,17 +4966,9 @@ class MinimalProfileEditor(tk.Frame):
                                         self.preview_status_var.set('Showing fallback file: ' + os.path.basename(img_path))
                                     except Exception:
                                         pass
-                                    self._open_image_preview(img_path)
+                                    self._open_image_preview(img_path, on_ready=_apply_rule_aspect)
                             except Exception:
                                 pass
-                        # Only apply aspect if there are no saved coordinates
-                        # (saved coords already respect the aspect ratio and shouldn't be recalculated)
-                        try:
-                            if not has_saved_coords and aspect_var is not None and aspect_var.get() != 'none':
-                                self._apply_aspect_to_crop(aspect_var.get())
-                                self._draw_crop_rectangle()
-                        except Exception:
-                            pass
                     elif img_path:
                         # legacy/path-only rules: show by path
                         try:
@@ -3864,17 +4976,12 @@ class MinimalProfileEditor(tk.Frame):
                                 self.preview_status_var.set('Showing file: ' + (os.path.basename(img_path) or '(file)'))
                             except Exception:
                                 pass
-                            self._open_image_preview(img_path)
-                        except Exception:
-                            pass
-                        try:
-                            if not has_saved_coords and aspect_var is not None and aspect_var.get() != 'none':
-                                self._apply_aspect_to_crop(aspect_var.get())
-                                self._draw_crop_rectangle()
+                            self._open_image_preview(img_path, on_ready=_apply_rule_aspect)
                         except Exception:
                             pass
                     else:
                         # clear preview and show a placeholder text
+                        self._cancel_preview_load()
                         try:
                             self.canvas.delete('all')
                             # center placeholder text
@@ -0,0 +1,39 @@
+"""Shared fixtures: load main.py (it ships as a script, not a package module) and
+point its on-disk state at a temporary folder."""
+import importlib.util
+import os
+import sys
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'image_splitter_pro')
+
+
+def _load_main():
+    mod = sys.modules.get('main')
+    if mod is None:
+        spec = importlib.util.spec_from_file_location('main', os.path.join(SRC_DIR, 'main.py'))
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules['main'] = mod
+        spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope='session')
+def main_module():
+    return _load_main()
+
+
+@pytest.fixture
+def app(main_module, tmp_path, monkeypatch):
+    """main.py with its config-folder state (journals, hash index, job queue) in tmp_path."""
+    config = tmp_path / 'config'
+    monkeypatch.setattr(main_module, 'CONFIG_FOLDER', str(config))
+    monkeypatch.setattr(main_module, 'CONFIG_FILE', str(config / 'config.csv'))
+    monkeypatch.setattr(main_module, 'STATIONS_FILE', str(config / 'stations.json'))
+    monkeypatch.setattr(main_module, '_config_ready', False)
+    monkeypatch.setattr(main_module, 'JOURNAL_FOLDER', str(config / 'journal'))
+    monkeypatch.setattr(main_module, 'HASH_INDEX_FOLDER', str(config / 'hash_index'))
+    monkeypatch.setattr(main_module, 'JOBS_DB', str(config / 'jobs.sqlite3'))
+    monkeypatch.setattr(main_module, 'API_TOKEN_FILE', str(config / 'api_token'))
+    return main_module
@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import pytest
+
+PORT = 8765
+TOKEN = 'secret-token'
+AUTH = f'Authorization: Bearer {TOKEN}\r\n'.encode()
+_CROP = b'{"source": "/in", "profile": "Shirts", "destination": "/out"}'
+
+
+class _Writer:
+    def __init__(self):
+        self.data = b''
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _request(app, jobs, raw: bytes, on_enqueue=None):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        writer = _Writer()
+        await app._api_handle(reader, writer, jobs, PORT, TOKEN, on_enqueue)
+        return writer.data
+    head, _, body = asyncio.run(run()).partition(b'\r\n\r\n')
+    return int(head.split(b' ', 2)[1]), json.loads(body)
+
+
+def _post(body: bytes, host=f'127.0.0.1:{PORT}', extra=b'', length=None, auth=AUTH):
+    length = len(body) if length is None else length
+    return (f"POST /jobs HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {length}\r\n").encode() + auth + extra + b'\r\n' + body
+
+
+@pytest.fixture
+def jobs(app):
+    return app.JobQueue(app.JOBS_DB)
+
+
+def test_enqueue_and_fetch(app, jobs):
+    woken = []
+    status, payload = _request(app, jobs, _post(_CROP),
+                               on_enqueue=lambda: woken.append(True))
+    assert status == 201
+    assert woken == [True]
+    status, job = _request(app, jobs, f"GET /jobs/{payload['id']} HTTP/1.1\r\nHost: localhost:{PORT}\r\n".encode() + AUTH + b'\r\n')
+    assert status == 200
+    assert job['status'] == 'queued'
+
+
+@pytest.mark.parametrize('host', ['evil.example:8765', f'127.0.0.1:{PORT + 1}', '127.0.0.1', '', '[::2]:8765'])
+def test_rejects_foreign_host(app, jobs, host):
+    status, payload = _request(app, jobs, _post(_CROP, host=host))
+    assert status == 403
+    assert jobs.queued() == []
+
+
+def test_accepts_ipv6_loopback_host(app, jobs):
+    status, _ = _request(app, jobs, _post(_CROP, host=f'[::1]:{PORT}'))
+    assert status == 201
+
+
+def test_rejects_cross_site_origin(app, jobs):
+    status, payload = _request(app, jobs, _post(_CROP, extra=b'Origin: http://evil.example\r\n'))
+    assert (status, payload['error']) == (403, 'forbidden origin')
+    status, _ = _request(app, jobs, _post(_CROP, extra=f'Origin: http://localhost:{PORT}\r\n'.encode()))
+    assert status == 201
+
+
+def test_rejects_oversized_body_without_reading_it(app, jobs):
+    status, payload = _request(app, jobs, _post(b'', length=app._API_MAX_BODY + 1))
+    assert status == 413
+    assert jobs.queued() == []
+
+
+@pytest.mark.parametrize('auth', [b'', b'Authorization: Bearer wrong\r\n', f'Authorization: {TOKEN}\r\n'.encode()])
+def test_rejects_missing_or_wrong_token(app, jobs, auth):
+    status, _ = _request(app, jobs, _post(_CROP, auth=auth))
+    assert status == 401
+    assert jobs.queued() == []
+
+
+def test_new_token_is_written_to_the_config_folder(app):
+    token = app._api_new_token()
+    with open(app.API_TOKEN_FILE, encoding='utf-8') as f:
+        assert f.read() == token
+    assert app._api_new_token() != token
+
+
+@pytest.mark.parametrize('kind', ['resize', 'move', 'import', 'export'])
+def test_accepts_only_crop_jobs(app, jobs, kind):
+    body = json.dumps({'kind': kind, 'source': '/in', 'profile': 'Shirts', 'destination': '/out'}).encode()
+    status, payload = _request(app, jobs, _post(body))
+    assert status == 400
+    assert jobs.queued() == []
+
+
+@pytest.mark.parametrize('flag', ['delete_originals', 'delete_after_move'])
+def test_rejects_delete_flags(app, jobs, flag):
+    body = json.dumps({'source': '/in', 'profile': 'Shirts', 'destination': '/out', flag: True}).encode()
+    status, payload = _request(app, jobs, _post(body))
+    assert (status, payload['error']) == (400, f'not allowed over the API: {flag}')
+    assert jobs.queued() == []
+
+
+def test_malformed_request_is_a_bad_request(app, jobs):
+    status, _ = _request(app, jobs, b'garbage\r\n\r\n')
+    assert status == 400
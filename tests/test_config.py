@@ -0,0 +1,30 @@
+import os
+
+
+def test_config_folder_is_created_on_first_use(app):
+    assert not os.path.exists(app.CONFIG_FOLDER)
+    app.JobQueue(app.JOBS_DB)
+    assert os.path.isfile(app.CONFIG_FILE)
+    assert app.load_config('sets_mode') == 'off'
+
+
+def test_journal_creates_the_config_folder(app):
+    journal = app._RunJournal('crop')
+    assert journal.path is not None and os.path.isfile(journal.path)
+    journal.finish()
+
+
+def test_save_config_without_prior_setup(app):
+    app.save_config('api_port', '9000')
+    assert app.load_config('api_port') == '9000'
+    assert app.load_config('show_onboarding') == 'True'
+
+
+def test_profile_startup_flag_is_consumed(main_module, monkeypatch):
+    monkeypatch.setattr(main_module, 'PROFILE_STARTUP', False)
+    for attr in ('handlers', 'level', 'propagate'):
+        monkeypatch.setattr(main_module.log, attr, getattr(main_module.log, attr))
+    monkeypatch.setattr(main_module.log, 'handlers', [])
+    rest = main_module._configure_logging(['--profile-startup', '--jobs'])
+    assert rest == ['--jobs']
+    assert main_module.PROFILE_STARTUP is True
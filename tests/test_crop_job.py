@@ -0,0 +1,99 @@
+import json
+import os
+import time
+
+import pytest
+from PIL import Image
+
+
+@pytest.fixture
+def profile(app):
+    os.makedirs(app.CONFIG_FOLDER, exist_ok=True)
+    rules = [{'position': 1, 'apply_to_all_remaining': True, 'crop': {'x1': 0, 'y1': 0, 'x2': 10, 'y2': 10}}]
+    with open(os.path.join(app.CONFIG_FOLDER, 'Shirts.profile'), 'w', encoding='utf-8') as f:
+        json.dump({'rules': rules}, f)
+    return 'Shirts'
+
+
+@pytest.fixture
+def folders(tmp_path):
+    source, dest = tmp_path / 'source', tmp_path / 'dest'
+    source.mkdir()
+    dest.mkdir()
+    for i, name in enumerate(('a.jpg', 'b.jpg', 'c.jpg')):
+        Image.new('RGB', (20, 20), (i * 60, 0, 0)).save(source / name)
+        os.utime(source / name, (1000 + i, 1000 + i))
+    return source, dest
+
+
+def _trashed(app, monkeypatch):
+    trashed = []
+
+    def fake_trash(paths, journal=None):
+        trashed.extend(paths)
+        return {p: app.TRASH_TRASHED for p in paths}
+    monkeypatch.setattr(app, '_trash_files', fake_trash)
+    return trashed
+
+
+def test_failed_saves_keep_every_original(app, profile, folders, monkeypatch):
+    source, dest = folders
+    monkeypatch.setattr(app, '_save_image_preset', lambda *a, **k: None)
+    trashed = _trashed(app, monkeypatch)
+
+    result = app.run_crop_job(str(source), profile, str(dest), move=True, delete_after_move=True)
+
+    assert result['processed'] == 0 and result['deleted'] == 0
+    assert trashed == []
+    assert sorted(os.listdir(source)) == ['a.jpg', 'b.jpg', 'c.jpg']
+
+
+def test_only_originals_with_outputs_are_archived(app, profile, folders, monkeypatch):
+    source, dest = folders
+    real_save = app._save_image_preset
+
+    def save(img, out_path, *args, **kwargs):
+        return None if out_path.endswith('_b.jpg') else real_save(img, out_path, *args, **kwargs)
+    monkeypatch.setattr(app, '_save_image_preset', save)
+
+    result = app.run_crop_job(str(source), profile, str(dest), move=True)
+
+    assert result['processed'] == 2 and result['moved'] == 2
+    assert os.listdir(source) == ['b.jpg']
+    with open(result['manifest'], encoding='utf-8') as f:
+        actions = {os.path.basename(o['source']): o['action'] for o in json.load(f)['originals']}
+    assert actions == {'a.jpg': 'moved', 'b.jpg': 'kept', 'c.jpg': 'moved'}
+
+
+def test_delete_after_move_trashes_only_cropped_originals(app, profile, folders, monkeypatch):
+    source, dest = folders
+    real_save = app._save_image_preset
+    monkeypatch.setattr(app, '_save_image_preset',
+                        lambda img, out, *a, **k: None if out.endswith('_b.jpg') else real_save(img, out, *a, **k))
+    trashed = _trashed(app, monkeypatch)
+
+    app.run_crop_job(str(source), profile, str(dest), move=True, delete_after_move=True)
+
+    assert sorted(os.path.basename(p) for p in trashed) == ['a.jpg', 'c.jpg']
+
+
+def test_source_metadata_is_read_once_per_source(app, folders, monkeypatch):
+    source, dest = folders
+    os.makedirs(app.CONFIG_FOLDER, exist_ok=True)
+    rules = [{'position': 1, 'crop': {'x1': 0, 'y1': 0, 'x2': 10, 'y2': 10}} for _ in range(4)]
+    with open(os.path.join(app.CONFIG_FOLDER, 'Tiles.profile'), 'w', encoding='utf-8') as f:
+        json.dump({'rules': rules}, f)
+    real_extract = app._extract_source_metadata
+    reads = []
+
+    def extract(img, policy):
+        reads.append(img.filename)
+        time.sleep(0.05)  # let concurrent crops of the same source catch up
+        return real_extract(img, policy)
+    monkeypatch.setattr(app, '_extract_source_metadata', extract)
+    monkeypatch.setattr(app, '_SHARED_SCHEDULER', app._FairScheduler(workers=4))
+
+    result = app.run_crop_job(str(source), 'Tiles', str(dest))
+
+    assert result['processed'] == 4
+    assert reads == [str(source / 'a.jpg')]
@@ -0,0 +1,100 @@
+import os
+
+
+def _write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return str(path)
+
+
+def _count_calls(monkeypatch, app, name):
+    calls = []
+    real = getattr(app, name)
+
+    def wrapper(path, *args):
+        calls.append(os.path.basename(path))
+        return real(path, *args)
+    monkeypatch.setattr(app, name, wrapper)
+    return calls
+
+
+def test_different_sizes_are_never_hashed(app, tmp_path, monkeypatch):
+    folder, drop = tmp_path / 'source', tmp_path / 'drop'
+    folder.mkdir()
+    drop.mkdir()
+    _write(folder / 'a.jpg', b'a' * 100)
+    new = _write(drop / 'b.jpg', b'b' * 101)
+    quick = _count_calls(monkeypatch, app, '_quick_hash')
+
+    unique, duplicates = app._filter_duplicates([new], str(folder), {})
+
+    assert unique == [new] and duplicates == {}
+    assert quick == []
+
+
+def test_quick_hash_mismatch_skips_the_full_hash(app, tmp_path, monkeypatch):
+    folder, drop = tmp_path / 'source', tmp_path / 'drop'
+    folder.mkdir()
+    drop.mkdir()
+    _write(folder / 'a.jpg', b'a' * 100)
+    new = _write(drop / 'b.jpg', b'b' * 100)
+    full = _count_calls(monkeypatch, app, '_full_hash')
+
+    unique, duplicates = app._filter_duplicates([new], str(folder), {})
+
+    assert unique == [new] and duplicates == {}
+    assert full == []
+
+
+def test_full_hash_separates_files_with_equal_samples(app, tmp_path, monkeypatch):
+    # Same size, same head and tail: only the middle differs, which the quick hash never reads
+    monkeypatch.setattr(app, 'HASH_SAMPLE_BYTES', 4)
+    folder, drop = tmp_path / 'source', tmp_path / 'drop'
+    folder.mkdir()
+    drop.mkdir()
+    _write(folder / 'a.jpg', b'HEAD-middle-one-TAIL')
+    new = _write(drop / 'b.jpg', b'HEAD-middle-two-TAIL')
+    same = _write(drop / 'c.jpg', b'HEAD-middle-one-TAIL')
+    index = {}
+
+    unique, duplicates = app._filter_duplicates([new, same], str(folder), index)
+
+    assert unique == [new]
+    assert duplicates == {same: str(folder / 'a.jpg')}
+    assert index['a.jpg']['quick'] and index['a.jpg']['full']
+
+
+def test_duplicates_within_one_drop(app, tmp_path):
+    folder, drop = tmp_path / 'source', tmp_path / 'drop'
+    folder.mkdir()
+    drop.mkdir()
+    first = _write(drop / 'a.jpg', b'same bytes')
+    second = _write(drop / 'b.jpg', b'same bytes')
+    drop_entries = {}
+
+    unique, duplicates = app._filter_duplicates([first, second], str(folder), {}, drop_entries)
+
+    assert unique == [first]
+    assert duplicates == {second: first}
+    assert set(drop_entries) == {first}
+
+
+def test_index_hashes_are_reused_until_the_file_changes(app, tmp_path, monkeypatch):
+    folder, drop = tmp_path / 'source', tmp_path / 'drop'
+    folder.mkdir()
+    drop.mkdir()
+    known = _write(folder / 'a.jpg', b'a' * 100)
+    new = _write(drop / 'b.jpg', b'b' * 100)
+    index = {}
+    app._filter_duplicates([new], str(folder), index)
+    app._save_hash_index(str(folder), index)
+
+    quick = _count_calls(monkeypatch, app, '_quick_hash')
+    app._filter_duplicates([new], str(folder), app._load_hash_index(str(folder)))
+    assert quick == ['b.jpg']  # the Source file's hash came from the saved index
+
+    _write(known, b'c' * 100)
+    os.utime(known, ns=(1, 1))
+    quick.clear()
+    app._filter_duplicates([new], str(folder), app._load_hash_index(str(folder)))
+    assert sorted(quick) == ['a.jpg', 'b.jpg']
@@ -0,0 +1,104 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from conftest import SRC_DIR
+
+
+@pytest.fixture
+def jobs(app):
+    return app.JobQueue(app.JOBS_DB)
+
+
+def test_higher_priority_first_then_oldest(jobs):
+    low = jobs.enqueue('crop', {'n': 1})
+    high = jobs.enqueue('move', {'n': 2}, priority=5)
+    low2 = jobs.enqueue('crop', {'n': 3})
+    assert [j['id'] for j in jobs.queued()] == [high, low, low2]
+
+    claimed = jobs.claim_next()
+    assert claimed['id'] == high
+    assert jobs.get(high)['status'] == 'running'
+    assert jobs.get(high)['pid'] == os.getpid()
+
+    jobs.set_priority(low2, 9)
+    assert jobs.claim_next()['id'] == low2
+
+
+def test_unknown_kind_is_rejected(jobs):
+    with pytest.raises(ValueError):
+        jobs.enqueue('resize', {})
+
+
+def test_cancel_only_queued_jobs(jobs):
+    queued = jobs.enqueue('crop', {})
+    running = jobs.enqueue('crop', {}, priority=1)
+    jobs.claim_next()
+
+    assert jobs.cancel(queued)
+    assert not jobs.cancel(running)
+    assert jobs.get(queued)['status'] == 'cancelled'
+    assert jobs.claim_next() is None
+
+
+def test_retry_failed_and_cancelled_jobs(jobs):
+    failed = jobs.enqueue('crop', {})
+    jobs.claim_next()
+    jobs.finish(failed, {'status': 'error', 'message': 'no profile'})
+    cancelled = jobs.enqueue('crop', {})
+    jobs.cancel(cancelled)
+    done = jobs.enqueue('crop', {})
+    jobs.claim_next()
+    jobs.finish(done, {'status': 'done', 'message': 'ok'})
+
+    assert jobs.get(failed)['status'] == 'failed'
+    assert jobs.retry(failed) and jobs.retry(cancelled)
+    assert not jobs.retry(done)
+    job = jobs.get(failed)
+    assert (job['status'], job['message'], job['started'], job['finished']) == ('queued', '', None, None)
+
+
+def test_requeue_interrupted_skips_live_processes(app, jobs):
+    dead = jobs.enqueue('crop', {})
+    live = jobs.enqueue('crop', {})
+    jobs.claim_next()
+    jobs.claim_next()
+    with jobs._connect() as db:
+        # a pid no process can have
+        db.execute("UPDATE jobs SET pid = ? WHERE id = ?", (2 ** 22 + 12345, dead))
+
+    assert jobs.requeue_interrupted() == 1
+    assert jobs.get(dead)['status'] == 'queued'
+    assert jobs.get(dead)['pid'] is None
+    assert jobs.get(live)['status'] == 'running'
+
+
+def test_runner_records_failures(app, jobs, monkeypatch):
+    def execute(kind, params):
+        if params.get('bad'):
+            raise RuntimeError('boom')
+        return {'status': 'done', 'message': 'ok'}
+    monkeypatch.setattr(app, '_execute_job', execute)
+    ok = jobs.enqueue('crop', {})
+    bad = jobs.enqueue('crop', {'bad': True})
+
+    app.JobRunner(jobs).run_until_empty()
+
+    assert jobs.get(ok)['status'] == 'done'
+    assert (jobs.get(bad)['status'], jobs.get(bad)['message']) == ('failed', 'boom')
+
+
+@pytest.mark.parametrize('args', [['--enqueue', 'resize', 'source=/in'],
+                                  ['--enqueue', 'crop', 'priority=high'],
+                                  ['--cancel-job', 'seven']])
+def test_cli_rejects_bad_arguments(tmp_path, args):
+    # run a copy so the config folder it creates lands in tmp_path
+    for name in ('main.py', 'profile_editor.py'):
+        shutil.copy(os.path.join(SRC_DIR, name), tmp_path)
+    proc = subprocess.run([sys.executable, str(tmp_path / 'main.py'), *args],
+                          capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 2
+    assert 'usage:' in proc.stdout
@@ -0,0 +1,151 @@
+import json
+import os
+
+from PIL import Image
+
+
+def _touch(path, data=b'x'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _crash(journal):
+    """Leave the journal behind, as if the process died mid-run."""
+    journal.checkpoint()
+    journal._fh.close()
+    journal._fh = None
+
+
+def test_resume_finishes_planned_moves(app, tmp_path):
+    source = tmp_path / 'source'
+    archive = tmp_path / 'dest' / 'run'
+    a, b = str(source / 'a.jpg'), str(source / 'b.jpg')
+    _touch(a)
+    _touch(b)
+
+    journal = app._RunJournal('move')
+    journal.plan('mkdir', dst=str(archive))
+    os.makedirs(archive)
+    journal.done('mkdir', dst=str(archive))
+    for src in (a, b):
+        journal.plan('move', src=src, dst=str(archive / os.path.basename(src)))
+    os.replace(a, archive / 'a.jpg')
+    journal.done('move', src=a, dst=str(archive / 'a.jpg'))
+    _crash(journal)
+
+    assert app.find_interrupted_journals() == [journal.path]
+    summary = app.resume_journal(journal.path)
+
+    assert summary['moved'] == 1
+    assert sorted(os.listdir(archive)) == ['a.jpg', 'b.jpg']
+    assert not os.path.exists(b)
+    assert app.find_interrupted_journals() == []
+
+
+def test_rollback_undoes_only_what_the_run_did(app, tmp_path):
+    source = tmp_path / 'source'
+    archive = tmp_path / 'dest' / 'run'
+    original = str(source / 'a.jpg')
+    written = str(source / 'out_a.jpg')
+    leftover = str(source / 'out_b.jpg')
+    _touch(original)
+    _touch(leftover)  # an output from an earlier run, never rewritten by this one
+
+    journal = app._RunJournal('crop')
+    journal.plan('write', src=original, dst=written)
+    _touch(written)
+    journal.done('write', src=original, dst=written)
+    journal.plan('write', src=original, dst=leftover)
+    journal.plan('mkdir', dst=str(archive))
+    os.makedirs(archive)
+    journal.done('mkdir', dst=str(archive))
+    journal.plan('move', src=original, dst=str(archive / 'a.jpg'))
+    os.replace(original, archive / 'a.jpg')
+    # the 'done' for the move never reached the journal
+    _crash(journal)
+
+    summary = app.rollback_journal(journal.path)
+
+    assert summary == {'restored': 1, 'removed': 1, 'in_trash': 0}
+    assert os.path.isfile(original)
+    assert not os.path.exists(written)
+    assert os.path.isfile(leftover)
+    assert not os.path.exists(archive)
+    assert not os.path.exists(journal.path)
+
+
+def test_torn_last_line_is_ignored(app, tmp_path):
+    journal = app._RunJournal('crop')
+    journal.plan('write', src='a', dst='b')
+    _crash(journal)
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"event": "done", "op": "wr')
+    records = app._read_journal(journal.path)
+    assert [r['event'] for r in records] == ['begin', 'plan']
+
+
+def _crop_one(app, tmp_path, journal, rule=None):
+    src = tmp_path / 'in.jpg'
+    Image.new('RGB', (20, 10), 'red').save(src)
+    out_dir = tmp_path / 'out'
+    out_dir.mkdir(exist_ok=True)
+    rule = rule or {'crop': {'x1': 0, 'y1': 0, 'x2': 10, 'y2': 10}}
+    record = app._crop_application(1, 1, rule, [src], 'P', str(out_dir), 'strip', journal, {}, {})
+    return record, out_dir
+
+
+def test_failed_save_is_not_journaled_or_counted(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(app, '_save_image_preset', lambda *a, **k: None)
+    out_dir = tmp_path / 'out'
+    _touch(str(out_dir / 'P_a.jpg'))  # left over from an earlier run
+
+    journal = app._RunJournal('crop')
+    record, _ = _crop_one(app, tmp_path, journal)
+    _crash(journal)
+
+    assert record is None
+    events = [r['event'] for r in app._read_journal(journal.path)]
+    assert events == ['begin', 'plan']
+    app.rollback_journal(journal.path)
+    assert os.path.isfile(out_dir / 'P_a.jpg')
+
+
+def test_full_image_falls_back_to_copying_the_original(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(app, '_save_image_preset', lambda *a, **k: None)
+    journal = app._RunJournal('crop')
+    record, out_dir = _crop_one(app, tmp_path, journal, {'crop': {'x1': 0, 'y1': 0, 'x2': 20, 'y2': 10}})
+    journal.finish()
+
+    assert record['quality'] is None
+    assert record['bytes'] == os.path.getsize(tmp_path / 'in.jpg')
+    with open(out_dir / 'P_a.jpg', 'rb') as f, open(tmp_path / 'in.jpg', 'rb') as g:
+        assert f.read() == g.read()
+
+
+def test_successful_crop_is_journaled(app, tmp_path):
+    journal = app._RunJournal('crop')
+    record, out_dir = _crop_one(app, tmp_path, journal)
+    _crash(journal)
+
+    assert record['output'] == str(out_dir / 'P_a.jpg')
+    assert record['bytes'] == os.path.getsize(record['output'])
+    with open(journal.path, encoding='utf-8') as f:
+        done = [json.loads(line) for line in f if '"done"' in line]
+    assert [(r['op'], r['dst']) for r in done] == [('write', record['output'])]
+
+
+def test_failed_move_run_leaves_no_journal(app, tmp_path, monkeypatch):
+    source, dest = tmp_path / 'source', tmp_path / 'dest'
+    source.mkdir()
+    dest.mkdir()
+    _touch(str(source / 'a.jpg'))
+
+    def fail(*args, **kwargs):
+        raise OSError('disk full')
+    monkeypatch.setattr(app, '_move_files', fail)
+
+    result = app.run_move_job(str(source), 'Shirts', str(dest))
+
+    assert result['status'] == 'error' and 'disk full' in result['message']
+    assert app.find_interrupted_journals() == []
@@ -0,0 +1,40 @@
+import pytest
+from PIL import Image
+
+
+def _numbered_image(size):
+    """An image whose every pixel is distinct, so any misplaced crop shows up."""
+    w, h = size
+    img = Image.new('RGB', size)
+    img.putdata([(x, y, (x * 7 + y * 13) % 256) for y in range(h) for x in range(w)])
+    return img
+
+
+@pytest.mark.parametrize('orientation', range(1, 9))
+def test_map_box_to_raw_matches_full_transpose(main_module, orientation):
+    raw = _numbered_image((40, 24))
+    transpose = main_module._ORIENTATION_TRANSPOSE.get(orientation)
+    upright = raw.transpose(transpose) if transpose is not None else raw
+    assert upright.size == main_module._oriented_size(raw.size, orientation)
+
+    for box in [(0, 0, upright.width, upright.height), (3, 5, 17, 19), (1, 0, 2, 11)]:
+        expected = upright.crop(box)
+        got = main_module._crop_oriented(raw, box, orientation)
+        assert got.size == expected.size
+        assert got.tobytes() == expected.tobytes()
+
+
+def test_image_orientation_reads_exif(main_module):
+    img = Image.new('RGB', (4, 4))
+    assert main_module._image_orientation(img) == 1
+    img.getexif()[0x0112] = 6
+    assert main_module._image_orientation(img) == 6
+    img.getexif()[0x0112] = 42
+    assert main_module._image_orientation(img) == 1
+
+
+def test_helpers_are_shared_with_the_editor(main_module):
+    editor = main_module._profile_editor_module()
+    assert main_module._image_orientation is editor._image_orientation
+    assert main_module._ensure_heif_opener is editor._ensure_heif_opener
+    assert main_module._ORIENTATION_TRANSPOSE is editor._ORIENTATION_TRANSPOSE
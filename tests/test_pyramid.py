@@ -0,0 +1,79 @@
+import queue
+
+import pytest
+from PIL import Image
+
+
+@pytest.fixture
+def editor(main_module):
+    return main_module._profile_editor_module()
+
+
+@pytest.fixture(params=['JPEG', 'PNG'])
+def photo(request, tmp_path):
+    path = tmp_path / ('shot.jpg' if request.param == 'JPEG' else 'shot.png')
+    img = Image.new('RGB', (400, 240), 'white')
+    exif = img.getexif()
+    exif[0x0112] = 6  # stored sideways, shown upright as 240x400
+    img.save(path, format=request.param, exif=exif.tobytes())
+    return str(path)
+
+
+def test_levels_are_upright_and_halved(editor, photo):
+    pyramid = editor._ImagePyramid(photo, (240, 400))
+    assert pyramid.get(0) is None and pyramid.levels == {}  # nothing is read up front
+    assert pyramid.build(0).size == (240, 400)
+    assert pyramid.build(2).size == (60, 100)
+    assert pyramid.level_for(4.0) == 2
+    assert pyramid.level_for(1.5) == 0
+
+
+def test_only_the_shown_and_next_level_are_kept(editor, photo):
+    pyramid = editor._ImagePyramid(photo, (240, 400))
+    for k in (0, 1, 2, 3):
+        pyramid.build(k)
+    pyramid.keep(1)
+    assert sorted(pyramid.levels) == [1, 2]
+    assert pyramid.nearest(0) is pyramid.get(1)
+    pyramid.keep(None)
+    assert pyramid.levels == {} and pyramid.nearest(0) is None
+
+
+def test_loader_builds_levels_in_the_background(editor, photo):
+    loader = editor._PreviewLoader()
+    try:
+        pyramid = editor._ImagePyramid(photo, (240, 400))
+        loader.request_level(7, pyramid, 1)
+        generation, kind, path, payload, k = loader.results.get(timeout=10)
+        assert (generation, kind, path, payload, k) == (7, 'level', photo, pyramid, 1)
+        assert pyramid.get(1).size == (120, 200)
+        assert not loader.busy(7)
+    finally:
+        loader.close()
+
+
+def test_loader_reports_unreadable_levels_without_results(editor, tmp_path):
+    loader = editor._PreviewLoader()
+    try:
+        loader.request_level(1, editor._ImagePyramid(str(tmp_path / 'missing.jpg'), (10, 10)), 0)
+        loader.request(2, str(tmp_path / 'missing.jpg'), (100, 100))
+        kinds = [loader.results.get(timeout=10)[1]]
+        with pytest.raises(queue.Empty):
+            loader.results.get(timeout=0.5)
+        assert kinds == ['error']
+    finally:
+        loader.close()
+
+
+def test_placeholder_closes_the_source(editor, photo, monkeypatch):
+    opened = []
+    real_open = Image.open
+
+    def _open(*args, **kwargs):
+        opened.append(real_open(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(editor.Image, 'open', _open)
+    result = editor._load_placeholder_image(photo, (24, 40))
+    assert (result is None) == photo.endswith('.png')
+    assert opened and all(img.fp is None for img in opened)
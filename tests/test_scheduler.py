@@ -0,0 +1,48 @@
+import threading
+import time
+
+
+def test_jobs_take_turns_on_the_shared_pool(main_module):
+    scheduler = main_module._FairScheduler(workers=1)
+    order = []
+    started, release = threading.Event(), threading.Event()
+
+    def task(name, gate=False):
+        def run():
+            if gate:
+                started.set()
+                release.wait(5)
+            order.append(name)
+            return name
+        return run
+
+    big = [task('A0', gate=True)] + [task(f"A{i}") for i in range(1, 5)]
+    results = {}
+    t = threading.Thread(target=lambda: results.setdefault('A', scheduler.run('A', big)))
+    t.start()
+    assert started.wait(5)
+    # The small job arrives while the big one is running and is not queued behind it
+    small = threading.Thread(target=lambda: results.setdefault('B', scheduler.run('B', [task('B0'), task('B1')])))
+    small.start()
+    deadline = time.monotonic() + 5
+    while 'B' not in scheduler._queues and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    t.join(5)
+    small.join(5)
+
+    assert order == ['A0', 'A1', 'B0', 'A2', 'B1', 'A3', 'A4']
+    assert results == {'A': ['A0', 'A1', 'A2', 'A3', 'A4'], 'B': ['B0', 'B1']}
+
+
+def test_failed_task_yields_none_and_progress_counts_it(main_module):
+    scheduler = main_module._FairScheduler(workers=2)
+    seen = []
+
+    def boom():
+        raise RuntimeError('decode failed')
+
+    results = scheduler.run('job', [lambda: 1, boom, lambda: 3], progress=lambda done, total: seen.append((done, total)))
+
+    assert results == [1, None, 3]
+    assert sorted(seen) == [(1, 3), (2, 3), (3, 3)]
@@ -0,0 +1,71 @@
+import os
+import random
+from pathlib import Path
+
+from PIL import Image
+
+
+def _shots(folder: Path, names, start=1_000_000, step=1.0, mtimes=None):
+    """Small JPEGs with increasing mtimes (or the given ones), in `names` order."""
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    rng = random.Random(1)
+    for i, name in enumerate(names):
+        p = folder / name
+        noise = Image.new('L', (32, 32))
+        noise.putdata([rng.randrange(256) for _ in range(32 * 32)])
+        noise.convert('RGB').save(p)
+        t = mtimes[i] if mtimes else start + i * step
+        os.utime(p, (t, t))
+        paths.append(p)
+    return paths
+
+
+def _names(sets):
+    return [(name, [p.name for p in paths]) for name, paths in sets]
+
+
+def test_count_mode_uses_the_profile_positions(app, tmp_path):
+    paths = _shots(tmp_path, [f"{i}.jpg" for i in range(7)])
+    k = app._profile_set_size({1: [{}], 3: [{}]})
+    sets, separators = app._split_into_sets(str(tmp_path), paths, 'count', k)
+    assert k == 3
+    assert _names(sets) == [('Set 001', ['0.jpg', '1.jpg', '2.jpg']),
+                            ('Set 002', ['3.jpg', '4.jpg', '5.jpg']),
+                            ('Set 003', ['6.jpg'])]
+    assert separators == []
+
+
+def test_gap_mode_splits_on_long_pauses(app, tmp_path):
+    paths = _shots(tmp_path, ['a.jpg', 'b.jpg', 'c.jpg', 'd.jpg'], mtimes=[0, 10, 200, 230])
+    sets, _ = app._split_into_sets(str(tmp_path), paths, 'gap', 1, gap_seconds=60)
+    assert _names(sets) == [('Set 001', ['a.jpg', 'b.jpg']), ('Set 002', ['c.jpg', 'd.jpg'])]
+
+
+def test_separator_mode_drops_blank_frames(app, tmp_path):
+    paths = _shots(tmp_path, ['a.jpg', 'b.jpg', 'c.jpg', 'd.jpg'])
+    Image.new('RGB', (32, 32), (128, 128, 128)).save(paths[0])
+    Image.new('RGB', (32, 32), (20, 20, 20)).save(paths[2])
+
+    sets, separators = app._split_into_sets(str(tmp_path), paths, 'separator', 1)
+
+    assert _names(sets) == [('Set 001', ['b.jpg']), ('Set 002', ['d.jpg'])]
+    assert separators == [paths[0], paths[2]]
+
+
+def test_subfolders_mode_uses_natural_order(app, tmp_path):
+    _shots(tmp_path / 'shoot 10', ['x.jpg'])
+    _shots(tmp_path / 'shoot 2', ['y.jpg', 'z.jpg'])
+    (tmp_path / 'empty').mkdir()
+    (tmp_path / '.hidden').mkdir()
+    _shots(tmp_path / '.hidden', ['h.jpg'])
+
+    sets, _ = app._split_into_sets(str(tmp_path), [], 'subfolders', 1)
+
+    assert _names(sets) == [('shoot 2', ['y.jpg', 'z.jpg']), ('shoot 10', ['x.jpg'])]
+
+
+def test_off_mode_is_one_set(app, tmp_path):
+    paths = _shots(tmp_path, ['a.jpg', 'b.jpg'])
+    assert _names(app._split_into_sets(str(tmp_path), paths, 'off', 1)[0]) == [('Set 001', ['a.jpg', 'b.jpg'])]
+    assert app._split_into_sets(str(tmp_path), [], 'off', 1) == ([], [])
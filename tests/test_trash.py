@@ -0,0 +1,43 @@
+import os
+import types
+
+
+def test_partial_batch_failure_keeps_trashed_outcomes(app, tmp_path, monkeypatch):
+    paths = []
+    for name in ('a.jpg', 'b.jpg', 'c.jpg'):
+        p = tmp_path / name
+        p.write_bytes(b'x')
+        paths.append(str(p))
+    retried = []
+
+    def send2trash(target):
+        if isinstance(target, list):
+            os.remove(target[0])  # the batch trashed one file, then failed
+            raise OSError('batch failed')
+        retried.append(os.path.basename(target))
+        os.remove(target)
+
+    monkeypatch.setattr(app.sys, 'platform', 'darwin')
+    monkeypatch.setitem(app._lazy_modules, 'send2trash', types.SimpleNamespace(send2trash=send2trash))
+
+    outcomes = app._trash_batch(paths)
+
+    assert outcomes == {p: app.TRASH_TRASHED for p in paths}
+    assert sorted(retried) == ['b.jpg', 'c.jpg']
+    assert app._count_removed(outcomes) == 3
+
+
+def test_batch_failure_after_trashing_everything(app, tmp_path, monkeypatch):
+    paths = [str(tmp_path / 'a.jpg'), str(tmp_path / 'b.jpg')]
+    for p in paths:
+        open(p, 'wb').close()
+
+    def send2trash(target):
+        for p in target:
+            os.remove(p)
+        raise OSError('reported failure')
+
+    monkeypatch.setattr(app.sys, 'platform', 'win32')
+    monkeypatch.setitem(app._lazy_modules, 'send2trash', types.SimpleNamespace(send2trash=send2trash))
+
+    assert app._trash_batch(paths) == {p: app.TRASH_TRASHED for p in paths}